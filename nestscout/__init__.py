@@ -1,28 +1,60 @@
 """NestScout — AI-powered real estate intelligence platform."""
 
-from flask import Flask
+from typing import TYPE_CHECKING
 
-from nestscout.config import config_by_name
-from nestscout.extensions import db, migrate, jwt, ma, cors
+if TYPE_CHECKING:
+    from flask import Flask
 
+# Blueprint import paths ("module:attribute") and their URL prefixes.
+# Modules are only imported when the blueprints are actually registered.
+_BLUEPRINTS: tuple[tuple[str, str], ...] = (
+    ("nestscout.api.auth:auth_bp", "/api/auth"),
+    ("nestscout.api.properties:properties_bp", "/api/properties"),
+    ("nestscout.api.pois:pois_bp", "/api/pois"),
+    ("nestscout.api.profiles:profiles_bp", "/api/profiles"),
+    ("nestscout.api.scores:scores_bp", "/api/scores"),
+    ("nestscout.api.imports:import_bp", "/api/import"),
+    ("nestscout.api.ai:ai_bp", "/api/ai"),
+    ("nestscout.api.admin:admin_bp", "/api/admin"),
+)
 
-def create_app(config_name: str | None = None) -> Flask:
+# Instance folders already created in this process
+_INSTANCE_DIR_READY: set[str] = set()
+
+
+def create_app(config_name: str | None = None, register_api: bool = True) -> "Flask":
     """Application factory — creates and configures the Flask app.
 
     Args:
         config_name: One of 'development', 'production', 'testing'.
                      Falls back to NESTSCOUT_ENV env var, then 'development'.
+        register_api: Register the HTTP API blueprints. CLI commands pass
+                      False so the API modules are never imported.
     """
     import os
 
+    from flask import Flask
+
+    from nestscout.config import config_by_name
+    from nestscout.extensions import db, migrate, jwt, ma, cors
+
     if config_name is None:
         config_name = os.getenv("NESTSCOUT_ENV", "development")
 
+    from nestscout.utils.serialization import ORJSONProvider
+
     app = Flask(__name__, instance_relative_config=True)
+    app.json = ORJSONProvider(app)
     app.config.from_object(config_by_name[config_name])
 
-    # Ensure instance folder exists (SQLite lives here in dev)
-    os.makedirs(app.instance_path, exist_ok=True)
+    # Ensure instance folder exists (SQLite lives here in dev) — once per process,
+    # and not at all for in-memory databases
+    if (
+        app.instance_path not in _INSTANCE_DIR_READY
+        and app.config["SQLALCHEMY_DATABASE_URI"] != "sqlite:///:memory:"
+    ):
+        os.makedirs(app.instance_path, exist_ok=True)
+        _INSTANCE_DIR_READY.add(app.instance_path)
 
     # --- Extensions ---
     db.init_app(app)
@@ -32,7 +64,12 @@ def create_app(config_name: str | None = None) -> Flask:
     cors.init_app(app)
 
     # --- Blueprints ---
-    _register_blueprints(app)
+    if register_api:
+        _register_blueprints(app)
+
+        # Proximity endpoints shouldn't pay Numba's JIT on their first request
+        from nestscout.utils.geo import warm_up_kernels
+        warm_up_kernels()
 
     # --- Error handlers ---
     _register_error_handlers(app)
@@ -46,43 +83,41 @@ def create_app(config_name: str | None = None) -> Flask:
     return app
 
 
-def _register_blueprints(app: Flask) -> None:
+def _register_blueprints(app: "Flask") -> None:
     """Import and register all API blueprints."""
-    from nestscout.api.auth import auth_bp
-    from nestscout.api.properties import properties_bp
-    from nestscout.api.pois import pois_bp
-    from nestscout.api.profiles import profiles_bp
-    from nestscout.api.scores import scores_bp
-    from nestscout.api.imports import import_bp
-    from nestscout.api.ai import ai_bp
-    from nestscout.api.admin import admin_bp
-
-    app.register_blueprint(auth_bp, url_prefix="/api/auth")
-    app.register_blueprint(properties_bp, url_prefix="/api/properties")
-    app.register_blueprint(pois_bp, url_prefix="/api/pois")
-    app.register_blueprint(profiles_bp, url_prefix="/api/profiles")
-    app.register_blueprint(scores_bp, url_prefix="/api/scores")
-    app.register_blueprint(import_bp, url_prefix="/api/import")
-    app.register_blueprint(ai_bp, url_prefix="/api/ai")
-    app.register_blueprint(admin_bp, url_prefix="/api/admin")
-
-
-def _register_error_handlers(app: Flask) -> None:
+    from werkzeug.utils import import_string
+
+    for import_path, url_prefix in _BLUEPRINTS:
+        app.register_blueprint(import_string(import_path), url_prefix=url_prefix)
+
+
+# JSON error bodies, pre-encoded up to the message value.
+_ERROR_PREFIXES: dict[int, bytes] = {
+    400: b'{"error":"Bad request","message":',
+    404: b'{"error":"Not found","message":',
+    413: b'{"error":"Payload too large","message":',
+    422: b'{"error":"Unprocessable entity","message":',
+}
+_INTERNAL_ERROR_BODY = b'{"error":"Internal server error"}'
+
+
+def _register_error_handlers(app: "Flask") -> None:
     """Register JSON error handlers for common HTTP errors."""
-    from flask import jsonify
+    import orjson
+    from flask import Response
+
+    def _json_error(status: int):
+        prefix = _ERROR_PREFIXES[status]
 
-    @app.errorhandler(400)
-    def bad_request(e):
-        return jsonify({"error": "Bad request", "message": str(e)}), 400
+        def handler(e):
+            body = prefix + orjson.dumps(str(e)) + b"}"
+            return Response(body, status=status, mimetype="application/json")
 
-    @app.errorhandler(404)
-    def not_found(e):
-        return jsonify({"error": "Not found", "message": str(e)}), 404
+        return handler
 
-    @app.errorhandler(422)
-    def unprocessable(e):
-        return jsonify({"error": "Unprocessable entity", "message": str(e)}), 422
+    for status in _ERROR_PREFIXES:
+        app.register_error_handler(status, _json_error(status))
 
     @app.errorhandler(500)
     def internal_error(e):
-        return jsonify({"error": "Internal server error"}), 500
+        return Response(_INTERNAL_ERROR_BODY, status=500, mimetype="application/json")
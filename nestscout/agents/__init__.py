@@ -1 +1,27 @@
-"""LangChain AI agents package — supervisor + specialised sub-agents."""
+"""LangChain AI agents package — supervisor + specialised sub-agents.
+
+The public factories are resolved on first attribute access (PEP 562), so
+importing this package does not import LangChain.
+"""
+
+from importlib import import_module
+
+_LAZY_ATTRS: dict[str, str] = {
+    "get_llm": "nestscout.agents.config",
+    "create_supervisor": "nestscout.agents.supervisor",
+    "create_property_search_tool": "nestscout.agents.property_agent",
+    "create_poi_agent_tool": "nestscout.agents.poi_agent",
+    "create_price_agent_tool": "nestscout.agents.price_agent",
+    "create_import_agent_tool": "nestscout.agents.import_agent",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -1,25 +1,147 @@
 """LLM configuration — local-first, OpenAI-compatible."""
 
 import os
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-load_dotenv()
+from nestscout.config import load_env
+from nestscout.utils.cache import TTLCache, query_key
 
+if TYPE_CHECKING:
+    import httpx
+    from langchain.agents import AgentExecutor
+    from langchain_core.messages import SystemMessage
+    from langchain_openai import ChatOpenAI
 
-def get_llm(temperature: float = 0.0) -> ChatOpenAI:
+load_env()
+
+# Run tracing/callback handlers off the request path so they never delay streamed tokens
+os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
+
+_BASE_URL = os.getenv("LLM_BASE_URL", "http://localhost:11434/v1")
+_API_KEY = os.getenv("LLM_API_KEY", "ollama")
+_MODEL = os.getenv("LLM_MODEL", "llama3.2")
+_KEEP_ALIVE = os.getenv("LLM_KEEP_ALIVE", "30m")
+# Anthropic-style cache breakpoints, for Claude models behind an OpenAI-compatible proxy
+_CACHE_CONTROL = os.getenv("LLM_CACHE_CONTROL", "").lower() in ("1", "true", "yes")
+
+# Bump when the system prompts change so stale server-side prefixes are not reused
+_PROMPT_CACHE_VERSION = "v1"
+
+
+@lru_cache(maxsize=1)
+def _http_clients() -> tuple["httpx.Client", "httpx.AsyncClient"]:
+    """Return the process-wide (sync, async) HTTP clients used for LLM calls.
+
+    HTTP/2 is negotiated over TLS endpoints; plain-HTTP local servers fall
+    back to HTTP/1.1 keep-alive on the same pool.
+    """
+    import httpx
+
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    timeout = httpx.Timeout(120.0, connect=5.0)
+    return (
+        httpx.Client(http2=True, limits=limits, timeout=timeout),
+        httpx.AsyncClient(http2=True, limits=limits, timeout=timeout),
+    )
+
+
+def _prompt_cache_body(agent_name: str) -> dict:
+    """Request-body hints that let the server reuse the agent's prompt prefix.
+
+    ``prompt_cache_key`` routes OpenAI requests to a warm prefix cache;
+    ``cache_prompt`` (llama.cpp) and ``keep_alive`` (Ollama) keep the model and
+    its KV cache resident between calls. vLLM needs ``--enable-prefix-caching``
+    on the server side instead.
+    """
+    body = {"prompt_cache_key": f"nestscout-{agent_name}-{_PROMPT_CACHE_VERSION}"}
+    if "api.openai.com" not in _BASE_URL:
+        body["cache_prompt"] = True
+        body["keep_alive"] = _KEEP_ALIVE
+    return body
+
+
+def cached_system_message(text: str) -> "SystemMessage":
+    """Wrap a static system prompt as a literal message for use in a prompt template.
+
+    A literal message is sent byte-for-byte (no template formatting), keeping
+    it a stable prefix for automatic prompt caching. With ``LLM_CACHE_CONTROL``
+    set, it also carries an ephemeral ``cache_control`` breakpoint.
+    """
+    from langchain_core.messages import SystemMessage
+
+    if not _CACHE_CONTROL:
+        return SystemMessage(content=text)
+    return SystemMessage(content=[
+        {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}},
+    ])
+
+
+@lru_cache(maxsize=8)
+def get_llm(temperature: float = 0.0, agent_name: str | None = None) -> "ChatOpenAI":
     """Return an LLM instance configured from environment variables.
 
     Defaults to local inference (Ollama / LM Studio) if no env vars are set.
+    Instances are cached per (temperature, agent_name), and all of them share
+    a single HTTP connection pool per process. Passing ``agent_name`` tags
+    requests so the server can reuse that agent's system-prompt prefix.
     """
-    base_url = os.getenv("LLM_BASE_URL", "http://localhost:11434/v1")
-    api_key = os.getenv("LLM_API_KEY", "ollama")
-    model_name = os.getenv("LLM_MODEL", "llama3.2")
+    from langchain_openai import ChatOpenAI
+
+    http_client, http_async_client = _http_clients()
 
     return ChatOpenAI(
-        base_url=base_url,
-        api_key=api_key,
-        model=model_name,
+        base_url=_BASE_URL,
+        api_key=_API_KEY,
+        model=_MODEL,
         temperature=temperature,
         streaming=True,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        extra_body=_prompt_cache_body(agent_name) if agent_name else None,
     )
+
+
+# AgentExecutor's output when it hits max_iterations/max_execution_time ("force" stopping)
+_AGENT_STOPPED = "Agent stopped due to iteration limit or time limit."
+
+
+def agent_runners(
+    executor: "AgentExecutor", error_prefix: str, cache: TTLCache | None = None,
+) -> tuple[Callable[[str], str], Callable[[str], Awaitable[str]]]:
+    """(sync, async) Tool functions that run a sub-agent on a query.
+
+    Failures are returned as ``"<error_prefix>: <error>"`` rather than raised.
+    With ``cache``, completed answers are stored by normalised query and
+    repeats skip the agent entirely; errors and runs the executor cut short
+    are never cached.
+    """
+
+    def store(key: str, output: str) -> None:
+        if cache is not None and output and output != _AGENT_STOPPED:
+            cache.set(key, output)
+
+    def run_agent(query: str) -> str:
+        key = query_key(query)
+        if cache is not None and (cached := cache.get(key)) is not None:
+            return cached
+        try:
+            output = executor.invoke({"input": query})["output"]
+        except Exception as e:
+            return f"{error_prefix}: {str(e)}"
+        store(key, output)
+        return output
+
+    async def arun_agent(query: str) -> str:
+        key = query_key(query)
+        if cache is not None and (cached := cache.get(key)) is not None:
+            return cached
+        try:
+            output = (await executor.ainvoke({"input": query}))["output"]
+        except Exception as e:
+            return f"{error_prefix}: {str(e)}"
+        store(key, output)
+        return output
+
+    return run_agent, arun_agent
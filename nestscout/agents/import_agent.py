@@ -1,11 +1,13 @@
 """Import sub-agent — AI-powered data extraction from text and URLs."""
 
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
-from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import Tool, tool
 
-from nestscout.agents.config import get_llm
+from nestscout.agents.config import agent_runners, get_llm
+from nestscout.utils.db import own_session
 
 # ── System Prompt ──────────────────────────────────────────────────────────────
 IMPORT_AGENT_SYSTEM_PROMPT = """\
@@ -39,12 +41,16 @@ PARSING RULES:
   concatenate street + number + city
 - MULTI-LISTING: If the text contains MULTIPLE properties, extract each separately
 
+WORKFLOW:
+The listing text is in the user message — extract from it directly, then call \
+create_property once per extracted listing to save it.
+
 RESPONSE FORMAT:
 Return a JSON object (or array for multiple listings) with the extracted fields. \
 Use null for fields you cannot confidently extract. Never fabricate data.
 
 Example output:
-{
+{{
   "title": "Sunny 3-bed apartment in Eixample",
   "price": 285000,
   "currency": "EUR",
@@ -56,7 +62,7 @@ Example output:
   "city": "Barcelona",
   "postal_code": "08036",
   "description": "Beautiful renovated apartment..."
-}
+}}
 
 CONSTRAINTS:
 - NEVER invent data points — only extract what's explicitly in the text
@@ -65,35 +71,45 @@ CONSTRAINTS:
 - Flag if listing appears to be a scam (unrealistically low price)
 """
 
+_IMPORT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", IMPORT_AGENT_SYSTEM_PROMPT),
+    ("user", "Extract property data from this listing text:\n\n{input}"),
+    ("placeholder", "{agent_scratchpad}"),
+])
 
-# ── Tools ──────────────────────────────────────────────────────────────────────
-@tool
-def parse_listing_text(raw_text: str) -> str:
-    """Parse raw text and extract structured property data.
-
-    This tool uses the LLM's understanding to extract fields from
-    unstructured listing text.
 
-    Args:
-        raw_text: The raw listing text to parse.
-    """
-    # The extraction happens via the agent's LLM reasoning — this tool
-    # simply returns the text for the agent to process
-    return f"Please extract property data from this text:\n\n{raw_text}"
+# ── Tools ──────────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=1)
+def _property_schema():
+    """Shared PropertyCreateSchema — built on first use, not per tool call."""
+    from nestscout.schemas.property import PropertyCreateSchema
+    return PropertyCreateSchema()
 
 
 @tool
+@own_session
 def create_property(property_json: str) -> str:
     """Save an extracted property to the database.
 
     Args:
         property_json: JSON string with property fields.
     """
+    from marshmallow import ValidationError
     from nestscout.services.property_service import PropertyService
-    import json
+    import orjson
+
+    try:
+        raw = orjson.loads(property_json)
+        if not isinstance(raw, dict):
+            return "Failed to create property: expected a single JSON object"
+        # The prompt asks for null on unknown fields — drop them so defaults apply
+        data = _property_schema().load({k: v for k, v in raw.items() if v is not None})
+    except orjson.JSONDecodeError as e:
+        return f"Failed to create property: invalid JSON ({e})"
+    except ValidationError as e:
+        return f"Failed to create property: {e.messages}"
 
     try:
-        data = json.loads(property_json)
         prop = PropertyService.create(data)
         return f"Property created successfully with ID {prop.id}: {prop.title}"
     except Exception as e:
@@ -108,30 +124,23 @@ class ImportAgentInput(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
 def create_import_agent_tool() -> Tool:
     """Create the Import sub-agent wrapped as a LangChain Tool."""
-    llm = get_llm(temperature=0)
-    tools = [parse_listing_text, create_property]
+    from langchain.agents import AgentExecutor, create_tool_calling_agent
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", IMPORT_AGENT_SYSTEM_PROMPT),
-        ("user", "{input}"),
-        ("placeholder", "{agent_scratchpad}"),
-    ])
+    llm = get_llm(temperature=0, agent_name="import")
+    tools = [create_property]
 
-    agent = create_tool_calling_agent(llm, tools, prompt)
+    agent = create_tool_calling_agent(llm, tools, _IMPORT_PROMPT)
     executor = AgentExecutor(agent=agent, tools=tools, verbose=False, max_iterations=5)
 
-    def run_agent(raw_listing_text: str) -> str:
-        try:
-            result = executor.invoke({"input": raw_listing_text})
-            return result["output"]
-        except Exception as e:
-            return f"Import extraction failed: {str(e)}"
+    run_agent, arun_agent = agent_runners(executor, "Import extraction failed")
 
     return Tool(
         name="import_specialist",
         func=run_agent,
+        coroutine=arun_agent,
         description=(
             "Use this tool when the user pastes raw listing text or wants to import "
             "a property from unstructured data. Extracts title, price, bedrooms, area, "
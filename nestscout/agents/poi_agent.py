@@ -1,11 +1,19 @@
 """POI / Area sub-agent — neighbourhood expertise and location intelligence."""
 
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
-from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import Tool, tool
 
-from nestscout.agents.config import get_llm
+from nestscout.agents.config import agent_runners, get_llm
+from nestscout.utils.cache import data_cache
+from nestscout.utils.db import own_session
+from nestscout.utils.serialization import to_json
+
+# Answers stay valid for an hour, or until properties or POIs are written
+_response_cache = data_cache(maxsize=256, ttl=3600)
+_tool_cache = data_cache(maxsize=1024, ttl=3600)
 
 # ── System Prompt ──────────────────────────────────────────────────────────────
 POI_AGENT_SYSTEM_PROMPT = """\
@@ -46,9 +54,16 @@ CONSTRAINTS:
 - Always clarify the search radius used
 """
 
+_POI_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", POI_AGENT_SYSTEM_PROMPT),
+    ("user", "{input}"),
+    ("placeholder", "{agent_scratchpad}"),
+])
+
 
 # ── Tools ──────────────────────────────────────────────────────────────────────
 @tool
+@own_session
 def search_pois(
     latitude: float,
     longitude: float,
@@ -64,14 +79,23 @@ def search_pois(
         category_id: Filter by category ID (0 = all categories).
     """
     from nestscout.services.poi_service import POIService
-    import json
+
+    key = ("search_pois", round(latitude, 4), round(longitude, 4), radius_m, category_id)
+    cached = _tool_cache.get(key)
+    if cached is not None:
+        return cached
 
     cat_id = category_id if category_id > 0 else None
-    results = POIService.find_nearby(latitude, longitude, radius_m=radius_m, category_id=cat_id)
-    return json.dumps(results[:20], indent=2, default=str)  # Limit to 20 results
+    results = POIService.find_nearby(
+        latitude, longitude, radius_m=radius_m, category_id=cat_id, limit=20,
+    )
+    output = to_json(results)
+    _tool_cache.set(key, output)
+    return output
 
 
 @tool
+@own_session
 def get_area_stats(latitude: float, longitude: float, radius_m: float = 1000.0) -> str:
     """Get a statistical summary of POIs around a location.
 
@@ -83,31 +107,21 @@ def get_area_stats(latitude: float, longitude: float, radius_m: float = 1000.0)
         radius_m: Analysis radius in metres.
     """
     from nestscout.services.poi_service import POIService
-    import json
 
-    results = POIService.find_nearby(latitude, longitude, radius_m=radius_m)
-
-    # Aggregate by category
-    stats: dict = {}
-    for poi in results:
-        cat = poi.get("category_name", "Unknown")
-        if cat not in stats:
-            stats[cat] = {"count": 0, "distances": [], "avg_distance": 0}
-        stats[cat]["count"] += 1
-        stats[cat]["distances"].append(poi["distance_m"])
-
-    for cat, data in stats.items():
-        data["avg_distance"] = round(sum(data["distances"]) / len(data["distances"]), 1)
-        data["nearest"] = round(min(data["distances"]), 1)
-        del data["distances"]
+    key = ("get_area_stats", round(latitude, 4), round(longitude, 4), radius_m)
+    cached = _tool_cache.get(key)
+    if cached is not None:
+        return cached
 
+    stats = POIService.area_stats(latitude, longitude, radius_m=radius_m)
     summary = {
         "center": {"lat": latitude, "lng": longitude},
         "radius_m": radius_m,
-        "total_pois": len(results),
-        "categories": stats,
+        **stats,
     }
-    return json.dumps(summary, indent=2, default=str)
+    output = to_json(summary)
+    _tool_cache.set(key, output)
+    return output
 
 
 # ── Agent Creation ─────────────────────────────────────────────────────────────
@@ -118,30 +132,23 @@ class POIAgentInput(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
 def create_poi_agent_tool() -> Tool:
     """Create the POI/Area sub-agent wrapped as a LangChain Tool."""
-    llm = get_llm(temperature=0.1)
-    tools = [search_pois, get_area_stats]
+    from langchain.agents import AgentExecutor, create_tool_calling_agent
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", POI_AGENT_SYSTEM_PROMPT),
-        ("user", "{input}"),
-        ("placeholder", "{agent_scratchpad}"),
-    ])
+    llm = get_llm(temperature=0.1, agent_name="poi")
+    tools = [search_pois, get_area_stats]
 
-    agent = create_tool_calling_agent(llm, tools, prompt)
+    agent = create_tool_calling_agent(llm, tools, _POI_PROMPT)
     executor = AgentExecutor(agent=agent, tools=tools, verbose=False, max_iterations=5)
 
-    def run_agent(natural_language_query: str) -> str:
-        try:
-            result = executor.invoke({"input": natural_language_query})
-            return result["output"]
-        except Exception as e:
-            return f"POI/Area analysis failed: {str(e)}"
+    run_agent, arun_agent = agent_runners(executor, "POI/Area analysis failed", _response_cache)
 
     return Tool(
         name="neighbourhood_expert",
         func=run_agent,
+        coroutine=arun_agent,
         description=(
             "Use this tool when the user asks about neighbourhoods, nearby amenities, "
             "walkability, area character, or what services are near a property. "
@@ -1,11 +1,18 @@
 """Price Prediction sub-agent — real estate valuation analysis."""
 
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
-from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import Tool, tool
 
-from nestscout.agents.config import get_llm
+from nestscout.agents.config import agent_runners, get_llm
+from nestscout.utils.cache import data_cache
+from nestscout.utils.db import own_session
+from nestscout.utils.serialization import to_json
+
+# Comparable pools move slowly; cache answers for an hour, or until listings change
+_response_cache = data_cache(maxsize=256, ttl=3600)
 
 # ── System Prompt ──────────────────────────────────────────────────────────────
 PRICE_AGENT_SYSTEM_PROMPT = """\
@@ -46,9 +53,27 @@ CONSTRAINTS:
 - Prices must always include the currency
 """
 
+_PRICE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", PRICE_AGENT_SYSTEM_PROMPT),
+    ("user", "{input}"),
+    ("placeholder", "{agent_scratchpad}"),
+])
+
 
 # ── Tools ──────────────────────────────────────────────────────────────────────
+def _comparable_filters(area_m2: float, bedrooms: int) -> dict:
+    """Build the ±30% area / ±1 bedroom window used to pick comparables."""
+    filters: dict = {}
+    if area_m2 > 0:
+        filters["area_m2"] = area_m2
+        filters["area_range"] = (area_m2 * 0.7, area_m2 * 1.3)
+    if bedrooms > 0:
+        filters["bedroom_range"] = (max(bedrooms - 1, 0), bedrooms + 1)
+    return filters
+
+
 @tool
+@own_session
 def predict_price(
     city: str,
     area_m2: float,
@@ -64,48 +89,41 @@ def predict_price(
         operation: 'sale' or 'rent'.
     """
     from nestscout.services.property_service import PropertyService
-    import json
-
-    # Find comparable properties
-    kwargs = {"city": city, "operation": operation, "per_page": 50}
-    if bedrooms > 0:
-        kwargs["min_bedrooms"] = max(bedrooms - 1, 0)
-        kwargs["max_bedrooms"] = bedrooms + 1
-    if area_m2 > 0:
-        kwargs["min_area"] = area_m2 * 0.7
-        kwargs["max_area"] = area_m2 * 1.3
+    import numpy as np
 
-    result = PropertyService.list_properties(**kwargs)
-    items = result["items"]
+    comps = PropertyService.sample_comparables(city, operation, **_comparable_filters(area_m2, bedrooms))
 
-    if not items:
-        return json.dumps({"error": "No comparable properties found", "confidence": "none"})
+    if not comps:
+        return to_json({"error": "No comparable properties found", "confidence": "none"})
 
-    prices_per_m2 = [
-        p["price"] / p["area_m2"]
-        for p in items
-        if p.get("price") and p.get("area_m2") and p["area_m2"] > 0
-    ]
+    prices_per_m2 = np.fromiter(
+        (float(p.price) / p.area_m2 for p in comps), dtype=np.float64, count=len(comps),
+    )
 
-    if not prices_per_m2:
-        return json.dumps({"error": "No properties with price and area data", "confidence": "none"})
+    # With enough comps, average the inter-quartile range to drop outliers
+    trimmed = prices_per_m2
+    if prices_per_m2.size >= 5:
+        q1, q3 = np.percentile(prices_per_m2, [25, 75])
+        trimmed = prices_per_m2[(prices_per_m2 >= q1) & (prices_per_m2 <= q3)]
 
-    avg_price_m2 = sum(prices_per_m2) / len(prices_per_m2)
+    avg_price_m2 = float(trimmed.mean())
     estimated_price = avg_price_m2 * area_m2
 
-    confidence = "high" if len(prices_per_m2) >= 5 else "medium" if len(prices_per_m2) >= 3 else "low"
+    comp_count = int(prices_per_m2.size)
+    confidence = "high" if comp_count >= 5 else "medium" if comp_count >= 3 else "low"
 
-    return json.dumps({
+    return to_json({
         "estimated_price": round(estimated_price, 2),
         "price_range_low": round(estimated_price * 0.9, 2),
         "price_range_high": round(estimated_price * 1.1, 2),
         "avg_price_per_m2": round(avg_price_m2, 2),
-        "comparable_count": len(prices_per_m2),
+        "comparable_count": comp_count,
         "confidence": confidence,
-    }, indent=2)
+    })
 
 
 @tool
+@own_session
 def get_comparables(
     city: str,
     area_m2: float,
@@ -123,33 +141,24 @@ def get_comparables(
         limit: Maximum number of comparables to return.
     """
     from nestscout.services.property_service import PropertyService
-    import json
-
-    kwargs = {"city": city, "operation": operation, "per_page": limit}
-    if bedrooms > 0:
-        kwargs["min_bedrooms"] = max(bedrooms - 1, 0)
-        kwargs["max_bedrooms"] = bedrooms + 1
-    if area_m2 > 0:
-        kwargs["min_area"] = area_m2 * 0.7
-        kwargs["max_area"] = area_m2 * 1.3
 
-    result = PropertyService.list_properties(**kwargs)
     comps = []
-    for p in result["items"][:limit]:
-        comp = {
-            "id": p["id"],
-            "title": p["title"],
-            "price": p["price"],
-            "area_m2": p["area_m2"],
-            "bedrooms": p["bedrooms"],
-            "city": p["city"],
-            "address": p["address"],
-        }
-        if p.get("price") and p.get("area_m2") and p["area_m2"] > 0:
-            comp["price_per_m2"] = round(p["price"] / p["area_m2"], 2)
-        comps.append(comp)
-
-    return json.dumps(comps, indent=2, default=str)
+    for prop in PropertyService.sample_comparables(
+        city, operation, limit=limit, **_comparable_filters(area_m2, bedrooms),
+    ):
+        price = float(prop.price)
+        comps.append({
+            "id": prop.id,
+            "title": prop.title,
+            "price": price,
+            "area_m2": prop.area_m2,
+            "bedrooms": prop.bedrooms,
+            "city": prop.city,
+            "address": prop.address,
+            "price_per_m2": round(price / prop.area_m2, 2),
+        })
+
+    return to_json(comps)
 
 
 # ── Agent Creation ─────────────────────────────────────────────────────────────
@@ -160,30 +169,23 @@ class PriceAgentInput(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
 def create_price_agent_tool() -> Tool:
     """Create the Price Prediction sub-agent wrapped as a LangChain Tool."""
-    llm = get_llm(temperature=0)
-    tools = [predict_price, get_comparables]
+    from langchain.agents import AgentExecutor, create_tool_calling_agent
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", PRICE_AGENT_SYSTEM_PROMPT),
-        ("user", "{input}"),
-        ("placeholder", "{agent_scratchpad}"),
-    ])
+    llm = get_llm(temperature=0, agent_name="price")
+    tools = [predict_price, get_comparables]
 
-    agent = create_tool_calling_agent(llm, tools, prompt)
+    agent = create_tool_calling_agent(llm, tools, _PRICE_PROMPT)
     executor = AgentExecutor(agent=agent, tools=tools, verbose=False, max_iterations=5)
 
-    def run_agent(natural_language_query: str) -> str:
-        try:
-            result = executor.invoke({"input": natural_language_query})
-            return result["output"]
-        except Exception as e:
-            return f"Price analysis failed: {str(e)}"
+    run_agent, arun_agent = agent_runners(executor, "Price analysis failed", _response_cache)
 
     return Tool(
         name="price_analyst",
         func=run_agent,
+        coroutine=arun_agent,
         description=(
             "Use this tool when the user asks about property prices, valuations, "
             "fair market value, deals, or investment potential. "
@@ -1,11 +1,19 @@
 """Property Search sub-agent — converts NL queries to structured property search."""
 
+from functools import lru_cache
+
 from pydantic import BaseModel, Field
-from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.tools import Tool, tool
 
-from nestscout.agents.config import get_llm
+from nestscout.agents.config import agent_runners, get_llm
+from nestscout.utils.cache import data_cache
+from nestscout.utils.db import own_session
+from nestscout.utils.serialization import to_json
+
+# Listings change more often than POIs/prices — keep search answers briefly,
+# and drop them as soon as listings are written
+_response_cache = data_cache(maxsize=256, ttl=300)
 
 # ── System Prompt ──────────────────────────────────────────────────────────────
 PROPERTY_SEARCH_SYSTEM_PROMPT = """\
@@ -42,9 +50,16 @@ CONSTRAINTS:
   "big" → higher area_m2, "family" → 3+ bedrooms
 """
 
+_PROPERTY_SEARCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", PROPERTY_SEARCH_SYSTEM_PROMPT),
+    ("user", "{input}"),
+    ("placeholder", "{agent_scratchpad}"),
+])
+
 
 # ── Tools ──────────────────────────────────────────────────────────────────────
 @tool
+@own_session
 def search_properties(
     city: str = "",
     operation: str = "sale",
@@ -68,31 +83,26 @@ def search_properties(
         max_area: Maximum area in m² (0 = no limit).
     """
     from nestscout.services.property_service import PropertyService
-    import json
-
-    kwargs = {"page": 1, "per_page": 10}
-    if city:
-        kwargs["city"] = city
-    if operation:
-        kwargs["operation"] = operation
-    if min_price > 0:
-        kwargs["min_price"] = min_price
-    if max_price > 0:
-        kwargs["max_price"] = max_price
-    if min_bedrooms > 0:
-        kwargs["min_bedrooms"] = min_bedrooms
-    if max_bedrooms > 0:
-        kwargs["max_bedrooms"] = max_bedrooms
-    if min_area > 0:
-        kwargs["min_area"] = min_area
-    if max_area > 0:
-        kwargs["max_area"] = max_area
+
+    # Zero / empty values mean "no filter"
+    bounds = {
+        "min_price": min_price, "max_price": max_price,
+        "min_bedrooms": min_bedrooms, "max_bedrooms": max_bedrooms,
+        "min_area": min_area, "max_area": max_area,
+    }
+    kwargs = {
+        "page": 1,
+        "per_page": 10,
+        **{k: v for k, v in (("city", city), ("operation", operation)) if v},
+        **{k: v for k, v in bounds.items() if v > 0},
+    }
 
     result = PropertyService.list_properties(**kwargs)
-    return json.dumps(result, indent=2, default=str)
+    return to_json(result)
 
 
 @tool
+@own_session
 def get_property_details(property_id: int) -> str:
     """Get full details of a specific property by its ID.
 
@@ -100,12 +110,11 @@ def get_property_details(property_id: int) -> str:
         property_id: The unique property identifier.
     """
     from nestscout.services.property_service import PropertyService
-    import json
 
     prop = PropertyService.get_by_id(property_id)
     if not prop:
         return f"Property with ID {property_id} not found."
-    return json.dumps(prop.to_dict(include_images=True), indent=2, default=str)
+    return to_json(prop.to_dict(include_images=True))
 
 
 # ── Agent Creation ─────────────────────────────────────────────────────────────
@@ -116,30 +125,23 @@ class PropertySearchInput(BaseModel):
     )
 
 
+@lru_cache(maxsize=1)
 def create_property_search_tool() -> Tool:
     """Create the Property Search sub-agent wrapped as a LangChain Tool."""
-    llm = get_llm(temperature=0)
-    tools = [search_properties, get_property_details]
+    from langchain.agents import AgentExecutor, create_tool_calling_agent
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", PROPERTY_SEARCH_SYSTEM_PROMPT),
-        ("user", "{input}"),
-        ("placeholder", "{agent_scratchpad}"),
-    ])
+    llm = get_llm(temperature=0, agent_name="property_search")
+    tools = [search_properties, get_property_details]
 
-    agent = create_tool_calling_agent(llm, tools, prompt)
+    agent = create_tool_calling_agent(llm, tools, _PROPERTY_SEARCH_PROMPT)
     executor = AgentExecutor(agent=agent, tools=tools, verbose=False, max_iterations=5)
 
-    def run_agent(natural_language_query: str) -> str:
-        try:
-            result = executor.invoke({"input": natural_language_query})
-            return result["output"]
-        except Exception as e:
-            return f"Property search failed: {str(e)}"
+    run_agent, arun_agent = agent_runners(executor, "Property search failed", _response_cache)
 
     return Tool(
         name="property_search_specialist",
         func=run_agent,
+        coroutine=arun_agent,
         description=(
             "Use this tool when the user wants to find, search, or browse properties. "
             "Handles queries like 'find apartments in Madrid under 300k' or "
@@ -0,0 +1,31 @@
+"""Supervisor route cache — remembers which specialist answered a query.
+
+When a repeat query comes in, the remembered specialist is called directly
+and the supervisor's routing LLM turn is skipped.
+"""
+
+from collections.abc import Iterable
+
+from nestscout.utils.cache import TTLCache, query_key
+
+# Specialists with side effects must always go through the supervisor;
+# "_Exception" marks a turn where the executor had to recover from bad LLM output
+_UNCACHEABLE = frozenset({"import_specialist", "_Exception"})
+
+_routes = TTLCache(maxsize=2048, ttl=3600)
+
+
+def lookup_route(query: str) -> str | None:
+    """Return the specialist tool name previously chosen for ``query``, if any."""
+    return _routes.get(query_key(query))
+
+
+def remember_route(query: str, tools_used: Iterable[str]) -> None:
+    """Record the route taken for ``query`` from the specialist tool names it used.
+
+    Only single-specialist answers are cached; greetings (no tool) and
+    multi-domain queries keep going through the supervisor.
+    """
+    tools = set(tools_used)
+    if len(tools) == 1 and not tools & _UNCACHEABLE:
+        _routes.set(query_key(query), tools.pop())
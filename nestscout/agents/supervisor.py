@@ -1,13 +1,15 @@
 """Supervisor agent — routes user queries to specialised sub-agents."""
 
-from langchain.agents import AgentExecutor, create_tool_calling_agent
-from langchain_core.prompts import ChatPromptTemplate
+from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
 
-from nestscout.agents.config import get_llm
-from nestscout.agents.property_agent import create_property_search_tool
-from nestscout.agents.poi_agent import create_poi_agent_tool
-from nestscout.agents.price_agent import create_price_agent_tool
-from nestscout.agents.import_agent import create_import_agent_tool
+from pydantic import BaseModel, Field
+
+from nestscout.agents.config import cached_system_message, get_llm
+
+if TYPE_CHECKING:
+    from langchain.agents import AgentExecutor
+    from langchain_core.runnables import Runnable
 
 # ── System Prompt ──────────────────────────────────────────────────────────────
 SUPERVISOR_SYSTEM_PROMPT = """\
@@ -43,7 +45,8 @@ AVAILABLE SPECIALISTS:
 
 ROUTING RULES:
 - For EACH user message, determine the primary intent and delegate to ONE specialist
-- If a query spans multiple domains, break it into sub-queries and call specialists sequentially
+- If a query spans multiple domains, break it into independent sub-queries and call all the \
+  needed specialists in the same turn — they run in parallel
 - If the query is a general greeting or off-topic, respond directly with a brief, friendly message
 - NEVER try to answer domain-specific questions yourself — always delegate
 - After receiving a specialist's response, format it clearly for the user
@@ -56,9 +59,30 @@ RESPONSE STYLE:
 """
 
 
-def create_supervisor() -> AgentExecutor:
-    """Create the supervisor agent with all sub-agents as tools."""
-    llm = get_llm(temperature=0.1)
+@lru_cache(maxsize=1)
+def create_supervisor() -> "AgentExecutor":
+    """Create the supervisor agent with all sub-agents as tools.
+
+    Run it through ``ainvoke``/``astream_events``: the async executor runs all
+    tool calls from a single LLM turn concurrently.
+    """
+    # LangChain and the sub-agents are only imported once a supervisor is needed
+    from langchain.agents import AgentExecutor, create_tool_calling_agent
+    from langchain_core.prompts import ChatPromptTemplate
+
+    from nestscout.agents.import_agent import create_import_agent_tool
+    from nestscout.agents.poi_agent import create_poi_agent_tool
+    from nestscout.agents.price_agent import create_price_agent_tool
+    from nestscout.agents.property_agent import create_property_search_tool
+
+    # Static system prompt first, dynamic input after it, so the prefix stays cacheable
+    prompt = ChatPromptTemplate.from_messages([
+        cached_system_message(SUPERVISOR_SYSTEM_PROMPT),
+        ("user", "{input}"),
+        ("placeholder", "{agent_scratchpad}"),
+    ])
+
+    llm = get_llm(temperature=0.1, agent_name="supervisor")
 
     tools = [
         create_property_search_tool(),
@@ -67,18 +91,60 @@ def create_supervisor() -> AgentExecutor:
         create_import_agent_tool(),
     ]
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", SUPERVISOR_SYSTEM_PROMPT),
-        ("user", "{input}"),
-        ("placeholder", "{agent_scratchpad}"),
-    ])
-
     agent = create_tool_calling_agent(llm, tools, prompt)
 
     return AgentExecutor(
         agent=agent,
         tools=tools,
-        verbose=True,
-        max_iterations=10,
+        verbose=False,
+        max_iterations=3,
         handle_parsing_errors=True,
+        return_intermediate_steps=True,  # read by the route cache
     )
+
+
+# ── Single-shot Router ─────────────────────────────────────────────────────────
+ROUTER_SYSTEM_PROMPT = """\
+You route questions for NestScout, a real estate platform, to ONE specialist.
+
+- property: find, search, browse or filter property listings
+- poi: nearby amenities, neighbourhood character, walkability
+- price: pricing, valuation, deals, investment potential
+- import: the user pasted raw listing text to extract and save
+- direct: greetings or off-topic chat — put a brief, friendly answer in `reply`
+- multi: the question needs MORE than one specialist
+
+For a single specialist, rewrite the question as a self-contained `sub_query`.
+"""
+
+# Router choice → specialist tool name
+ROUTE_TOOLS: dict[str, str] = {
+    "property": "property_search_specialist",
+    "poi": "neighbourhood_expert",
+    "price": "price_analyst",
+    "import": "import_specialist",
+}
+
+
+class RouteDecision(BaseModel):
+    """Structured routing decision returned by the single-shot router."""
+    agent: Literal["property", "poi", "price", "import", "direct", "multi"]
+    sub_query: str = Field(default="", description="Self-contained query for the specialist.")
+    reply: str = Field(default="", description="Answer for 'direct' messages only.")
+
+
+@lru_cache(maxsize=1)
+def create_router() -> "Runnable":
+    """Create a one-call router that picks a specialist via structured output.
+
+    Single-domain questions skip the supervisor's reasoning loop entirely;
+    ``multi`` decisions fall back to :func:`create_supervisor`.
+    """
+    from langchain_core.prompts import ChatPromptTemplate
+
+    prompt = ChatPromptTemplate.from_messages([
+        cached_system_message(ROUTER_SYSTEM_PROMPT),
+        ("user", "{input}"),
+    ])
+    llm = get_llm(temperature=0.0, agent_name="router")
+    return prompt | llm.with_structured_output(RouteDecision)
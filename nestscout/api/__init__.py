@@ -1 +1,29 @@
 """API blueprints package."""
+
+import hashlib
+from typing import Any
+
+from flask import Response, request
+from flask_jwt_extended import get_jwt
+
+from nestscout.utils.serialization import to_json
+
+
+def current_user_id() -> int:
+    """Return the authenticated user's ID from the verified JWT's ``sub`` claim.
+
+    Only valid inside a ``@jwt_required()`` view.
+    """
+    return int(get_jwt()["sub"])
+
+
+def cacheable_json(payload: Any, max_age: int) -> Response:
+    """JSON response with an ETag and ``Cache-Control: public, max-age``.
+
+    A request whose ``If-None-Match`` matches the body's digest gets an empty 304.
+    """
+    body = to_json(payload).encode("utf-8")
+    response = Response(body, mimetype="application/json")
+    response.set_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    return response.make_conditional(request)
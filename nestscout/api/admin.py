@@ -3,27 +3,44 @@
 from flask import Blueprint, jsonify
 from flask_jwt_extended import jwt_required
 from sqlalchemy import select, func
+from sqlalchemy.orm import raiseload
 
 from nestscout.extensions import db
 from nestscout.models.user import User
 from nestscout.models.property import Property
 from nestscout.models.poi import POI, POICategory
 from nestscout.models.data_source import DataSource
+from nestscout.utils.cache import TTLCache
 
 admin_bp = Blueprint("admin", __name__)
 
+# Platform stats tolerate a minute of staleness
+_stats_cache = TTLCache(maxsize=1, ttl=60)
+
+_STATS_STMT = select(
+    *(
+        select(func.count(col)).scalar_subquery().label(name)
+        for name, col in (
+            ("users", User.id),
+            ("properties", Property.id),
+            ("pois", POI.id),
+            ("categories", POICategory.id),
+            ("data_sources", DataSource.id),
+        )
+    )
+)
+
 
 @admin_bp.get("/stats")
 @jwt_required()
 def platform_stats():
     """Get platform-wide statistics."""
-    stats = {
-        "users": db.session.execute(select(func.count(User.id))).scalar(),
-        "properties": db.session.execute(select(func.count(Property.id))).scalar(),
-        "pois": db.session.execute(select(func.count(POI.id))).scalar(),
-        "categories": db.session.execute(select(func.count(POICategory.id))).scalar(),
-        "data_sources": db.session.execute(select(func.count(DataSource.id))).scalar(),
-    }
+    stats = _stats_cache.get("stats")
+    if stats is None:
+        # All five counts in one round trip
+        stats = db.session.execute(_STATS_STMT).one()._asdict()
+        db.session.close()  # release the connection before serialising
+        _stats_cache.set("stats", stats)
     return jsonify(stats), 200
 
 
@@ -32,6 +49,6 @@ def platform_stats():
 def list_data_sources():
     """List all data sources."""
     sources = list(db.session.execute(
-        select(DataSource).order_by(DataSource.id)
+        select(DataSource).options(raiseload("*")).order_by(DataSource.id)
     ).scalars())
     return jsonify({"items": [s.to_dict() for s in sources]}), 200
@@ -1,9 +1,11 @@
 """AI blueprint — chat endpoint for the LangChain agent."""
 
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_jwt_extended import jwt_required
 
+from nestscout.api import current_user_id
 from nestscout.services.ai_service import AIService
+from nestscout.utils.serialization import to_json
 
 ai_bp = Blueprint("ai", __name__)
 
@@ -18,11 +20,35 @@ def chat():
     if not message:
         return jsonify({"error": "Message is required"}), 400
 
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     response = AIService.chat(message, user_id=user_id)
     return jsonify({"response": response}), 200
 
 
+@ai_bp.post("/chat/stream")
+@jwt_required()
+def chat_stream():
+    """Stream the AI assistant's reply as Server-Sent Events."""
+    data = request.get_json(silent=True) or {}
+    message = data.get("message", "").strip()
+
+    if not message:
+        return jsonify({"error": "Message is required"}), 400
+
+    user_id = current_user_id()
+
+    def generate():
+        for chunk in AIService.stream_chat(message, user_id=user_id):
+            yield f"data: {to_json(chunk)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @ai_bp.post("/search")
 @jwt_required()
 def ai_search():
@@ -1,8 +1,10 @@
 """Auth blueprint — register, login, refresh tokens."""
 
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from marshmallow import ValidationError
 
+from nestscout.api import current_user_id
 from nestscout.schemas.auth import RegisterSchema, LoginSchema
 from nestscout.services.auth_service import AuthService
 
@@ -14,11 +16,11 @@ _login_schema = LoginSchema()
 @auth_bp.post("/register")
 def register():
     """Register a new user account."""
-    errors = _register_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = _register_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    data = _register_schema.load(request.get_json())
     try:
         user = AuthService.register(
             username=data["username"],
@@ -33,11 +35,11 @@ def register():
 @auth_bp.post("/login")
 def login():
     """Authenticate and receive JWT tokens."""
-    errors = _login_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = _login_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    data = _login_schema.load(request.get_json())
     try:
         tokens = AuthService.login(email=data["email"], password=data["password"])
         return jsonify(tokens), 200
@@ -49,8 +51,8 @@ def login():
 @jwt_required()
 def me():
     """Get current user profile."""
-    user_id = int(get_jwt_identity())
-    user = AuthService.get_user_by_id(user_id)
+    user_id = current_user_id()
+    user = AuthService.get_user_dict_by_id(user_id)
     if not user:
         return jsonify({"error": "User not found"}), 404
-    return jsonify({"user": user.to_dict()}), 200
+    return jsonify({"user": user}), 200
@@ -1,15 +1,51 @@
 """Import blueprint — CSV/Excel upload and URL-based import."""
 
+import contextlib
 import os
+import shutil
 import tempfile
 
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
+from werkzeug.datastructures import FileStorage
 
+from nestscout.api import current_user_id
 from nestscout.services.import_service import ImportService
+from nestscout.services.job_service import JobService
 
 import_bp = Blueprint("import", __name__)
 
+_COPY_BUFFER = 1024 * 1024  # 1 MiB
+
+
+def _spool_upload(file: FileStorage) -> str:
+    """Stream an uploaded file to a named temp file and return its path."""
+    suffix = os.path.splitext(file.filename)[1]
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(file.stream, tmp, length=_COPY_BUFFER)
+        return tmp.name
+
+
+def _remove(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def _import_file(importer, path: str, **kwargs) -> dict:
+    """Run an import on a spooled upload, then delete the file (job body)."""
+    try:
+        return importer(path, **kwargs)
+    finally:
+        _remove(path)
+
+
+def _accepted(job_id: str):
+    return jsonify({
+        "message": "Import queued",
+        "job_id": job_id,
+        "status_url": f"/api/import/jobs/{job_id}",
+    }), 202
+
 
 @import_bp.post("/csv/properties")
 @jwt_required()
@@ -22,25 +58,19 @@ def import_properties_csv():
     if not file.filename:
         return jsonify({"error": "Empty filename"}), 400
 
-    # Save to temp file
-    suffix = os.path.splitext(file.filename)[1]
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        file.save(tmp.name)
-        tmp_path = tmp.name
+    defaults = {
+        "currency": request.form.get("currency", "EUR"),
+        "operation": request.form.get("operation", "sale"),
+        "city": request.form.get("city"),
+    }
+    defaults = {k: v for k, v in defaults.items() if v}
 
-    try:
-        defaults = {
-            "currency": request.form.get("currency", "EUR"),
-            "operation": request.form.get("operation", "sale"),
-            "city": request.form.get("city"),
-        }
-        defaults = {k: v for k, v in defaults.items() if v}
-
-        result = ImportService.import_properties_csv(tmp_path, defaults=defaults)
-        status = 201 if result["success"] else 400
-        return jsonify(result), status
-    finally:
-        os.unlink(tmp_path)
+    tmp_path = _spool_upload(file)
+    job_id = JobService.submit(
+        "import", current_user_id(),
+        _import_file, ImportService.import_properties_csv, tmp_path, defaults=defaults,
+    )
+    return _accepted(job_id)
 
 
 @import_bp.post("/csv/pois")
@@ -54,14 +84,18 @@ def import_pois_csv():
     if not file.filename:
         return jsonify({"error": "Empty filename"}), 400
 
-    suffix = os.path.splitext(file.filename)[1]
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        file.save(tmp.name)
-        tmp_path = tmp.name
+    tmp_path = _spool_upload(file)
+    job_id = JobService.submit(
+        "import", current_user_id(), _import_file, ImportService.import_pois_csv, tmp_path,
+    )
+    return _accepted(job_id)
 
-    try:
-        result = ImportService.import_pois_csv(tmp_path)
-        status = 201 if result["success"] else 400
-        return jsonify(result), status
-    finally:
-        os.unlink(tmp_path)
+
+@import_bp.get("/jobs/<job_id>")
+@jwt_required()
+def import_job_status(job_id: str):
+    """Poll a queued import job (only its submitter may)."""
+    job = JobService.get(job_id, current_user_id())
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
@@ -1,26 +1,34 @@
 """POIs blueprint — CRUD, categories, proximity search, bulk import."""
 
+import msgspec
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
+from marshmallow import ValidationError
 
-from nestscout.schemas.poi import POICreateSchema, POIBulkSchema, POICategorySchema
+from nestscout.api import cacheable_json
+from nestscout.schemas.bulk import poi_bulk_decoder, to_records
+from nestscout.schemas.poi import POICreateSchema, POICategorySchema
 from nestscout.services.poi_service import POIService
 
 pois_bp = Blueprint("pois", __name__)
 _create_schema = POICreateSchema()
-_bulk_schema = POIBulkSchema()
 _category_schema = POICategorySchema()
 
 
 @pois_bp.get("/")
 def list_pois():
-    """List POIs with optional category filter."""
+    """List POIs with optional category filter (ETag-validated, cacheable for 30s)."""
     category_id = request.args.get("category_id", type=int)
+    after_id = request.args.get("after_id", type=int)
     page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 50, type=int)
+    include_total = request.args.get("include_total", "true").lower() not in ("false", "0")
 
-    result = POIService.list_pois(category_id=category_id, page=page, per_page=per_page)
-    return jsonify(result), 200
+    result = POIService.list_pois(
+        category_id=category_id, after_id=after_id, page=page, per_page=per_page,
+        include_total=include_total,
+    )
+    return cacheable_json(result, max_age=30)
 
 
 @pois_bp.get("/nearby")
@@ -40,20 +48,19 @@ def nearby_pois():
 
 @pois_bp.get("/categories")
 def list_categories():
-    """List all POI categories."""
-    cats = POIService.list_categories()
-    return jsonify({"items": [c.to_dict() for c in cats]}), 200
+    """List all POI categories (ETag-validated, 304 when unchanged)."""
+    return cacheable_json({"items": POIService.category_dicts()}, max_age=300)
 
 
 @pois_bp.post("/categories")
 @jwt_required()
 def create_category():
     """Create a POI category."""
-    errors = _category_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = _category_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    data = _category_schema.load(request.get_json())
     cat = POIService.get_or_create_category(**data)
     return jsonify({"message": "Category created", "category": cat.to_dict()}), 201
 
@@ -62,11 +69,11 @@ def create_category():
 @jwt_required()
 def create_poi():
     """Create a single POI/business."""
-    errors = _create_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = _create_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    data = _create_schema.load(request.get_json())
     poi = POIService.create(data)
     return jsonify({"message": "POI created", "poi": poi.to_dict()}), 201
 
@@ -75,12 +82,12 @@ def create_poi():
 @jwt_required()
 def bulk_create_pois():
     """Bulk import POIs/businesses from a JSON array."""
-    errors = _bulk_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = poi_bulk_decoder.decode(request.get_data())
+    except msgspec.DecodeError as e:
+        return jsonify({"error": "Validation failed", "details": str(e)}), 400
 
-    data = _bulk_schema.load(request.get_json())
-    created, skipped = POIService.bulk_create(data["pois"])
+    created, skipped = POIService.bulk_create(to_records(data.pois))
     return jsonify({
         "message": "Bulk import completed",
         "created": created,
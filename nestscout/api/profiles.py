@@ -1,26 +1,37 @@
 """Profiles blueprint — search profile & scoring rule management."""
 
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import select
+from flask_jwt_extended import jwt_required
+from marshmallow import ValidationError
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import raiseload, selectinload
 
+from nestscout.api import current_user_id
 from nestscout.extensions import db
 from nestscout.models.search_profile import SearchProfile
 from nestscout.models.scoring import ScoringRule
 from nestscout.schemas.profile import ProfileCreateSchema, ProfileUpdateRulesSchema
+from nestscout.services.job_service import JobService
+from nestscout.services.scoring_service import ScoringService
 
 profiles_bp = Blueprint("profiles", __name__)
 _create_schema = ProfileCreateSchema()
 _rules_schema = ProfileUpdateRulesSchema()
 
+# Read paths only serialise rules — load them in one IN query, and fail loudly
+# if anything starts lazy-loading another relationship per profile.
+_WITH_RULES = (selectinload(SearchProfile.scoring_rules), raiseload("*"))
+
 
 @profiles_bp.get("/")
 @jwt_required()
 def list_profiles():
     """List current user's search profiles."""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     profiles = list(db.session.execute(
-        select(SearchProfile).where(SearchProfile.user_id == user_id)
+        select(SearchProfile)
+        .where(SearchProfile.user_id == user_id)
+        .options(*_WITH_RULES)
     ).scalars())
     return jsonify({"items": [p.to_dict(include_rules=True) for p in profiles]}), 200
 
@@ -29,12 +40,12 @@ def list_profiles():
 @jwt_required()
 def create_profile():
     """Create a new search profile."""
-    errors = _create_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = _create_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    data = _create_schema.load(request.get_json())
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
 
     profile = SearchProfile(user_id=user_id, **data)
     db.session.add(profile)
@@ -46,8 +57,8 @@ def create_profile():
 @jwt_required()
 def get_profile(profile_id: int):
     """Get a specific search profile with its rules."""
-    user_id = int(get_jwt_identity())
-    profile = db.session.get(SearchProfile, profile_id)
+    user_id = current_user_id()
+    profile = db.session.get(SearchProfile, profile_id, options=_WITH_RULES)
 
     if not profile or profile.user_id != user_id:
         return jsonify({"error": "Profile not found"}), 404
@@ -59,36 +70,43 @@ def get_profile(profile_id: int):
 @jwt_required()
 def update_rules(profile_id: int):
     """Replace all scoring rules for a profile."""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     profile = db.session.get(SearchProfile, profile_id)
 
     if not profile or profile.user_id != user_id:
         return jsonify({"error": "Profile not found"}), 404
 
-    errors = _rules_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
-
-    data = _rules_schema.load(request.get_json())
+    try:
+        data = _rules_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    # Delete existing rules
-    for rule in profile.scoring_rules:
-        db.session.delete(rule)
-
-    # Create new rules
-    for rule_data in data["rules"]:
-        rule = ScoringRule(profile_id=profile_id, **rule_data)
-        db.session.add(rule)
+    # Replace the rule set with one DELETE and one multi-row INSERT
+    db.session.execute(delete(ScoringRule).where(ScoringRule.profile_id == profile_id))
+    if data["rules"]:
+        db.session.execute(
+            insert(ScoringRule),
+            [{"profile_id": profile_id, **rule_data} for rule_data in data["rules"]],
+        )
 
     db.session.commit()
-    return jsonify({"message": "Rules updated", "profile": profile.to_dict(include_rules=True)}), 200
+
+    # Every stored score for the profile is now stale — refresh them off the request thread
+    job_id = JobService.submit(
+        "scoring", user_id, ScoringService.compute_scores, profile_id, stale_only=True,
+    )
+    return jsonify({
+        "message": "Rules updated",
+        "profile": profile.to_dict(include_rules=True),
+        "score_job_id": job_id,
+    }), 200
 
 
 @profiles_bp.delete("/<int:profile_id>")
 @jwt_required()
 def delete_profile(profile_id: int):
     """Delete a search profile and all its rules/scores."""
-    user_id = int(get_jwt_identity())
+    user_id = current_user_id()
     profile = db.session.get(SearchProfile, profile_id)
 
     if not profile or profile.user_id != user_id:
@@ -1,27 +1,30 @@
 """Properties blueprint — CRUD + bulk import + filtered search."""
 
+import msgspec
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
+from marshmallow import ValidationError
 
-from nestscout.schemas.property import PropertyCreateSchema, PropertyBulkSchema, PropertyFilterSchema
+from nestscout.api import cacheable_json
+from nestscout.schemas.bulk import property_bulk_decoder, to_records
+from nestscout.schemas.property import PropertyCreateSchema, PropertyFilterSchema
 from nestscout.services.property_service import PropertyService
 
 properties_bp = Blueprint("properties", __name__)
 _create_schema = PropertyCreateSchema()
-_bulk_schema = PropertyBulkSchema()
 _filter_schema = PropertyFilterSchema()
 
 
 @properties_bp.get("/")
 def list_properties():
-    """List properties with optional filters and pagination."""
-    errors = _filter_schema.validate(request.args)
-    if errors:
-        return jsonify({"error": "Invalid filters", "details": errors}), 400
+    """List properties with optional filters and pagination (ETag-validated, cacheable for 30s)."""
+    try:
+        filters = _filter_schema.load(request.args)
+    except ValidationError as e:
+        return jsonify({"error": "Invalid filters", "details": e.messages}), 400
 
-    filters = _filter_schema.load(request.args)
     result = PropertyService.list_properties(**filters)
-    return jsonify(result), 200
+    return cacheable_json(result, max_age=30)
 
 
 @properties_bp.get("/<int:property_id>")
@@ -37,11 +40,11 @@ def get_property(property_id: int):
 @jwt_required()
 def create_property():
     """Create a single property."""
-    errors = _create_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = _create_schema.load(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        return jsonify({"error": "Validation failed", "details": e.messages}), 400
 
-    data = _create_schema.load(request.get_json())
     prop = PropertyService.create(data)
     return jsonify({"message": "Property created", "property": prop.to_dict()}), 201
 
@@ -50,12 +53,12 @@ def create_property():
 @jwt_required()
 def bulk_create_properties():
     """Bulk import properties from a JSON array."""
-    errors = _bulk_schema.validate(request.get_json(silent=True) or {})
-    if errors:
-        return jsonify({"error": "Validation failed", "details": errors}), 400
+    try:
+        data = property_bulk_decoder.decode(request.get_data())
+    except msgspec.DecodeError as e:
+        return jsonify({"error": "Validation failed", "details": str(e)}), 400
 
-    data = _bulk_schema.load(request.get_json())
-    created, skipped = PropertyService.bulk_create(data["properties"])
+    created, skipped = PropertyService.bulk_create(to_records(data.properties))
     return jsonify({
         "message": "Bulk import completed",
         "created": created,
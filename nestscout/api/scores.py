@@ -1,38 +1,62 @@
 """Scores blueprint — retrieve and trigger score computation."""
 
-from flask import Blueprint, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import jwt_required
 
+from nestscout.api import current_user_id
 from nestscout.extensions import db
 from nestscout.models.search_profile import SearchProfile
 from nestscout.services.scoring_service import ScoringService
 
 scores_bp = Blueprint("scores", __name__)
 
+_MAX_PER_PAGE = 200
+
 
 @scores_bp.get("/<int:profile_id>")
 @jwt_required()
 def get_scores(profile_id: int):
-    """Get properties ranked by score for a given profile."""
-    user_id = int(get_jwt_identity())
+    """Get one page of properties ranked by score for a given profile.
+
+    ``?page=`` / ``?per_page=`` (default 50, at most 200); ``has_next`` comes
+    from fetching one extra row, so no COUNT query runs.
+    """
+    user_id = current_user_id()
     profile = db.session.get(SearchProfile, profile_id)
 
     if not profile or profile.user_id != user_id:
         return jsonify({"error": "Profile not found"}), 404
 
-    ranked = ScoringService.get_ranked_properties(profile_id)
-    return jsonify({"items": ranked, "total": len(ranked)}), 200
+    page = max(request.args.get("page", 1, type=int), 1)
+    per_page = min(max(request.args.get("per_page", 50, type=int), 1), _MAX_PER_PAGE)
+    ranked = ScoringService.get_ranked_properties(
+        profile_id, limit=per_page + 1, offset=(page - 1) * per_page,
+    )
+    return jsonify({
+        "items": ranked[:per_page],
+        "page": page,
+        "per_page": per_page,
+        "has_next": len(ranked) > per_page,
+    }), 200
 
 
 @scores_bp.post("/<int:profile_id>/compute")
 @jwt_required()
 def compute_scores(profile_id: int):
-    """Trigger score computation for a profile."""
-    user_id = int(get_jwt_identity())
+    """Trigger score computation for a profile.
+
+    ``?stale_only=1`` for an incremental refresh; ``?breakdown=0`` to skip
+    storing per-rule breakdowns.
+    """
+    user_id = current_user_id()
     profile = db.session.get(SearchProfile, profile_id)
 
     if not profile or profile.user_id != user_id:
         return jsonify({"error": "Profile not found"}), 404
 
-    count = ScoringService.compute_scores(profile_id)
+    stale_only = request.args.get("stale_only", "false").lower() in ("true", "1")
+    include_breakdown = request.args.get("breakdown", "true").lower() not in ("false", "0")
+    count = ScoringService.compute_scores(
+        profile_id, stale_only=stale_only, include_breakdown=include_breakdown,
+    )
     return jsonify({"message": f"Scored {count} properties", "count": count}), 200
@@ -3,30 +3,41 @@
 Registered as `nestscout` command via pyproject.toml entry points.
 """
 
+from importlib import import_module
+
 import click
 
-from nestscout.cli.db import db_cli
-from nestscout.cli.users import users_cli
-from nestscout.cli.properties import properties_cli
-from nestscout.cli.pois import pois_cli
-from nestscout.cli.scoring import scoring_cli
-from nestscout.cli.ai import ai_cli
+# Sub-command groups ("module:attribute"), imported only when invoked
+_SUBCOMMANDS: dict[str, str] = {
+    "db": "nestscout.cli.db:db_cli",
+    "users": "nestscout.cli.users:users_cli",
+    "properties": "nestscout.cli.properties:properties_cli",
+    "pois": "nestscout.cli.pois:pois_cli",
+    "scoring": "nestscout.cli.scoring:scoring_cli",
+    "ai": "nestscout.cli.ai:ai_cli",
+}
+
+
+class _LazyGroup(click.Group):
+    """Click group that imports a sub-command's module only when it is used."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *_SUBCOMMANDS})
 
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        target = _SUBCOMMANDS.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+        module_path, attr = target.split(":")
+        return getattr(import_module(module_path), attr)
 
-@click.group()
+
+@click.group(cls=_LazyGroup)
 @click.version_option(version="0.1.0", prog_name="nestscout")
 def cli():
     """🏠 NestScout — AI-powered real estate intelligence platform."""
     pass
 
 
-cli.add_command(db_cli, "db")
-cli.add_command(users_cli, "users")
-cli.add_command(properties_cli, "properties")
-cli.add_command(pois_cli, "pois")
-cli.add_command(scoring_cli, "scoring")
-cli.add_command(ai_cli, "ai")
-
-
 if __name__ == "__main__":
     cli()
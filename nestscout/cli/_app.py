@@ -0,0 +1,14 @@
+"""Shared Flask app for CLI commands."""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from flask import Flask
+
+
+@functools.lru_cache(maxsize=1)
+def get_app() -> "Flask":
+    """Build the CLI's Flask app once per process (API blueprints are skipped)."""
+    from nestscout import create_app
+    return create_app(register_api=False)
@@ -0,0 +1,82 @@
+"""Tabular output for CLI list commands."""
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+import click
+
+from nestscout.cli._shared import shared
+
+# Listings longer than this skip Rich and are written as one block of aligned text
+PLAIN_TEXT_MIN_ROWS = 100
+
+# (header, Rich add_column kwargs) — only max_width and justify affect plain text
+Columns = Sequence[tuple[str, dict[str, Any]]]
+
+format_option = click.option(
+    "--format", "fmt", type=click.Choice(["table", "json", "tsv"]), default="table",
+    show_default=True, help="Output format; json/tsv print raw records without Rich",
+)
+
+
+def _plain_table(title: str, columns: Columns, rows: list[tuple[str, ...]]) -> str:
+    headers = [header for header, _ in columns]
+    limits = [opts.get("max_width") for _, opts in columns]
+    rows = [
+        tuple(cell[:limit] if limit else cell for cell, limit in zip(row, limits))
+        for row in rows
+    ]
+    widths = [max(len(h), *(len(row[i]) for row in rows)) for i, h in enumerate(headers)]
+    right = [opts.get("justify") == "right" for _, opts in columns]
+
+    def line(cells: Sequence[str]) -> str:
+        return "  ".join(
+            cell.rjust(w) if r else cell.ljust(w) for cell, w, r in zip(cells, widths, right)
+        ).rstrip()
+
+    return "\n".join([title, line(headers), *map(line, rows)])
+
+
+def _tsv_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        from nestscout.utils.serialization import to_json
+        return to_json(value)
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+
+def print_records(fmt: str, items: list[dict]) -> None:
+    """Write raw records to stdout as a JSON array or as TSV with a header row."""
+    if fmt == "json":
+        from nestscout.utils.serialization import to_json
+        click.echo(to_json(items))
+        return
+
+    keys = list(items[0]) if items else []
+    lines = ["\t".join(keys)]
+    lines.extend("\t".join(_tsv_cell(item.get(k)) for k in keys) for item in items)
+    click.echo("\n".join(lines))
+
+
+def print_table(title: str, columns: Columns, rows: list[tuple[str, ...]]) -> None:
+    """Print pre-formatted string rows as a Rich table.
+
+    Long listings are written as plain aligned text in a single write instead,
+    since Rich's per-cell layout dominates the command's runtime there.
+    """
+    if len(rows) > PLAIN_TEXT_MIN_ROWS:
+        click.echo(_plain_table(title, columns, rows))
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, opts in columns:
+        table.add_column(header, **opts)
+    for row in rows:
+        table.add_row(*row)
+    shared.console.print(table)
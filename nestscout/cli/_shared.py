@@ -0,0 +1,18 @@
+"""Process-wide CLI singletons, created on first use."""
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _Shared:
+    @cached_property
+    def console(self) -> "Console":
+        """The Rich console shared by every command (Rich is imported on first use)."""
+        from rich.console import Console
+        return Console()
+
+
+shared = _Shared()
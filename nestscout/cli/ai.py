@@ -1,15 +1,9 @@
 """AI CLI commands — interactive chat and one-shot search."""
 
 import click
-from rich.console import Console
-from rich.markdown import Markdown
 
-console = Console()
-
-
-def _get_app():
-    from nestscout import create_app
-    return create_app()
+from nestscout.cli._app import get_app
+from nestscout.cli._shared import shared
 
 
 @click.group("ai")
@@ -24,13 +18,15 @@ def chat_interactive():
 
     Type 'quit' or 'exit' to end the session.
     """
-    app = _get_app()
+    app = get_app()
     with app.app_context():
+        from rich.markdown import Markdown
+
         from nestscout.services.ai_service import AIService
 
-        console.print("🤖 NestScout AI Assistant", style="bold blue")
-        console.print("Type your question about properties, neighbourhoods, or prices.")
-        console.print("Type 'quit' or 'exit' to end.\n", style="dim")
+        shared.console.print("🤖 NestScout AI Assistant", style="bold blue")
+        shared.console.print("Type your question about properties, neighbourhoods, or prices.")
+        shared.console.print("Type 'quit' or 'exit' to end.\n", style="dim")
 
         while True:
             try:
@@ -39,17 +35,17 @@ def chat_interactive():
                 break
 
             if message.lower().strip() in ("quit", "exit", "q"):
-                console.print("\n👋 Goodbye!", style="blue")
+                shared.console.print("\n👋 Goodbye!", style="blue")
                 break
 
             if not message.strip():
                 continue
 
-            console.print("⏳ Thinking...", style="dim")
+            shared.console.print("⏳ Thinking...", style="dim")
             response = AIService.chat(message)
-            console.print()
-            console.print(Markdown(f"**🤖 AI:** {response}"))
-            console.print()
+            shared.console.print()
+            shared.console.print(Markdown(f"**🤖 AI:** {response}"))
+            shared.console.print()
 
 
 @ai_cli.command("search")
@@ -59,15 +55,17 @@ def ai_search(query):
 
     QUERY: Your search query in natural language.
     """
-    app = _get_app()
+    app = get_app()
     with app.app_context():
+        from rich.markdown import Markdown
+
         from nestscout.services.ai_service import AIService
 
-        console.print(f"🔍 Searching: {query}", style="blue")
+        shared.console.print(f"🔍 Searching: {query}", style="blue")
         results = AIService.search(query)
 
         for r in results:
             if "response" in r:
-                console.print(Markdown(r["response"]))
+                shared.console.print(Markdown(r["response"]))
             else:
-                console.print(r)
+                shared.console.print(r)
@@ -1,15 +1,9 @@
 """DB CLI commands — init, seed, reset."""
 
 import click
-from rich.console import Console
 
-console = Console()
-
-
-def _get_app():
-    """Create or get the Flask app for CLI context."""
-    from nestscout import create_app
-    return create_app()
+from nestscout.cli._app import get_app
+from nestscout.cli._shared import shared
 
 
 @click.group("db")
@@ -21,20 +15,22 @@ def db_cli():
 @db_cli.command("init")
 def init_db():
     """Create all database tables (dev only — use migrations in prod)."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.extensions import db
         import nestscout.models  # noqa: F401 — Ensure all models are loaded for create_all
 
         db.create_all()
-        console.print("✅ Database tables created.", style="green")
+        shared.console.print("✅ Database tables created.", style="green")
 
 
 @db_cli.command("seed")
 def seed_db():
     """Seed the database with sample data."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
+        from sqlalchemy import select
+
         from nestscout.extensions import db
         from nestscout.models import POICategory, DataSource
 
@@ -60,13 +56,10 @@ def seed_db():
             {"name": "Bakery", "icon": "🥖", "color": "#DEB887"},
         ]
 
-        for cat_data in default_categories:
-            from sqlalchemy import select
-            existing = db.session.execute(
-                select(POICategory).where(POICategory.name == cat_data["name"])
-            ).scalar_one_or_none()
-            if not existing:
-                db.session.add(POICategory(**cat_data))
+        existing_cats = set(db.session.execute(select(POICategory.name)).scalars())
+        db.session.add_all(
+            POICategory(**c) for c in default_categories if c["name"] not in existing_cats
+        )
 
         # Seed default data sources
         default_sources = [
@@ -75,31 +68,29 @@ def seed_db():
             {"name": "URL Import", "source_type": "api", "is_active": True},
         ]
 
-        for src_data in default_sources:
-            existing = db.session.execute(
-                select(DataSource).where(DataSource.name == src_data["name"])
-            ).scalar_one_or_none()
-            if not existing:
-                db.session.add(DataSource(**src_data))
+        existing_sources = set(db.session.execute(select(DataSource.name)).scalars())
+        db.session.add_all(
+            DataSource(**s) for s in default_sources if s["name"] not in existing_sources
+        )
 
         db.session.commit()
-        console.print("✅ Database seeded with default categories and data sources.", style="green")
+        shared.console.print("✅ Database seeded with default categories and data sources.", style="green")
 
 
 @db_cli.command("reset")
 @click.confirmation_option(prompt="⚠️  This will DROP all tables and recreate them. Continue?")
 def reset_db():
     """Drop all tables, recreate, and seed."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.extensions import db
         import nestscout.models  # noqa: F401
 
         db.drop_all()
-        console.print("🗑️  All tables dropped.", style="yellow")
+        shared.console.print("🗑️  All tables dropped.", style="yellow")
 
         db.create_all()
-        console.print("✅ Tables recreated.", style="green")
+        shared.console.print("✅ Tables recreated.", style="green")
 
     # Re-seed
     from nestscout.cli.db import seed_db
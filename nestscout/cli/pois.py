@@ -1,15 +1,24 @@
 """POI / Business CLI commands — list, add, bulk-import."""
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
-
-
-def _get_app():
-    from nestscout import create_app
-    return create_app()
+from nestscout.cli._app import get_app
+from nestscout.cli._output import format_option, print_records, print_table
+from nestscout.cli._shared import shared
+
+_POI_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Name", {"max_width": 35}),
+    ("Category", {"style": "magenta"}),
+    ("Rating", {"justify": "right"}),
+    ("Address", {"max_width": 30}),
+)
+_CATEGORY_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Icon", {}),
+    ("Name", {"style": "green"}),
+    ("Color", {}),
+)
 
 
 @click.group("pois")
@@ -21,59 +30,55 @@ def pois_cli():
 @pois_cli.command("list")
 @click.option("--category", type=int, help="Filter by category ID")
 @click.option("--limit", default=50, type=int, help="Number of results")
-def list_pois(category, limit):
+@format_option
+def list_pois(category, limit, fmt):
     """List POIs/businesses."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.poi_service import POIService
 
         result = POIService.list_pois(category_id=category, per_page=limit)
 
-        if not result["items"]:
-            console.print("No POIs found.", style="yellow")
+        if fmt != "table":
+            print_records(fmt, result["items"])
             return
 
-        table = Table(title=f"Points of Interest ({result['total']} total)")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", max_width=35)
-        table.add_column("Category", style="magenta")
-        table.add_column("Rating", justify="right")
-        table.add_column("Address", max_width=30)
+        if not result["items"]:
+            shared.console.print("No POIs found.", style="yellow")
+            return
 
-        for p in result["items"]:
-            table.add_row(
+        rows = [
+            (
                 str(p["id"]),
                 p["name"],
-                p.get("category_name", "-"),
-                f"{p['rating']:.1f}" if p.get("rating") else "-",
-                p.get("address", "-") or "-",
+                p["category_name"] or "-",
+                f"{p['rating']:.1f}" if p["rating"] else "-",
+                p["address"] or "-",
             )
-
-        console.print(table)
+            for p in result["items"]
+        ]
+        print_table(f"Points of Interest ({result['total']} total)", _POI_COLUMNS, rows)
 
 
 @pois_cli.command("categories")
-def list_categories():
+@format_option
+def list_categories(fmt):
     """List all POI categories."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.poi_service import POIService
-        cats = POIService.list_categories()
+        cats = POIService.category_dicts()
 
-        if not cats:
-            console.print("No categories found. Run 'nestscout db seed' first.", style="yellow")
+        if fmt != "table":
+            print_records(fmt, cats)
             return
 
-        table = Table(title="POI Categories")
-        table.add_column("ID", style="cyan")
-        table.add_column("Icon")
-        table.add_column("Name", style="green")
-        table.add_column("Color")
-
-        for c in cats:
-            table.add_row(str(c.id), c.icon or "-", c.name, c.color or "-")
+        if not cats:
+            shared.console.print("No categories found. Run 'nestscout db seed' first.", style="yellow")
+            return
 
-        console.print(table)
+        rows = [(str(c["id"]), c["icon"] or "-", c["name"], c["color"] or "-") for c in cats]
+        print_table("POI Categories", _CATEGORY_COLUMNS, rows)
 
 
 @pois_cli.command("add")
@@ -85,7 +90,7 @@ def list_categories():
 @click.option("--rating", type=float, default=None, help="Rating (0-5)")
 def add_poi(name, category_name, address, latitude, longitude, rating):
     """Add a single POI/business interactively."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.poi_service import POIService
 
@@ -105,7 +110,7 @@ def add_poi(name, category_name, address, latitude, longitude, rating):
             data["rating"] = rating
 
         poi = POIService.create(data)
-        console.print(
+        shared.console.print(
             f"✅ POI created with ID {poi.id}: {poi.name} [{cat.name}]",
             style="green",
         )
@@ -113,26 +118,40 @@ def add_poi(name, category_name, address, latitude, longitude, rating):
 
 @pois_cli.command("bulk-import")
 @click.argument("filepath", type=click.Path(exists=True))
-def bulk_import_pois(filepath):
+@click.option("--chunk-size", default=5000, type=click.IntRange(min=1), help="Rows per insert/commit batch")
+def bulk_import_pois(filepath, chunk_size):
     """Bulk import POIs/businesses from a CSV or Excel file.
 
     FILEPATH: Path to the CSV or XLSX file.
 
     Expected columns: name, category, latitude, longitude, address, rating
     """
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.import_service import ImportService
 
-        console.print(f"📥 Importing POIs/businesses from: {filepath}", style="blue")
+        shared.console.print(f"📥 Importing POIs/businesses from: {filepath}", style="blue")
 
-        result = ImportService.import_pois_csv(filepath)
+        result = ImportService.import_pois_csv(filepath, chunk_size=chunk_size)
 
         if result["success"]:
-            console.print(
+            shared.console.print(
                 f"✅ Import complete: {result['created']} created, "
                 f"{result['skipped']} skipped (out of {result['total_parsed']} parsed)",
                 style="green",
             )
         else:
-            console.print(f"❌ Import failed: {result.get('error', 'Unknown error')}", style="red")
+            shared.console.print(f"❌ Import failed: {result.get('error', 'Unknown error')}", style="red")
+
+
+@pois_cli.command("distances")
+@click.option("--radius", default=2000.0, type=float, help="Max property ↔ POI distance in metres")
+def rebuild_distances(radius):
+    """Pre-compute property ↔ POI distances used by proximity scoring."""
+    app = get_app()
+    with app.app_context():
+        from nestscout.services.poi_service import POIService
+
+        shared.console.print(f"📏 Computing property ↔ POI distances within {radius:.0f} m...", style="blue")
+        count = POIService.rebuild_property_distances(radius_m=radius)
+        shared.console.print(f"✅ Stored {count} distances.", style="green")
@@ -1,15 +1,20 @@
 """Property CLI commands — list, add, bulk-import."""
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from nestscout.cli._app import get_app
+from nestscout.cli._output import format_option, print_records, print_table
+from nestscout.cli._shared import shared
 
-
-def _get_app():
-    from nestscout import create_app
-    return create_app()
+_PROPERTY_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Title", {"max_width": 40}),
+    ("Price", {"style": "green", "justify": "right"}),
+    ("Op", {"style": "magenta"}),
+    ("Beds", {}),
+    ("Area m²", {"justify": "right"}),
+    ("City", {}),
+)
 
 
 @click.group("properties")
@@ -24,9 +29,10 @@ def properties_cli():
 @click.option("--min-price", type=float, help="Minimum price")
 @click.option("--max-price", type=float, help="Maximum price")
 @click.option("--limit", default=20, type=int, help="Number of results")
-def list_properties(city, operation, min_price, max_price, limit):
+@format_option
+def list_properties(city, operation, min_price, max_price, limit, fmt):
     """List properties with optional filters."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.property_service import PropertyService
 
@@ -42,32 +48,27 @@ def list_properties(city, operation, min_price, max_price, limit):
 
         result = PropertyService.list_properties(**kwargs)
 
+        if fmt != "table":
+            print_records(fmt, result["items"])
+            return
+
         if not result["items"]:
-            console.print("No properties found.", style="yellow")
+            shared.console.print("No properties found.", style="yellow")
             return
 
-        table = Table(title=f"Properties ({result['total']} total)")
-        table.add_column("ID", style="cyan")
-        table.add_column("Title", max_width=40)
-        table.add_column("Price", style="green", justify="right")
-        table.add_column("Op", style="magenta")
-        table.add_column("Beds")
-        table.add_column("Area m²", justify="right")
-        table.add_column("City")
-
-        for p in result["items"]:
-            price_str = f"{p['price']:,.0f} {p.get('currency', 'EUR')}" if p.get("price") else "-"
-            table.add_row(
+        rows = [
+            (
                 str(p["id"]),
                 p["title"][:40],
-                price_str,
-                p.get("operation", "-"),
-                str(p.get("bedrooms", "-")),
-                str(p.get("area_m2", "-")),
-                p.get("city", "-"),
+                f"{p['price']:,.0f} {p['currency']}" if p["price"] else "-",
+                p["operation"],
+                "-" if p["bedrooms"] is None else str(p["bedrooms"]),
+                "-" if p["area_m2"] is None else str(p["area_m2"]),
+                p["city"] or "-",
             )
-
-        console.print(table)
+            for p in result["items"]
+        ]
+        print_table(f"Properties ({result['total']} total)", _PROPERTY_COLUMNS, rows)
 
 
 @properties_cli.command("add")
@@ -84,7 +85,7 @@ def list_properties(city, operation, min_price, max_price, limit):
 @click.option("--lng", "longitude", type=float, default=None, help="Longitude")
 def add_property(title, price, currency, operation, bedrooms, bathrooms, area_m2, address, city, latitude, longitude):
     """Add a single property interactively."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.property_service import PropertyService
 
@@ -99,7 +100,7 @@ def add_property(title, price, currency, operation, bedrooms, bathrooms, area_m2
             data["longitude"] = longitude
 
         prop = PropertyService.create(data)
-        console.print(f"✅ Property created with ID {prop.id}: {prop.title}", style="green")
+        shared.console.print(f"✅ Property created with ID {prop.id}: {prop.title}", style="green")
 
 
 @properties_cli.command("bulk-import")
@@ -107,12 +108,13 @@ def add_property(title, price, currency, operation, bedrooms, bathrooms, area_m2
 @click.option("--city", help="Default city for all records")
 @click.option("--currency", default="EUR", help="Default currency")
 @click.option("--operation", type=click.Choice(["sale", "rent"]), default="sale", help="Default operation")
-def bulk_import_properties(filepath, city, currency, operation):
+@click.option("--chunk-size", default=5000, type=click.IntRange(min=1), help="Rows per insert/commit batch")
+def bulk_import_properties(filepath, city, currency, operation, chunk_size):
     """Bulk import properties from a CSV or Excel file.
 
     FILEPATH: Path to the CSV or XLSX file.
     """
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.import_service import ImportService
 
@@ -120,15 +122,17 @@ def bulk_import_properties(filepath, city, currency, operation):
         if city:
             defaults["city"] = city
 
-        console.print(f"📥 Importing properties from: {filepath}", style="blue")
+        shared.console.print(f"📥 Importing properties from: {filepath}", style="blue")
 
-        result = ImportService.import_properties_csv(filepath, defaults=defaults)
+        result = ImportService.import_properties_csv(
+            filepath, defaults=defaults, chunk_size=chunk_size,
+        )
 
         if result["success"]:
-            console.print(
+            shared.console.print(
                 f"✅ Import complete: {result['created']} created, "
                 f"{result['skipped']} skipped (out of {result['total_parsed']} parsed)",
                 style="green",
             )
         else:
-            console.print(f"❌ Import failed: {result.get('error', 'Unknown error')}", style="red")
+            shared.console.print(f"❌ Import failed: {result.get('error', 'Unknown error')}", style="red")
@@ -1,15 +1,22 @@
 """Scoring CLI commands — compute and recalculate scores."""
 
-import click
-from rich.console import Console
-from rich.table import Table
+import functools
+import os
 
-console = Console()
+import click
 
+from nestscout.cli._app import get_app
+from nestscout.cli._output import format_option, print_records, print_table
+from nestscout.cli._shared import shared
 
-def _get_app():
-    from nestscout import create_app
-    return create_app()
+_RANKED_COLUMNS = (
+    ("Rank", {"style": "cyan", "justify": "right"}),
+    ("Score", {"style": "green bold", "justify": "right"}),
+    ("ID", {}),
+    ("Title", {"max_width": 35}),
+    ("Price", {"justify": "right"}),
+    ("City", {}),
+)
 
 
 @click.group("scoring")
@@ -18,88 +25,157 @@ def scoring_cli():
     pass
 
 
+_stale_only_option = click.option(
+    "--stale-only", is_flag=True,
+    help="Only rescore properties changed since their score (or since the rules changed)",
+)
+_breakdown_option = click.option(
+    "--breakdown/--no-breakdown", "include_breakdown", default=True, show_default=True,
+    help="Store the per-rule score breakdown (skipping it makes large runs faster)",
+)
+
+
 @scoring_cli.command("compute")
 @click.argument("profile_id", type=int)
-def compute_scores(profile_id):
+@_stale_only_option
+@_breakdown_option
+def compute_scores(profile_id, stale_only, include_breakdown):
     """Compute scores for all properties against a search profile.
 
     PROFILE_ID: The search profile ID to score against.
     """
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.scoring_service import ScoringService
 
-        console.print(f"⏳ Computing scores for profile {profile_id}...", style="blue")
-        count = ScoringService.compute_scores(profile_id)
+        shared.console.print(f"⏳ Computing scores for profile {profile_id}...", style="blue")
+        count = ScoringService.compute_scores(
+            profile_id, stale_only=stale_only, include_breakdown=include_breakdown,
+        )
 
         if count > 0:
-            console.print(f"✅ Scored {count} properties.", style="green")
+            shared.console.print(f"✅ Scored {count} properties.", style="green")
+        elif stale_only:
+            shared.console.print("✅ Scores are up to date.", style="green")
         else:
-            console.print("⚠️  No properties scored. Check that the profile exists and has rules.", style="yellow")
+            shared.console.print("⚠️  No properties scored. Check that the profile exists and has rules.", style="yellow")
 
 
 @scoring_cli.command("ranked")
 @click.argument("profile_id", type=int)
 @click.option("--limit", default=20, type=int, help="Number of results")
-def show_ranked(profile_id, limit):
+@click.option(
+    "--live", is_flag=True, help="Score the top properties now instead of reading stored scores",
+)
+@format_option
+def show_ranked(profile_id, limit, live, fmt):
     """Show properties ranked by score for a profile.
 
     PROFILE_ID: The search profile ID.
     """
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.scoring_service import ScoringService
 
-        ranked = ScoringService.get_ranked_properties(profile_id)
+        if live:
+            ranked = ScoringService.compute_top_k(profile_id, limit)
+        else:
+            ranked = ScoringService.get_ranked_properties(profile_id, limit=limit)
+
+        if fmt != "table":
+            print_records(fmt, ranked)
+            return
 
+        if not ranked and live:
+            shared.console.print("No properties scored. Check that the profile exists.", style="yellow")
+            return
         if not ranked:
-            console.print("No scores found. Run 'nestscout scoring compute' first.", style="yellow")
+            shared.console.print("No scores found. Run 'nestscout scoring compute' first.", style="yellow")
             return
 
-        table = Table(title=f"Properties Ranked by Profile {profile_id}")
-        table.add_column("Rank", style="cyan", justify="right")
-        table.add_column("Score", style="green bold", justify="right")
-        table.add_column("ID")
-        table.add_column("Title", max_width=35)
-        table.add_column("Price", justify="right")
-        table.add_column("City")
-
-        for i, p in enumerate(ranked[:limit], 1):
-            score = p.get("score", {})
-            price_str = f"{p['price']:,.0f}" if p.get("price") else "-"
-            table.add_row(
+        rows = [
+            (
                 str(i),
-                f"{score.get('total_score', 0):.1f}",
+                f"{p['score']['total_score']:.1f}",
                 str(p["id"]),
                 p["title"][:35],
-                price_str,
-                p.get("city", "-"),
+                f"{p['price']:,.0f}" if p["price"] else "-",
+                p["city"] or "-",
             )
+            for i, p in enumerate(ranked, 1)
+        ]
+        print_table(f"Properties Ranked by Profile {profile_id}", _RANKED_COLUMNS, rows)
 
-        console.print(table)
+
+def _compute_in_subprocess(
+    profile_id: int, stale_only: bool = False, include_breakdown: bool = True,
+) -> int:
+    """ProcessPoolExecutor worker — score one profile with the worker's own app/engine."""
+    with get_app().app_context():
+        from nestscout.services.scoring_service import ScoringService
+        return ScoringService.compute_scores(
+            profile_id, stale_only=stale_only, include_breakdown=include_breakdown,
+        )
 
 
 @scoring_cli.command("recalc")
+@click.option("--workers", default=os.cpu_count() or 1, type=click.IntRange(min=1),
+              help="Profiles scored in parallel (one process each)")
+@_stale_only_option
+@_breakdown_option
 @click.confirmation_option(prompt="Recalculate scores for ALL profiles?")
-def recalculate_all():
+def recalculate_all(workers, stale_only, include_breakdown):
     """Recalculate scores for all active profiles."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from sqlalchemy import select
         from nestscout.extensions import db
         from nestscout.models.search_profile import SearchProfile
         from nestscout.services.scoring_service import ScoringService
 
-        profiles = list(db.session.execute(select(SearchProfile)).scalars())
+        profiles = db.session.execute(select(SearchProfile.id, SearchProfile.name)).all()
 
         if not profiles:
-            console.print("No profiles found.", style="yellow")
+            shared.console.print("No profiles found.", style="yellow")
             return
 
-        total = 0
-        for profile in profiles:
-            count = ScoringService.compute_scores(profile.id)
-            total += count
-            console.print(f"  Profile '{profile.name}' (ID {profile.id}): {count} properties scored")
+        # SQLite allows a single writer, so parallel workers would only queue on its lock
+        if db.engine.dialect.name == "sqlite":
+            workers = 1
+        workers = min(workers, len(profiles))
+        profile_ids = [profile_id for profile_id, _ in profiles]
+
+        if workers == 1:
+            counts = map(
+                functools.partial(
+                    ScoringService.compute_scores,
+                    stale_only=stale_only, include_breakdown=include_breakdown,
+                ),
+                profile_ids,
+            )
+            executor = None
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Child processes must not inherit the parent's pooled connections
+            db.session.remove()
+            db.engine.dispose()
+            executor = ProcessPoolExecutor(max_workers=workers)
+            counts = executor.map(
+                functools.partial(
+                    _compute_in_subprocess,
+                    stale_only=stale_only, include_breakdown=include_breakdown,
+                ),
+                profile_ids,
+            )
 
-        console.print(f"\n✅ Recalculation complete: {total} total scores updated.", style="green")
+        total = 0
+        try:
+            for (profile_id, name), count in zip(profiles, counts):
+                total += count
+                shared.console.print(f"  Profile '{name}' (ID {profile_id}): {count} properties scored")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        shared.console.print(f"\n✅ Recalculation complete: {total} total scores updated.", style="green")
@@ -1,15 +1,19 @@
 """User CLI commands — create and list users."""
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from nestscout.cli._app import get_app
+from nestscout.cli._output import format_option, print_records, print_table
+from nestscout.cli._shared import shared
 
-
-def _get_app():
-    from nestscout import create_app
-    return create_app()
+_USER_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Username", {"style": "green"}),
+    ("Email", {}),
+    ("Role", {"style": "magenta"}),
+    ("Active", {}),
+    ("Created", {}),
+)
 
 
 @click.group("users")
@@ -25,41 +29,39 @@ def users_cli():
 @click.option("--role", type=click.Choice(["user", "contributor", "admin"]), default="user")
 def create_user(username: str, email: str, password: str, role: str):
     """Create a new user account."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.auth_service import AuthService
         try:
             user = AuthService.register(username=username, email=email, password=password, role=role)
-            console.print(f"✅ User created: {user.username} ({user.email}) [role={user.role}]", style="green")
+            shared.console.print(f"✅ User created: {user.username} ({user.email}) [role={user.role}]", style="green")
         except ValueError as e:
-            console.print(f"❌ Error: {e}", style="red")
+            shared.console.print(f"❌ Error: {e}", style="red")
 
 
 @users_cli.command("list")
-def list_users():
+@format_option
+def list_users(fmt):
     """List all registered users."""
-    app = _get_app()
+    app = get_app()
     with app.app_context():
         from nestscout.services.auth_service import AuthService
         users = AuthService.list_users()
 
-        if not users:
-            console.print("No users found.", style="yellow")
+        if fmt != "table":
+            print_records(fmt, [u.to_dict() for u in users])
             return
 
-        table = Table(title="Users")
-        table.add_column("ID", style="cyan")
-        table.add_column("Username", style="green")
-        table.add_column("Email")
-        table.add_column("Role", style="magenta")
-        table.add_column("Active")
-        table.add_column("Created")
+        if not users:
+            shared.console.print("No users found.", style="yellow")
+            return
 
-        for u in users:
-            table.add_row(
+        rows = [
+            (
                 str(u.id), u.username, u.email, u.role,
                 "✓" if u.is_active else "✗",
                 u.created_at.strftime("%Y-%m-%d") if u.created_at else "-",
             )
-
-        console.print(table)
+            for u in users
+        ]
+        print_table("Users", _USER_COLUMNS, rows)
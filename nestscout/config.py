@@ -2,11 +2,19 @@
 
 import os
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
 
-load_dotenv()
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load ``.env`` into the process environment — the file is located and parsed once."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+# Config values below are read from the environment when this module is imported
+load_env()
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -18,13 +26,24 @@ class _BaseConfig:
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "dev-jwt-fallback")
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
+    JWT_ALGORITHM = "HS256"
+    JWT_DECODE_ALGORITHMS = ["HS256"]  # only accept what we sign with
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Reject oversized uploads before they are parsed (413)
+    MAX_CONTENT_LENGTH: int = int(os.getenv("MAX_UPLOAD_MB", "50")) * 1024 * 1024
+
+    # Background job threads per worker process; imports and rescoring get separate pools
+    IMPORT_JOB_WORKERS: int = int(os.getenv("IMPORT_JOB_WORKERS", "2"))
+    SCORING_JOB_WORKERS: int = int(os.getenv("SCORING_JOB_WORKERS", "1"))
+
     # LLM defaults (local-first)
     LLM_BASE_URL: str = os.getenv("LLM_BASE_URL", "http://localhost:11434/v1")
     LLM_API_KEY: str = os.getenv("LLM_API_KEY", "ollama")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "llama3.2")
+    # Seconds a chat request waits for the agent before it is cancelled
+    AI_CHAT_TIMEOUT: float = float(os.getenv("AI_CHAT_TIMEOUT", "300"))
 
 
 class DevelopmentConfig(_BaseConfig):
@@ -44,6 +63,13 @@ class ProductionConfig(_BaseConfig):
     SQLALCHEMY_DATABASE_URI: str = os.getenv(
         "DATABASE_URL", "postgresql://localhost/nestscout"
     )
+    # Per-worker pool sized for parallel agent tools on top of request traffic
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
 
 
 class TestingConfig(_BaseConfig):
@@ -8,6 +8,7 @@ from nestscout.models.search_profile import SearchProfile
 from nestscout.models.scoring import ScoringRule, PropertyScore
 from nestscout.models.data_source import DataSource
 from nestscout.models.associations import PropertyPOIDistance, SavedProperty, PropertyImage
+from nestscout.models.job import BackgroundJob
 
 __all__ = [
     "BaseModel",
@@ -23,4 +24,5 @@ __all__ = [
     "PropertyPOIDistance",
     "SavedProperty",
     "PropertyImage",
+    "BackgroundJob",
 ]
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Float, Text, DateTime, ForeignKey, func
+from sqlalchemy import String, Integer, Float, Text, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from nestscout.extensions import db
@@ -14,9 +14,17 @@ class PropertyPOIDistance(db.Model):
     """Pre-computed distance between a property and a nearby POI."""
 
     __tablename__ = "property_poi_distances"
+    __table_args__ = (
+        # The primary key leads with property_id; nearest-per-category lookups
+        # start from a category's POIs, and carrying distance_m makes them
+        # index-only scans
+        Index("ix_property_poi_distances_poi", "poi_id", "property_id", "distance_m"),
+    )
 
-    property_id: Mapped[int] = mapped_column(ForeignKey("properties.id"), primary_key=True)
-    poi_id: Mapped[int] = mapped_column(ForeignKey("pois.id"), primary_key=True)
+    property_id: Mapped[int] = mapped_column(
+        ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True,
+    )
+    poi_id: Mapped[int] = mapped_column(ForeignKey("pois.id", ondelete="CASCADE"), primary_key=True)
     distance_m: Mapped[float] = mapped_column(Float, nullable=False)
     walk_time_min: Mapped[Optional[float]] = mapped_column(Float)
 
@@ -41,8 +49,10 @@ class SavedProperty(db.Model):
 
     __tablename__ = "saved_properties"
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
-    property_id: Mapped[int] = mapped_column(ForeignKey("properties.id"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    property_id: Mapped[int] = mapped_column(
+        ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True,
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text)
     saved_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False,
@@ -57,7 +67,7 @@ class SavedProperty(db.Model):
             "user_id": self.user_id,
             "property_id": self.property_id,
             "notes": self.notes,
-            "saved_at": self.saved_at.isoformat() if self.saved_at else None,
+            "saved_at": self.saved_at,
         }
 
 
@@ -67,7 +77,9 @@ class PropertyImage(BaseModel):
     __tablename__ = "property_images"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    property_id: Mapped[int] = mapped_column(ForeignKey("properties.id"), index=True, nullable=False)
+    property_id: Mapped[int] = mapped_column(
+        ForeignKey("properties.id", ondelete="CASCADE"), index=True, nullable=False,
+    )
     url: Mapped[str] = mapped_column(String(1000), nullable=False)
     position: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
@@ -1,12 +1,53 @@
 """Base model with timestamp mixin for all entities."""
 
+from collections.abc import Callable
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import JSON, ColumnElement, DateTime, cast, func, literal_column, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import UserDefinedType
 
 from nestscout.extensions import db
 
+# Dict-valued columns: binary JSONB on PostgreSQL (parsed once on write,
+# GIN-indexable), plain JSON text elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class Geography(UserDefinedType):
+    """PostGIS ``geography`` — only ever used in expressions, never as a column type."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: Any) -> str:
+        return "geography"
+
+
+def geography_point(lat: Any, lng: Any) -> ColumnElement:
+    """``ST_MakePoint(lng, lat)`` as a WGS84 geography (PostGIS only).
+
+    Takes columns or plain values; distances between geographies are in metres.
+    The SRID is rendered inline so POI queries match the ``ix_pois_geog`` index expression.
+    """
+    return cast(func.ST_SetSRID(func.ST_MakePoint(lng, lat), literal_column("4326")), Geography())
+
+
+def pg_extension(name: str) -> Callable[..., bool]:
+    """``ddl_if`` condition: emit DDL only on PostgreSQL databases with extension ``name``."""
+
+    def installed(ddl: Any, target: Any, bind: Any, **kw: Any) -> bool:
+        return (
+            bind is not None
+            and bind.dialect.name == "postgresql"
+            and bind.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = :name"), {"name": name},
+            ).first() is not None
+        )
+
+    return installed
+
 
 class TimestampMixin:
     """Adds created_at and updated_at columns to any model."""
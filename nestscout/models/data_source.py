@@ -2,10 +2,10 @@
 
 from typing import Optional
 
-from sqlalchemy import String, Boolean, JSON
+from sqlalchemy import String, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from nestscout.models.base import BaseModel
+from nestscout.models.base import BaseModel, JSONDocument
 
 
 class DataSource(BaseModel):
@@ -16,12 +16,12 @@ class DataSource(BaseModel):
     source_type: Mapped[str] = mapped_column(
         String(20), nullable=False
     )  # scraper | api | manual | csv
-    config: Mapped[Optional[dict]] = mapped_column(JSON)
+    config: Mapped[Optional[dict]] = mapped_column(JSONDocument)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
     properties: Mapped[list["Property"]] = relationship(  # noqa: F821
-        backref="data_source", lazy="dynamic",
+        backref="data_source", passive_deletes=True, lazy="write_only",
     )
 
     def __repr__(self) -> str:
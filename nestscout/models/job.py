@@ -0,0 +1,39 @@
+"""BackgroundJob model — status of work queued off the request thread."""
+
+from typing import Any, Optional
+
+from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from nestscout.models.base import BaseModel, JSONDocument
+
+
+class BackgroundJob(BaseModel):
+    """A queued, running or finished background job (imports, rescoring).
+
+    Stored in the database so that any worker process can answer a status poll.
+    """
+
+    __tablename__ = "background_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)  # import | scoring
+    owner_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), default="queued", nullable=False,
+    )  # queued | running | finished | failed
+    result: Mapped[Optional[Any]] = mapped_column(JSONDocument)
+    error: Mapped[Optional[str]] = mapped_column(Text)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob {self.id} {self.kind} {self.status}>"
+
+    def to_dict(self) -> dict:
+        d = {"id": self.id, "status": self.status}
+        if self.status == "finished":
+            d["result"] = self.result
+        elif self.status == "failed":
+            d["error"] = self.error
+        return d
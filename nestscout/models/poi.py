@@ -2,10 +2,10 @@
 
 from typing import Optional
 
-from sqlalchemy import String, Float, Integer, JSON, ForeignKey
+from sqlalchemy import String, Float, Integer, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from nestscout.models.base import BaseModel
+from nestscout.models.base import BaseModel, JSONDocument, pg_extension
 
 
 class POICategory(BaseModel):
@@ -16,7 +16,7 @@ class POICategory(BaseModel):
     icon: Mapped[Optional[str]] = mapped_column(String(50))
     color: Mapped[Optional[str]] = mapped_column(String(7))  # hex color
 
-    pois: Mapped[list["POI"]] = relationship(back_populates="category", lazy="dynamic")
+    pois: Mapped[list["POI"]] = relationship(back_populates="category", lazy="write_only")
 
     def __repr__(self) -> str:
         return f"<POICategory {self.name}>"
@@ -32,6 +32,18 @@ class POICategory(BaseModel):
 
 class POI(BaseModel):
     __tablename__ = "pois"
+    __table_args__ = (
+        # Bounding-box range scans for proximity search
+        Index("ix_pois_lat_lng", "latitude", "longitude"),
+        Index("ix_pois_category_lat_lng", "category_id", "latitude", "longitude"),
+        # ST_DWithin proximity search with PostGIS — same expression as
+        # geography_point(latitude, longitude), so no PostGIS column type is needed
+        Index(
+            "ix_pois_geog",
+            text("(CAST(ST_SetSRID(ST_MakePoint(longitude, latitude), 4326) AS geography))"),
+            postgresql_using="gist",
+        ).ddl_if(callable_=pg_extension("postgis")),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -42,12 +54,13 @@ class POI(BaseModel):
     longitude: Mapped[Optional[float]] = mapped_column(Float)
     address: Mapped[Optional[str]] = mapped_column(String(500))
     rating: Mapped[Optional[float]] = mapped_column(Float)
-    metadata_extra: Mapped[Optional[dict]] = mapped_column(JSON)
+    metadata_extra: Mapped[Optional[dict]] = mapped_column(JSONDocument, deferred=True)  # loaded on access
 
     # Relationships
     category: Mapped["POICategory"] = relationship(back_populates="pois")
     property_distances: Mapped[list["PropertyPOIDistance"]] = relationship(  # noqa: F821
-        back_populates="poi", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="poi", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="write_only",
     )
 
     def __repr__(self) -> str:
@@ -2,53 +2,84 @@
 
 from typing import Optional
 
-from sqlalchemy import String, Text, Numeric, Integer, Float, JSON, ForeignKey
+from sqlalchemy import String, Text, Numeric, Integer, Float, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from nestscout.models.base import BaseModel
+from nestscout.models.base import BaseModel, JSONDocument, pg_extension
 
 
 class Property(BaseModel):
     __tablename__ = "properties"
+    __table_args__ = (
+        # Partial index backing comparable-property lookups (priced, sized listings
+        # only); cities are matched case-insensitively as lower(city) = lower(:city)
+        Index(
+            "ix_properties_comparables", text("lower(city)"), "operation",
+            postgresql_where=text("price IS NOT NULL AND area_m2 > 0"),
+            sqlite_where=text("price IS NOT NULL AND area_m2 > 0"),
+        ),
+        # Listing filters: operation/price ranges, optionally narrowed by city
+        Index("ix_properties_city_op_price", "city", "operation", "price"),
+        Index("ix_properties_operation_price", "operation", "price"),
+        # City lookups in listing order (newest first); also serves plain city lookups
+        Index("ix_properties_city_id", "city", text("id DESC")),
+        # Substring city search (ILIKE '%…%') can't use a B-tree; trigrams can
+        Index(
+            "ix_properties_city_trgm", "city",
+            postgresql_using="gin", postgresql_ops={"city": "gin_trgm_ops"},
+        ).ddl_if(callable_=pg_extension("pg_trgm")),
+        # Containment (@>) lookups into the source payload; jsonb_path_ops is
+        # several times smaller than the default GIN opclass
+        Index(
+            "ix_properties_raw_metadata_path", "raw_metadata",
+            postgresql_using="gin", postgresql_ops={"raw_metadata": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     external_id: Mapped[Optional[str]] = mapped_column(String(255), unique=True, index=True)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
-    price: Mapped[Optional[float]] = mapped_column(Numeric(12, 2))
+    price: Mapped[Optional[float]] = mapped_column(Numeric(12, 2, asdecimal=False))
     currency: Mapped[str] = mapped_column(String(3), default="EUR", nullable=False)
     operation: Mapped[str] = mapped_column(String(10), default="sale", nullable=False)  # sale|rent
     bedrooms: Mapped[Optional[int]] = mapped_column(Integer)
     bathrooms: Mapped[Optional[int]] = mapped_column(Integer)
     area_m2: Mapped[Optional[float]] = mapped_column(Float)
     address: Mapped[Optional[str]] = mapped_column(String(500))
-    city: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    city: Mapped[Optional[str]] = mapped_column(String(100))
     postal_code: Mapped[Optional[str]] = mapped_column(String(20))
 
     # Location — float columns work everywhere (SQLite + Postgres)
     latitude: Mapped[Optional[float]] = mapped_column(Float)
     longitude: Mapped[Optional[float]] = mapped_column(Float)
 
-    # Flexible metadata from different sources
-    raw_metadata: Mapped[Optional[dict]] = mapped_column(JSON)
+    # Flexible metadata from different sources — can be a whole scraper payload,
+    # so it is only loaded when accessed (or undefer()-ed)
+    raw_metadata: Mapped[Optional[dict]] = mapped_column(JSONDocument, deferred=True)
 
     # Foreign keys
     data_source_id: Mapped[Optional[int]] = mapped_column(
-        ForeignKey("data_sources.id"), index=True
+        ForeignKey("data_sources.id", ondelete="SET NULL"), index=True
     )
 
-    # Relationships
+    # Relationships — child rows go with the property through ON DELETE CASCADE;
+    # write_only collections are never loaded, query them with select() instead
     images: Mapped[list["PropertyImage"]] = relationship(  # noqa: F821
-        back_populates="property", cascade="all, delete-orphan", lazy="selectin",
+        back_populates="property", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="selectin",
     )
     poi_distances: Mapped[list["PropertyPOIDistance"]] = relationship(  # noqa: F821
-        back_populates="property", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="property", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="write_only",
     )
     scores: Mapped[list["PropertyScore"]] = relationship(  # noqa: F821
-        back_populates="property", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="property", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="write_only",
     )
     saved_by: Mapped[list["SavedProperty"]] = relationship(  # noqa: F821
-        back_populates="property", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="property", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="write_only",
     )
 
     def __repr__(self) -> str:
@@ -72,7 +103,7 @@ class Property(BaseModel):
             "latitude": self.latitude,
             "longitude": self.longitude,
             "data_source_id": self.data_source_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
         if include_images:
             result["images"] = [img.to_dict() for img in self.images]
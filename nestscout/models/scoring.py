@@ -3,18 +3,20 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Float, JSON, DateTime, ForeignKey, func
+from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from nestscout.extensions import db
-from nestscout.models.base import BaseModel
+from nestscout.models.base import BaseModel, JSONDocument
 
 
 class ScoringRule(BaseModel):
     __tablename__ = "scoring_rules"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    profile_id: Mapped[int] = mapped_column(ForeignKey("search_profiles.id"), index=True, nullable=False)
+    profile_id: Mapped[int] = mapped_column(
+        ForeignKey("search_profiles.id", ondelete="CASCADE"), index=True, nullable=False,
+    )
 
     rule_type: Mapped[str] = mapped_column(
         String(30), nullable=False
@@ -23,7 +25,7 @@ class ScoringRule(BaseModel):
     poi_category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("poi_categories.id"))
     max_distance_m: Mapped[Optional[float]] = mapped_column(Float)
     weight: Mapped[float] = mapped_column(Float, default=0.1, nullable=False)  # 0.0–1.0
-    parameters: Mapped[Optional[dict]] = mapped_column(JSON)
+    parameters: Mapped[Optional[dict]] = mapped_column(JSONDocument)
 
     # Relationships
     profile: Mapped["SearchProfile"] = relationship(back_populates="scoring_rules")  # noqa: F821
@@ -47,11 +49,19 @@ class PropertyScore(db.Model):
     """Materialised score for a property×profile pair."""
 
     __tablename__ = "property_scores"
+    __table_args__ = (
+        # Ranked listings: ORDER BY total_score DESC within a profile is an index scan
+        Index("ix_scores_profile_total", "profile_id", "total_score"),
+    )
 
-    property_id: Mapped[int] = mapped_column(ForeignKey("properties.id"), primary_key=True)
-    profile_id: Mapped[int] = mapped_column(ForeignKey("search_profiles.id"), primary_key=True)
+    property_id: Mapped[int] = mapped_column(
+        ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True,
+    )
+    profile_id: Mapped[int] = mapped_column(
+        ForeignKey("search_profiles.id", ondelete="CASCADE"), primary_key=True,
+    )
     total_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
-    breakdown: Mapped[Optional[dict]] = mapped_column(JSON)
+    breakdown: Mapped[Optional[dict]] = mapped_column(JSONDocument)
     computed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False,
     )
@@ -69,5 +79,5 @@ class PropertyScore(db.Model):
             "profile_id": self.profile_id,
             "total_score": self.total_score,
             "breakdown": self.breakdown,
-            "computed_at": self.computed_at.isoformat() if self.computed_at else None,
+            "computed_at": self.computed_at,
         }
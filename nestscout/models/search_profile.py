@@ -2,19 +2,28 @@
 
 from typing import Optional
 
-from sqlalchemy import String, Integer, JSON, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from nestscout.models.base import BaseModel
+from nestscout.models.base import BaseModel, JSONDocument
 
 
 class SearchProfile(BaseModel):
     __tablename__ = "search_profiles"
+    __table_args__ = (
+        # Containment (@>) lookups on profile filters
+        Index(
+            "ix_search_profiles_filters_path", "filters",
+            postgresql_using="gin", postgresql_ops={"filters": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True, nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False,
+    )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
-    filters: Mapped[Optional[dict]] = mapped_column(JSON)  # price range, city, etc.
+    filters: Mapped[Optional[dict]] = mapped_column(JSONDocument)  # price range, city, etc.
 
     # Relationships
     user: Mapped["User"] = relationship(back_populates="search_profiles")  # noqa: F821
@@ -22,7 +31,8 @@ class SearchProfile(BaseModel):
         back_populates="profile", cascade="all, delete-orphan", lazy="selectin",
     )
     property_scores: Mapped[list["PropertyScore"]] = relationship(  # noqa: F821
-        back_populates="profile", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="profile", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="write_only",
     )
 
     def __repr__(self) -> str:
@@ -34,7 +44,7 @@ class SearchProfile(BaseModel):
             "user_id": self.user_id,
             "name": self.name,
             "filters": self.filters,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
         if include_rules:
             result["scoring_rules"] = [r.to_dict() for r in self.scoring_rules]
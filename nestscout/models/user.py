@@ -20,10 +20,12 @@ class User(BaseModel):
 
     # Relationships
     search_profiles: Mapped[list["SearchProfile"]] = relationship(  # noqa: F821
-        back_populates="user", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="raise_on_sql",
     )
     saved_properties: Mapped[list["SavedProperty"]] = relationship(  # noqa: F821
-        back_populates="user", cascade="all, delete-orphan", lazy="dynamic",
+        back_populates="user", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="write_only",
     )
 
     def __repr__(self) -> str:
@@ -36,5 +38,5 @@ class User(BaseModel):
             "username": self.username,
             "is_active": self.is_active,
             "role": self.role,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
@@ -1 +1 @@
-"""Marshmallow schemas package."""
+"""Request schemas package — marshmallow, plus msgspec structs for bulk payloads."""
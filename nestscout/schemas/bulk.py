@@ -0,0 +1,63 @@
+"""Bulk import schemas — msgspec structs for the JSON bulk endpoints.
+
+Bulk payloads can hold tens of thousands of records, so they are decoded and
+validated straight from the request body in C rather than field by field in
+marshmallow. The rules mirror ``PropertyCreateSchema`` / ``POICreateSchema``.
+"""
+
+from typing import Annotated, Any, Literal
+
+import msgspec
+from msgspec import UNSET, UnsetType
+
+
+class _Record(msgspec.Struct, forbid_unknown_fields=True):
+    pass
+
+
+class PropertyRecord(_Record):
+    title: Annotated[str, msgspec.Meta(min_length=1, max_length=500)]
+    description: str | UnsetType = UNSET
+    price: float | UnsetType = UNSET
+    currency: Annotated[str, msgspec.Meta(max_length=3)] = "EUR"
+    operation: Literal["sale", "rent"] = "sale"
+    bedrooms: int | UnsetType = UNSET
+    bathrooms: int | UnsetType = UNSET
+    area_m2: float | UnsetType = UNSET
+    address: str | UnsetType = UNSET
+    city: str | UnsetType = UNSET
+    postal_code: str | UnsetType = UNSET
+    latitude: float | UnsetType = UNSET
+    longitude: float | UnsetType = UNSET
+    external_id: str | UnsetType = UNSET
+    raw_metadata: dict[str, Any] | UnsetType = UNSET
+    data_source_id: int | UnsetType = UNSET
+
+
+class POIRecord(_Record):
+    name: Annotated[str, msgspec.Meta(min_length=1, max_length=255)]
+    category_id: int
+    latitude: float | UnsetType = UNSET
+    longitude: float | UnsetType = UNSET
+    address: str | UnsetType = UNSET
+    rating: float | UnsetType = UNSET
+    metadata_extra: dict[str, Any] | UnsetType = UNSET
+
+
+class PropertyBulk(msgspec.Struct, forbid_unknown_fields=True):
+    properties: list[PropertyRecord]
+
+
+class POIBulk(msgspec.Struct, forbid_unknown_fields=True):
+    pois: list[POIRecord]
+
+
+# Decoders compile their schema once; strict=False accepts numeric strings
+# for number fields, as marshmallow does
+property_bulk_decoder = msgspec.json.Decoder(PropertyBulk, strict=False)
+poi_bulk_decoder = msgspec.json.Decoder(POIBulk, strict=False)
+
+
+def to_records(structs: list[msgspec.Struct]) -> list[dict[str, Any]]:
+    """Plain dicts for the services — unset fields are left out, defaults kept."""
+    return msgspec.to_builtins(structs)
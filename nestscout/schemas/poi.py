@@ -17,8 +17,3 @@ class POICreateSchema(Schema):
     address = fields.Str()
     rating = fields.Float()
     metadata_extra = fields.Dict()
-
-
-class POIBulkSchema(Schema):
-    """Validates a list of POIs/businesses for bulk import."""
-    pois = fields.List(fields.Nested(POICreateSchema), required=True)
@@ -1,6 +1,6 @@
 """Property schemas — validation and serialisation."""
 
-from marshmallow import Schema, fields, validate
+from marshmallow import EXCLUDE, Schema, fields, validate
 
 
 class PropertyCreateSchema(Schema):
@@ -22,13 +22,11 @@ class PropertyCreateSchema(Schema):
     data_source_id = fields.Int()
 
 
-class PropertyBulkSchema(Schema):
-    """Validates a list of properties for bulk import."""
-    properties = fields.List(fields.Nested(PropertyCreateSchema), required=True)
-
-
 class PropertyFilterSchema(Schema):
     """Query string filters for property listing."""
+
+    class Meta:
+        unknown = EXCLUDE  # ignore cache-busters and other stray query params
     city = fields.Str()
     operation = fields.Str(validate=validate.OneOf(["sale", "rent"]))
     min_price = fields.Float()
@@ -37,5 +35,7 @@ class PropertyFilterSchema(Schema):
     max_bedrooms = fields.Int()
     min_area = fields.Float()
     max_area = fields.Float()
+    after_id = fields.Int()  # keyset cursor: a previous page's next_cursor
     page = fields.Int(load_default=1)
     per_page = fields.Int(load_default=20, validate=validate.Range(min=1, max=100))
+    include_total = fields.Bool(load_default=True)
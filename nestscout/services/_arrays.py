@@ -0,0 +1,132 @@
+"""Structure-of-arrays loaders — table columns as parallel NumPy arrays.
+
+Vectorised services (scoring, distance rebuilds) work on whole columns at
+once, so rows are loaded straight into arrays instead of ORM objects.
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from sqlalchemy import ColumnElement, select
+
+from nestscout.extensions import db
+from nestscout.models.poi import POI
+from nestscout.models.property import Property
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _float_array(values: Sequence[Any]) -> np.ndarray:
+    """Float64 array with NaN for missing or non-numeric values."""
+    try:
+        # Numeric columns convert in C; only NULLs need replacing
+        return np.fromiter(
+            (np.nan if v is None else v for v in values), dtype=np.float64, count=len(values),
+        )
+    except (TypeError, ValueError):
+        return np.array([_to_float(v) for v in values], dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class PointArray:
+    """Parallel id / latitude / longitude arrays (NaN where a coordinate is missing)."""
+
+    id: np.ndarray
+    lat: np.ndarray
+    lon: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @property
+    def located(self) -> np.ndarray:
+        """Mask of rows with a usable location — a 0/None coordinate counts as missing."""
+        return (np.nan_to_num(self.lat) != 0) & (np.nan_to_num(self.lon) != 0)
+
+
+def _load_columns(
+    model: Any, extra: list[str], where: tuple[ColumnElement, ...], limit: int | None = None,
+) -> list[tuple]:
+    """Select id, coordinates and ``extra`` columns ordered by id, transposed to columns."""
+    columns = model.__table__.c
+    rows = db.session.execute(
+        select(model.id, model.latitude, model.longitude, *(columns[name] for name in extra))
+        .where(*where)
+        .order_by(model.id)
+        .limit(limit)
+    ).all()
+    return list(zip(*rows)) or [()] * (3 + len(extra))
+
+
+@dataclass(frozen=True)
+class PropertyArray(PointArray):
+    """Properties as parallel arrays, plus any requested numeric attribute columns."""
+
+    attrs: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def from_db(
+        cls, *where: ColumnElement, attributes: Iterable[str] = (), limit: int | None = None,
+    ) -> "PropertyArray":
+        """Load properties matching ``where`` (all by default), ordered by id.
+
+        Names in ``attributes`` that aren't Property columns are ignored. With
+        ``limit``, only the first ``limit`` matches are loaded.
+        """
+        attributes = sorted({a for a in attributes if a in Property.__table__.c})
+        ids, lats, lons, *extra = _load_columns(Property, attributes, where, limit)
+        return cls(
+            id=np.array(ids, dtype=np.int64),
+            lat=_float_array(lats),
+            lon=_float_array(lons),
+            attrs={a: _float_array(col) for a, col in zip(attributes, extra)},
+        )
+
+    def take(self, indices: np.ndarray) -> "PropertyArray":
+        """The rows selected by ``indices`` — a mask or ascending positions, to keep id order."""
+        return PropertyArray(
+            id=self.id[indices],
+            lat=self.lat[indices],
+            lon=self.lon[indices],
+            attrs={name: values[indices] for name, values in self.attrs.items()},
+        )
+
+
+@dataclass(frozen=True)
+class POIArray(PointArray):
+    """POIs as parallel arrays."""
+
+    @classmethod
+    def from_db(cls, *where: ColumnElement) -> "POIArray":
+        """Load POIs matching ``where`` (all by default), ordered by id."""
+        ids, lats, lons = _load_columns(POI, [], where)
+        return cls(
+            id=np.array(ids, dtype=np.int64),
+            lat=_float_array(lats),
+            lon=_float_array(lons),
+        )
+
+    @classmethod
+    def by_category(cls, category_ids: Iterable[int]) -> dict[int, "POIArray"]:
+        """Load the POIs of several categories in one query, split per category.
+
+        Categories without POIs are left out of the result.
+        """
+        ids, lats, lons, categories = _load_columns(
+            POI, ["category_id"], (POI.category_id.in_(list(category_ids)),),
+        )
+        ids = np.array(ids, dtype=np.int64)
+        lats, lons = _float_array(lats), _float_array(lons)
+        categories = np.array(categories, dtype=np.int64)
+        result = {}
+        for category_id in np.unique(categories).tolist():
+            rows = categories == category_id
+            result[category_id] = cls(id=ids[rows], lat=lats[rows], lon=lons[rows])
+        return result
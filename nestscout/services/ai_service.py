@@ -1,43 +1,281 @@
 """AI service — wraps the LangChain supervisor agent for Flask integration."""
 
+import asyncio
+import concurrent.futures
+import contextvars
+import queue
+import threading
+from collections import Counter
+from collections.abc import AsyncGenerator, Coroutine, Iterator
 from typing import Any
 
+from flask import current_app
+
+_AI_UNAVAILABLE = (
+    "AI agent not available. Ensure LangChain dependencies are installed "
+    "and LLM_BASE_URL is configured in .env"
+)
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+# In-flight runs of route-cached chats by normalised query, and how many chats
+# await each — only touched on the agent loop
+_inflight: dict[str, asyncio.Task] = {}
+_waiters: Counter[str] = Counter()
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived event loop that runs all agent coroutines.
+
+    The shared async HTTP client keeps connections bound to the loop that
+    opened them, so agents must not run under a fresh ``asyncio.run()`` loop
+    per request.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="nestscout-ai", daemon=True).start()
+        return _loop
+
+
+def _submit(coro: Coroutine) -> concurrent.futures.Future:
+    """Schedule a coroutine on the agent loop, running in a copy of the caller's context.
+
+    Copying the context keeps the Flask app (and request) context available
+    to the agent tools.
+    """
+    loop = _event_loop()
+    ctx = contextvars.copy_context()
+    result: concurrent.futures.Future = concurrent.futures.Future()
+
+    def settle(task: asyncio.Task) -> None:
+        if result.cancelled():
+            return
+        if task.cancelled():
+            result.cancel()
+        elif (exc := task.exception()) is not None:
+            result.set_exception(exc)
+        else:
+            result.set_result(task.result())
+
+    def start() -> None:
+        if result.cancelled():
+            coro.close()
+            return
+        task = loop.create_task(coro, context=ctx)
+        task.add_done_callback(settle)
+        # Cancelling the returned future cancels the task on the loop
+        result.add_done_callback(
+            lambda f: f.cancelled() and loop.call_soon_threadsafe(task.cancel)
+        )
+
+    loop.call_soon_threadsafe(start)
+    return result
+
+
+def _iterate_async(agen: AsyncGenerator) -> Iterator:
+    """Consume an async generator from synchronous code (e.g. a Flask response).
+
+    Closing the returned iterator early — a client disconnecting from a
+    stream — cancels the run and closes ``agen``.
+    """
+    items: queue.Queue = queue.Queue()
+    done = object()
+
+    async def pump() -> None:
+        try:
+            async for item in agen:
+                items.put(item)
+        except Exception as e:  # surfaced to the consumer below
+            items.put(e)
+        finally:
+            await agen.aclose()
+            items.put(done)
+
+    future = _submit(pump())
+    try:
+        while (item := items.get()) is not done:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        future.cancel()
+
+
+async def _achat(supervisor, message: str) -> str:
+    """Answer a chat message on the cheapest path that can handle it.
+
+    1. A cached route for this exact query goes straight to its specialist.
+    2. Otherwise a single structured-output router call picks the specialist
+       (or answers a greeting directly).
+    3. Multi-domain questions, or a router failure, run the full supervisor.
+    """
+    from nestscout.agents.route_cache import lookup_route, remember_route
+    from nestscout.agents.supervisor import ROUTE_TOOLS, create_router
+
+    tools = {t.name: t for t in supervisor.tools}
+
+    route = lookup_route(message)
+    if route in tools:
+        return await tools[route].ainvoke(message)
+
+    try:
+        decision = await create_router().ainvoke({"input": message})
+    except Exception:
+        decision = None  # e.g. a local model without tool calling — use the supervisor
+
+    if decision is not None:
+        if decision.agent == "direct" and decision.reply:
+            return decision.reply
+        tool = tools.get(ROUTE_TOOLS.get(decision.agent, ""))
+        if tool is not None:
+            remember_route(message, [tool.name])
+            return await tool.ainvoke(decision.sub_query or message)
+
+    result = await supervisor.ainvoke({"input": message})
+    remember_route(message, (action.tool for action, _ in result.get("intermediate_steps", [])))
+    return result.get("output", "I couldn't process that request.")
+
+
+async def _achat_coalesced(supervisor, message: str) -> str:
+    """Share one agent run between concurrent chats asking the same question.
+
+    Only queries with a remembered route are shared: those go to a single
+    read-only specialist. Anything else may reach the import specialist, whose
+    side effects every caller must get on their own run.
+    """
+    from nestscout.agents.route_cache import lookup_route
+    from nestscout.utils.cache import query_key
+
+    if lookup_route(message) is None:
+        return await _achat(supervisor, message)
+
+    key = query_key(message)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_achat(supervisor, message))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one caller giving up does not cancel the run for the others;
+    # the last one to give up cancels it
+    _waiters[key] += 1
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        if _waiters[key] == 1:
+            task.cancel()
+        raise
+    finally:
+        _waiters[key] -= 1
+        if not _waiters[key]:
+            del _waiters[key]
+
 
 class AIService:
     """Interface between Flask endpoints and the LangChain agent system."""
 
     @staticmethod
-    def chat(message: str, user_id: int | None = None, context: dict | None = None) -> str:
+    def chat(
+        message: str,
+        user_id: int | None = None,
+        context: dict | None = None,
+        timeout: float | None = None,
+    ) -> str:
         """Send a message to the AI supervisor and get a response.
 
         Args:
             message: User's natural-language query.
             user_id: Optional user ID for personalised context.
             context: Optional additional context (current property, profile, etc.).
+            timeout: Seconds to wait for the agent before giving up and
+                cancelling it; defaults to the ``AI_CHAT_TIMEOUT`` config value.
 
         Returns:
             The AI agent's response string.
         """
+        if timeout is None:
+            timeout = current_app.config["AI_CHAT_TIMEOUT"]
         try:
             from nestscout.agents.supervisor import create_supervisor
             supervisor = create_supervisor()
-            result = supervisor.invoke({"input": message})
-            return result.get("output", "I couldn't process that request.")
+            # The async path lets the executor run several tool calls from a
+            # single LLM turn concurrently (e.g. POI + price specialists).
+            future = _submit(_achat_coalesced(supervisor, message))
+            try:
+                return future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                return f"AI agent error: no response within {timeout:g} seconds"
         except ImportError:
-            return (
-                "AI agent not available. Ensure LangChain dependencies are installed "
-                "and LLM_BASE_URL is configured in .env"
-            )
+            return _AI_UNAVAILABLE
         except Exception as e:
             return f"AI agent error: {str(e)}"
 
+    @staticmethod
+    def stream_chat(message: str, user_id: int | None = None) -> Iterator[dict[str, str]]:
+        """Stream the AI response token by token as it is generated.
+
+        Specialist tokens are forwarded while the sub-agent is still running,
+        so the client sees output before the supervisor's final answer starts.
+
+        Args:
+            message: User's natural-language query.
+            user_id: Optional user ID for personalised context.
+
+        Yields:
+            Dicts with the producing ``agent`` ("supervisor" or the specialist
+            tool name) and the text ``token``.
+        """
+        try:
+            from nestscout.agents.supervisor import create_supervisor
+            supervisor = create_supervisor()
+        except ImportError:
+            yield {"agent": "supervisor", "token": _AI_UNAVAILABLE}
+            return
+
+        async def tokens() -> AsyncGenerator[dict[str, str], None]:
+            tool_runs: dict[str, str] = {}  # run_id -> tool name
+            events = supervisor.astream_events({"input": message}, version="v2")
+            async for event in events:
+                if event["event"] == "on_tool_start":
+                    tool_runs[event["run_id"]] = event["name"]
+                elif event["event"] == "on_chat_model_stream":
+                    token = event["data"]["chunk"].content
+                    if not token:
+                        continue
+                    # parent_ids runs root → leaf; the outermost tool is the specialist
+                    agent = next(
+                        (tool_runs[pid] for pid in event.get("parent_ids", []) if pid in tool_runs),
+                        "supervisor",
+                    )
+                    yield {"agent": agent, "token": token}
+
+        try:
+            yield from _iterate_async(tokens())
+        except Exception as e:
+            yield {"agent": "supervisor", "token": f"AI agent error: {str(e)}"}
+
     @staticmethod
     def search(query: str) -> list[dict[str, Any]]:
         """Perform a natural-language property search.
 
+        Simple queries ("2 bed flats for rent in Madrid under 1,200") are parsed
+        by rules and answered straight from the database; anything the rules
+        can't fully parse goes to the AI agent.
+
         Returns:
-            List of matching property dicts.
+            List of matching property dicts, or a single ``{"response": ...}``
+            with the agent's answer.
         """
-        # For now, delegates to the AI chat with a search-specific prompt
+        from nestscout.utils.search_query import parse_search_query
+
+        filters = parse_search_query(query)
+        if filters is not None:
+            from nestscout.services.property_service import PropertyService
+            return PropertyService.list_properties(**filters, include_total=False)["items"]
+
         response = AIService.chat(f"Search for properties matching: {query}")
         return [{"response": response}]
@@ -1,11 +1,63 @@
 """Auth service — registration, login, JWT token management."""
 
+import hmac
+
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from flask import current_app
 from flask_jwt_extended import create_access_token, create_refresh_token
 from sqlalchemy import select
+from sqlalchemy.orm import raiseload
 
 from nestscout.extensions import db
 from nestscout.models.user import User
+from nestscout.utils.cache import TTLCache
+
+# argon2id at the OWASP minimum (19 MiB, 2 passes): verifies faster than bcrypt at
+# cost 12 for a comparable security target
+_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Verified against when the email is unknown, so a failed login costs the same
+# argon2 round whether or not the account exists
+_DUMMY_HASH = _hasher.hash("nestscout-no-such-user")
+
+# Verification outcomes keyed by an HMAC of (stored hash, password) — never the password
+# itself. The stored hash is part of the key, so a password change invalidates it.
+_checked_passwords = TTLCache(maxsize=4096, ttl=300)
+
+
+def _hash_password(password: str) -> str:
+    return _hasher.hash(password)
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Check against an argon2id hash, or a legacy bcrypt (``$2b$``) one."""
+    if password_hash.startswith("$2"):
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+    try:
+        return _hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _needs_rehash(password_hash: str) -> bool:
+    """Whether a hash is bcrypt or argon2 with outdated parameters."""
+    return password_hash.startswith("$2") or _hasher.check_needs_rehash(password_hash)
+
+
+def _check_password(password: str, password_hash: str) -> bool:
+    """Verify a password, skipped when this exact pair was checked recently."""
+    key = hmac.new(
+        current_app.config["SECRET_KEY"].encode("utf-8"),
+        f"{password_hash}\0{password}".encode("utf-8"),
+        "sha256",
+    ).digest()
+    ok = _checked_passwords.get(key)
+    if ok is None:
+        ok = _verify_password(password, password_hash)
+        _checked_passwords.set(key, ok)
+    return ok
 
 
 class AuthService:
@@ -28,12 +80,10 @@ class AuthService:
                 raise ValueError("Email already registered")
             raise ValueError("Username already taken")
 
-        password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
-
         user = User(
             username=username,
             email=email,
-            password_hash=password_hash,
+            password_hash=_hash_password(password),
             role=role,
         )
         db.session.add(user)
@@ -44,6 +94,10 @@ class AuthService:
     def login(email: str, password: str) -> dict:
         """Authenticate and return JWT tokens.
 
+        A legacy bcrypt (or outdated argon2) hash is replaced with a fresh
+        argon2id one on successful login. An unknown email is checked against
+        a dummy hash, so it takes as long to reject as a wrong password.
+
         Returns:
             Dict with access_token, refresh_token, and user info.
 
@@ -54,12 +108,19 @@ class AuthService:
             select(User).where(User.email == email)
         ).scalar_one_or_none()
 
-        if not user or not bcrypt.checkpw(password.encode("utf-8"), user.password_hash.encode("utf-8")):
+        if user is None:
+            _check_password(password, _DUMMY_HASH)
+            raise ValueError("Invalid email or password")
+        if not _check_password(password, user.password_hash):
             raise ValueError("Invalid email or password")
 
         if not user.is_active:
             raise ValueError("Account is deactivated")
 
+        if _needs_rehash(user.password_hash):
+            user.password_hash = _hash_password(password)
+            db.session.commit()
+
         access_token = create_access_token(
             identity=str(user.id),
             additional_claims={"role": user.role, "username": user.username},
@@ -76,6 +137,22 @@ class AuthService:
     def get_user_by_id(user_id: int) -> User | None:
         return db.session.get(User, user_id)
 
+    @staticmethod
+    def get_user_dict_by_id(user_id: int) -> dict | None:
+        """Fetch only the public user columns as a dict (same shape as ``User.to_dict``).
+
+        Skips ORM hydration and never reads the password hash.
+        """
+        row = db.session.execute(
+            select(User.id, User.email, User.username, User.is_active, User.role, User.created_at)
+            .where(User.id == user_id)
+        ).one_or_none()
+        if row is None:
+            return None
+        return row._asdict()
+
     @staticmethod
     def list_users() -> list[User]:
-        return list(db.session.execute(select(User).order_by(User.id)).scalars())
+        return list(db.session.execute(
+            select(User).options(raiseload("*")).order_by(User.id)
+        ).scalars())
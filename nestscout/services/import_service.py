@@ -1,11 +1,37 @@
 """Import service — CSV/Excel parsing and ingestion pipeline."""
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
 from nestscout.services.property_service import PropertyService
 from nestscout.services.poi_service import POIService
 from nestscout.utils.csv_parser import parse_properties, parse_pois
+from nestscout.utils.db import BULK_CHUNK_SIZE, BulkImportError
+
+
+def _failed(error: BulkImportError) -> dict:
+    """Summary of an import that stopped partway — committed chunks are kept."""
+    return {
+        "success": False,
+        "error": str(error),
+        "total_parsed": error.created + error.skipped,
+        "created": error.created,
+        "skipped": error.skipped,
+    }
+
+
+def _with_defaults(
+    records: Iterable[dict[str, Any]],
+    defaults: dict[str, Any] | None,
+) -> Iterator[dict[str, Any]]:
+    """Fill missing or empty fields of each streamed record from ``defaults``."""
+    for record in records:
+        if defaults:
+            for key, value in defaults.items():
+                if key not in record or not record[key]:
+                    record[key] = value
+        yield record
 
 
 class ImportService:
@@ -15,33 +41,28 @@ class ImportService:
     def import_properties_csv(
         filepath: str | Path,
         defaults: dict[str, Any] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
     ) -> dict:
         """Import properties from a CSV/Excel file.
 
         Args:
             filepath: Path to the file.
             defaults: Default values to apply to all records (e.g. currency, city).
+            chunk_size: Rows inserted and committed per batch.
 
         Returns:
-            Summary dict with counts and any errors.
+            Summary dict with counts and any errors. Chunks are committed as
+            they go, so a failed import reports the rows it already created.
         """
+        records = _with_defaults(parse_properties(filepath), defaults)
         try:
-            records = parse_properties(filepath)
-        except ValueError as e:
-            return {"success": False, "error": str(e), "created": 0, "skipped": 0}
-
-        # Apply defaults
-        if defaults:
-            for record in records:
-                for key, value in defaults.items():
-                    if key not in record or not record[key]:
-                        record[key] = value
-
-        created, skipped = PropertyService.bulk_create(records)
+            created, skipped = PropertyService.bulk_create(records, chunk_size=chunk_size)
+        except BulkImportError as e:
+            return _failed(e)
 
         return {
             "success": True,
-            "total_parsed": len(records),
+            "total_parsed": created + skipped,
             "created": created,
             "skipped": skipped,
         }
@@ -50,33 +71,28 @@ class ImportService:
     def import_pois_csv(
         filepath: str | Path,
         defaults: dict[str, Any] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
     ) -> dict:
         """Import POIs/businesses from a CSV/Excel file.
 
         Args:
             filepath: Path to the file.
             defaults: Default values to apply to all records.
+            chunk_size: Rows inserted and committed per batch.
 
         Returns:
-            Summary dict with counts and any errors.
+            Summary dict with counts and any errors. Chunks are committed as
+            they go, so a failed import reports the rows it already created.
         """
+        records = _with_defaults(parse_pois(filepath), defaults)
         try:
-            records = parse_pois(filepath)
-        except ValueError as e:
-            return {"success": False, "error": str(e), "created": 0, "skipped": 0}
-
-        # Apply defaults
-        if defaults:
-            for record in records:
-                for key, value in defaults.items():
-                    if key not in record or not record[key]:
-                        record[key] = value
-
-        created, skipped = POIService.bulk_create(records)
+            created, skipped = POIService.bulk_create(records, chunk_size=chunk_size)
+        except BulkImportError as e:
+            return _failed(e)
 
         return {
             "success": True,
-            "total_parsed": len(records),
+            "total_parsed": created + skipped,
             "created": created,
             "skipped": skipped,
         }
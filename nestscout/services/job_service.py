@@ -0,0 +1,96 @@
+"""Job service — runs long-running work (e.g. file imports) off the request thread.
+
+Jobs run on thread pools inside the worker process that accepted them; their
+status lives in the ``background_jobs`` table, so any worker can answer a poll.
+A worker that restarts loses the jobs it had queued or running: their rows stay
+"queued"/"running" and spooled upload files are left in the temp directory.
+"""
+
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import delete, update
+
+from nestscout.extensions import db
+from nestscout.models.job import BackgroundJob
+
+# Finished jobs stay pollable for a day
+_JOB_RETENTION = timedelta(days=1)
+
+# One pool per job kind, so imports and rescoring don't queue behind each other.
+# Sized by the IMPORT_JOB_WORKERS / SCORING_JOB_WORKERS config values.
+_executors: dict[str, ThreadPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _get_executor(kind: str) -> ThreadPoolExecutor:
+    with _executor_lock:
+        if kind not in _executors:
+            _executors[kind] = ThreadPoolExecutor(
+                max_workers=current_app.config[f"{kind.upper()}_JOB_WORKERS"],
+                thread_name_prefix=f"nestscout-{kind}",
+            )
+        return _executors[kind]
+
+
+def _set_status(job_id: str, **values: Any) -> None:
+    db.session.execute(update(BackgroundJob).where(BackgroundJob.id == job_id).values(**values))
+    db.session.commit()
+
+
+class JobService:
+    """Background job runner with pollable, per-user status."""
+
+    @staticmethod
+    def submit(
+        kind: str, owner_id: int | None, fn: Callable[..., Any], *args: Any, **kwargs: Any,
+    ) -> str:
+        """Run ``fn(*args, **kwargs)`` on the ``kind`` pool inside the app context.
+
+        Must be called from within an app context. Commits the session.
+
+        Args:
+            kind: "import" or "scoring" — selects the thread pool.
+            owner_id: The user allowed to poll the job.
+
+        Returns:
+            The job ID to poll with :meth:`get`.
+        """
+        app = current_app._get_current_object()
+        job_id = uuid.uuid4().hex
+        cutoff = datetime.now(timezone.utc) - _JOB_RETENTION
+        db.session.execute(
+            delete(BackgroundJob).where(
+                BackgroundJob.status.in_(("finished", "failed")),
+                BackgroundJob.updated_at < cutoff,
+            )
+        )
+        db.session.add(BackgroundJob(id=job_id, kind=kind, owner_id=owner_id, status="queued"))
+        db.session.commit()
+
+        def run() -> None:
+            with app.app_context():
+                _set_status(job_id, status="running")
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    db.session.rollback()
+                    _set_status(job_id, status="failed", error=str(e))
+                    return
+                _set_status(job_id, status="finished", result=result)
+
+        _get_executor(kind).submit(run)
+        return job_id
+
+    @staticmethod
+    def get(job_id: str, owner_id: int) -> dict | None:
+        """Return the job's status dict, or None if unknown, expired or not ``owner_id``'s."""
+        job = db.session.get(BackgroundJob, job_id)
+        if job is None or job.owner_id != owner_id:
+            return None
+        return job.to_dict()
@@ -1,12 +1,96 @@
 """POI service — CRUD, proximity search, bulk operations."""
 
+from collections.abc import Iterable
 from typing import Any
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import joinedload, raiseload
 
 from nestscout.extensions import db
+from nestscout.models.associations import PropertyPOIDistance
+from nestscout.models.base import geography_point
 from nestscout.models.poi import POI, POICategory
-from nestscout.utils.geo import haversine_distance
+from nestscout.models.property import Property
+from nestscout.services._arrays import POIArray, PropertyArray
+from nestscout.utils.cache import TTLCache, data_changed
+from nestscout.utils.db import (
+    BULK_CHUNK_SIZE, BulkImportError, batched, dialect_insert, postgis_enabled, uniform_rows,
+)
+from nestscout.utils.geo import (
+    bounding_box, estimate_walk_time, haversine_distances, pairs_within_radius,
+)
+
+# Exact totals per category filter — a short staleness window spares a COUNT per page
+_count_cache = TTLCache(maxsize=256, ttl=60)
+# Whole listing pages per (category, page, size) — dropped on every POI write
+_page_cache = TTLCache(maxsize=512, ttl=30)
+# Serialised category list — categories change rarely and are invalidated on create
+_categories_cache = TTLCache(maxsize=1, ttl=300)
+
+# Distance rows per INSERT when rebuilding property_poi_distances
+_DISTANCE_CHUNK_SIZE = 10_000
+
+
+def _query_listing(
+    category_id: int | None, after_id: int | None, page: int, per_page: int, include_total: bool,
+) -> dict:
+    """Run list_pois' queries (uncached)."""
+    # Category names come from the same query; anything else would be an N+1
+    stmt = select(POI).options(joinedload(POI.category), raiseload("*"))
+    if category_id:
+        stmt = stmt.where(POI.category_id == category_id)
+
+    # A cursor replaces the offset, and a total would only count what's left
+    keyset = after_id is not None
+    if keyset:
+        stmt = stmt.where(POI.id > after_id)
+    offset = 0 if keyset else (page - 1) * per_page
+    stmt = stmt.order_by(POI.id).offset(offset)
+
+    if keyset or not include_total:
+        items = list(db.session.execute(stmt.limit(per_page + 1)).scalars())
+        has_next = len(items) > per_page
+        return {
+            "items": [p.to_dict() for p in items[:per_page]],
+            "total": None,
+            "page": None if keyset else page,
+            "per_page": per_page,
+            "has_next": has_next,
+            "next_cursor": items[per_page - 1].id if has_next else None,
+        }
+
+    stmt = stmt.limit(per_page)
+    total = _count_cache.get(category_id)
+    if total is not None:
+        items = list(db.session.execute(stmt).scalars())
+    else:
+        # The filtered total rides along as a window column on the page query
+        rows = db.session.execute(stmt.add_columns(func.count().over())).all()
+        items = [poi for poi, _ in rows]
+        if rows:
+            total = rows[0][1]
+        else:  # a page past the end has no row to carry it
+            count_stmt = select(func.count(POI.id))
+            if category_id:
+                count_stmt = count_stmt.where(POI.category_id == category_id)
+            total = db.session.execute(count_stmt).scalar()
+        _count_cache.set(category_id, total)
+    return {
+        "items": [p.to_dict() for p in items],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "has_next": offset + len(items) < total,
+        "next_cursor": items[-1].id if items and offset + len(items) < total else None,
+    }
+
+
+def _listings_changed() -> None:
+    """Drop cached listing pages, totals and agent answers after a write."""
+    _page_cache.clear()
+    _count_cache.clear()
+    data_changed()
 
 
 class POIService:
@@ -26,6 +110,7 @@ class POIService:
         cat = POICategory(name=name, icon=icon, color=color)
         db.session.add(cat)
         db.session.commit()
+        _categories_cache.clear()
         return cat
 
     @staticmethod
@@ -34,6 +119,15 @@ class POIService:
             select(POICategory).order_by(POICategory.name)
         ).scalars())
 
+    @staticmethod
+    def category_dicts() -> list[dict]:
+        """Serialised categories, cached for 5 minutes (cleared when one is created)."""
+        cached = _categories_cache.get("all")
+        if cached is None:
+            cached = [c.to_dict() for c in POIService.list_categories()]
+            _categories_cache.set("all", cached)
+        return cached
+
     # ── POI CRUD ───────────────────────────────────────────────────────
     @staticmethod
     def create(data: dict[str, Any]) -> POI:
@@ -41,39 +135,90 @@ class POIService:
         poi = POI(**data)
         db.session.add(poi)
         db.session.commit()
+        _listings_changed()
         return poi
 
     @staticmethod
-    def bulk_create(records: list[dict[str, Any]]) -> tuple[int, int]:
-        """Bulk-create POIs/businesses from a list of dicts.
+    def bulk_create(
+        records: Iterable[dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> tuple[int, int]:
+        """Bulk-create POIs/businesses from an iterable of dicts, committing per chunk.
+
+        Each chunk is one multi-row INSERT.
 
         If a record contains 'category' (string) instead of 'category_id',
-        the category is auto-resolved or created.
+        the category is auto-resolved or created — per chunk, all unseen
+        names are looked up in one query and the missing ones inserted in one.
 
         Returns:
             Tuple of (created_count, skipped_count).
+
+        Raises:
+            BulkImportError: ``records`` raised ValueError partway through;
+                it carries the counts committed before that.
         """
         created = 0
         skipped = 0
+        category_ids: dict[str, int] = {}
 
-        for record in records:
-            # Resolve category name → category_id
-            cat_name = record.pop("category", None)
-            if cat_name and "category_id" not in record:
-                cat = POIService.get_or_create_category(cat_name)
-                record["category_id"] = cat.id
+        try:
+            for chunk in batched(records, chunk_size):
+                names = {
+                    r["category"] for r in chunk
+                    if r.get("category") and "category_id" not in r
+                }
+                POIService._resolve_categories(names - category_ids.keys(), category_ids)
 
-            if "category_id" not in record:
-                skipped += 1
-                continue
+                new = []
+                for record in chunk:
+                    # Resolve category name → category_id
+                    cat_name = record.pop("category", None)
+                    if cat_name and "category_id" not in record:
+                        record["category_id"] = category_ids[cat_name]
 
-            poi = POI(**record)
-            db.session.add(poi)
-            created += 1
+                    if "category_id" not in record:
+                        skipped += 1
+                        continue
 
-        db.session.commit()
+                    new.append(record)
+
+                if new:
+                    db.session.execute(insert(POI), uniform_rows(POI.__table__, new))
+                    db.session.commit()
+                    created += len(new)
+        except ValueError as e:
+            raise BulkImportError(str(e), created, skipped) from e
+        finally:
+            if created:
+                _listings_changed()
         return created, skipped
 
+    @staticmethod
+    def _resolve_categories(names: set[str], category_ids: dict[str, int]) -> None:
+        """Add the ids of the named categories to ``category_ids``, creating missing ones."""
+        if not names:
+            return
+
+        def lookup(wanted: set[str]) -> None:
+            category_ids.update(db.session.execute(
+                select(POICategory.name, POICategory.id).where(POICategory.name.in_(wanted))
+            ).all())
+
+        lookup(names)
+        missing = names - category_ids.keys()
+        if missing:
+            category_ids.update(db.session.execute(
+                dialect_insert(POICategory)
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(POICategory.name, POICategory.id),
+                [{"name": name} for name in sorted(missing)],
+            ).all())
+            # DO NOTHING returns no row for a name another import created meanwhile
+            if raced := missing - category_ids.keys():
+                lookup(raced)
+            _categories_cache.clear()
+
     @staticmethod
     def get_by_id(poi_id: int) -> POI | None:
         return db.session.get(POI, poi_id)
@@ -81,28 +226,29 @@ class POIService:
     @staticmethod
     def list_pois(
         category_id: int | None = None,
+        after_id: int | None = None,
         page: int = 1,
         per_page: int = 50,
+        include_total: bool = True,
     ) -> dict:
-        """List POIs with optional category filter and pagination."""
-        stmt = select(POI)
-        if category_id:
-            stmt = stmt.where(POI.category_id == category_id)
+        """List POIs with optional category filter and pagination.
 
-        from sqlalchemy import func
-        total = db.session.execute(
-            select(func.count()).select_from(stmt.subquery())
-        ).scalar()
+        With ``include_total=False`` the COUNT query is skipped and
+        ``has_next`` comes from fetching one extra row.
 
-        stmt = stmt.order_by(POI.id).offset((page - 1) * per_page).limit(per_page)
-        items = list(db.session.execute(stmt).scalars())
+        ``next_cursor`` is the id to pass as ``after_id`` for the following
+        page. Cursor (keyset) pages cost the same at any depth, unlike
+        ``page``'s OFFSET; they ignore ``page`` and carry no total.
 
-        return {
-            "items": [p.to_dict() for p in items],
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-        }
+        Pages are cached briefly and dropped on any POI write; the returned
+        dict is shared and must not be mutated.
+        """
+        key = (category_id, after_id, page, per_page, include_total)
+        result = _page_cache.get(key)
+        if result is None:
+            result = _query_listing(category_id, after_id, page, per_page, include_total)
+            _page_cache.set(key, result)
+        return result
 
     @staticmethod
     def find_nearby(
@@ -110,25 +256,164 @@ class POIService:
         lng: float,
         radius_m: float = 1000.0,
         category_id: int | None = None,
+        limit: int | None = None,
     ) -> list[dict]:
-        """Find POIs within a radius of a point (haversine, SQLite-compatible).
+        """Find POIs within a radius of a point.
+
+        With PostGIS, a single ``ST_DWithin`` query backed by the GiST
+        ``ix_pois_geog`` index does the work. Otherwise (SQLite, plain
+        PostgreSQL) the radius' bounding box is applied in SQL (backed by the
+        lat/lng index) and only candidate ids and coordinates are loaded;
+        exact haversine distances are computed in one vectorised pass, and
+        only the POIs that survive the radius and ``limit`` are loaded as objects.
+
+        Args:
+            limit: Return at most this many POIs (the nearest ones).
 
         Returns:
             List of POI dicts with an added 'distance_m' field, sorted by distance.
         """
-        stmt = select(POI).where(POI.latitude.isnot(None), POI.longitude.isnot(None))
+        if postgis_enabled():
+            return POIService._find_nearby_postgis(lat, lng, radius_m, category_id, limit)
+
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_m)
+        where = [
+            POI.latitude.between(min_lat, max_lat),
+            POI.longitude.between(min_lng, max_lng),
+        ]
         if category_id:
-            stmt = stmt.where(POI.category_id == category_id)
+            where.append(POI.category_id == category_id)
 
-        all_pois = list(db.session.execute(stmt).scalars())
-        results = []
+        candidates = POIArray.from_db(*where)
+        if not len(candidates):
+            return []
 
-        for poi in all_pois:
-            dist = haversine_distance(lat, lng, poi.latitude, poi.longitude)
-            if dist <= radius_m:
-                d = poi.to_dict()
-                d["distance_m"] = round(dist, 1)
-                results.append(d)
+        distances = haversine_distances(lat, lng, candidates.lat, candidates.lon)
+        # Nearest first; trim before loading so only kept POIs become objects
+        order = np.argsort(distances, kind="stable")
+        order = order[distances[order] <= radius_m][:limit]
+        if not order.size:
+            return []
+
+        ids = candidates.id[order].tolist()
+        pois = {
+            poi.id: poi
+            for poi in db.session.execute(
+                select(POI)
+                .options(joinedload(POI.category), raiseload("*"))
+                .where(POI.id.in_(ids))
+            ).scalars()
+        }
 
-        results.sort(key=lambda x: x["distance_m"])
+        results = []
+        for poi_id, distance in zip(ids, distances[order].tolist()):
+            d = pois[poi_id].to_dict()
+            d["distance_m"] = round(distance, 1)
+            results.append(d)
         return results
+
+    @staticmethod
+    def _find_nearby_postgis(
+        lat: float, lng: float, radius_m: float, category_id: int | None, limit: int | None,
+    ) -> list[dict]:
+        location = geography_point(POI.latitude, POI.longitude)
+        origin = geography_point(lat, lng)
+        distance = func.ST_Distance(location, origin).label("distance_m")
+        stmt = (
+            select(POI, distance)
+            .options(joinedload(POI.category), raiseload("*"))
+            .where(func.ST_DWithin(location, origin, float(radius_m)))
+            .order_by(distance, POI.id)
+            .limit(limit)
+        )
+        if category_id:
+            stmt = stmt.where(POI.category_id == category_id)
+
+        return [
+            {**poi.to_dict(), "distance_m": round(dist, 1)}
+            for poi, dist in db.session.execute(stmt)
+        ]
+
+    @staticmethod
+    def area_stats(lat: float, lng: float, radius_m: float = 1000.0) -> dict:
+        """Summarise POIs per category around a point.
+
+        A single query pulls only (category, lat, lng) rows inside the radius'
+        bounding box; exact distances and per-category aggregates are then
+        computed in one vectorised pass.
+
+        Returns:
+            Dict with 'total_pois' and 'categories' mapping each category name
+            to its count, average distance and nearest distance (metres).
+        """
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_m)
+        rows = db.session.execute(
+            select(POICategory.name, POI.latitude, POI.longitude)
+            .outerjoin(POICategory, POI.category_id == POICategory.id)
+            .where(
+                POI.latitude.between(min_lat, max_lat),
+                POI.longitude.between(min_lng, max_lng),
+            )
+        ).all()
+
+        if not rows:
+            return {"total_pois": 0, "categories": {}}
+
+        names, lats, lngs = zip(*rows)
+        distances = haversine_distances(lat, lng, np.asarray(lats), np.asarray(lngs))
+        in_range = distances <= radius_m
+        distances = distances[in_range]
+
+        labels, group = np.unique(
+            np.asarray([n or "Unknown" for n in names], dtype=object)[in_range],
+            return_inverse=True,
+        )
+        counts = np.bincount(group, minlength=len(labels))
+        sums = np.bincount(group, weights=distances, minlength=len(labels))
+        nearest = np.full(len(labels), np.inf)
+        np.minimum.at(nearest, group, distances)
+
+        return {
+            "total_pois": int(distances.size),
+            "categories": {
+                str(label): {
+                    "count": int(counts[i]),
+                    "avg_distance": round(float(sums[i] / counts[i]), 1),
+                    "nearest": round(float(nearest[i]), 1),
+                }
+                for i, label in enumerate(labels)
+            },
+        }
+
+    # ── Pre-computed distances ─────────────────────────────────────────
+    @staticmethod
+    def rebuild_property_distances(radius_m: float = 2000.0) -> int:
+        """Recompute the property ↔ POI distance table for pairs within ``radius_m``.
+
+        All pairs are found in one vectorised pass and written with chunked
+        bulk INSERTs, replacing the previous table contents in one transaction.
+
+        Returns:
+            Number of distance rows written.
+        """
+        props = PropertyArray.from_db(Property.latitude.isnot(None), Property.longitude.isnot(None))
+        pois = POIArray.from_db(POI.latitude.isnot(None), POI.longitude.isnot(None))
+
+        prop_idx, poi_idx, distances = pairs_within_radius(
+            props.lat, props.lon, pois.lat, pois.lon, radius_m,
+        )
+        rows = (
+            {"property_id": prop_id, "poi_id": poi_id,
+             "distance_m": round(dist, 1), "walk_time_min": round(estimate_walk_time(dist), 1)}
+            for prop_id, poi_id, dist in zip(
+                props.id[prop_idx].tolist(),
+                pois.id[poi_idx].tolist(),
+                distances.tolist(),
+            )
+        )
+
+        db.session.execute(delete(PropertyPOIDistance))
+        for chunk in batched(rows, _DISTANCE_CHUNK_SIZE):
+            db.session.execute(insert(PropertyPOIDistance), chunk)
+        db.session.commit()
+        return int(distances.size)
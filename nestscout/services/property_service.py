@@ -1,11 +1,179 @@
 """Property service — CRUD, search, bulk operations."""
 
+import csv
+import io
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, bindparam, column, func, select, table
 
 from nestscout.extensions import db
 from nestscout.models.property import Property
+from nestscout.utils.cache import TTLCache, data_changed
+from nestscout.utils.db import (
+    BULK_CHUNK_SIZE, BulkImportError, batched, dialect_insert, uniform_rows,
+)
+from nestscout.utils.serialization import to_json
+
+_STAGING_TABLE = "_property_import"
+
+# Exact totals per filter set — a short staleness window spares a COUNT per page
+_count_cache = TTLCache(maxsize=512, ttl=60)
+# Whole listing pages per (filters, page, size) — dropped on every property write
+_page_cache = TTLCache(maxsize=1024, ttl=30)
+
+# list_properties filters in bitmask order — each predicate binds a parameter
+# of the same name, so one statement serves every call with that filter shape.
+_LIST_FILTERS = (
+    ("city", Property.city.ilike(bindparam("city"))),
+    ("operation", Property.operation == bindparam("operation")),
+    ("min_price", Property.price >= bindparam("min_price")),
+    ("max_price", Property.price <= bindparam("max_price")),
+    ("min_bedrooms", Property.bedrooms >= bindparam("min_bedrooms")),
+    ("max_bedrooms", Property.bedrooms <= bindparam("max_bedrooms")),
+    ("min_area", Property.area_m2 >= bindparam("min_area")),
+    ("max_area", Property.area_m2 <= bindparam("max_area")),
+    # Keyset cursor: the id of the last row on the previous page
+    ("after_id", Property.id < bindparam("after_id")),
+)
+
+# Listings are built straight from these columns (Property.to_dict() without
+# images), so no ORM objects are materialised per row
+_LIST_COLUMNS = (
+    Property.id, Property.external_id, Property.title, Property.description,
+    Property.price, Property.currency, Property.operation, Property.bedrooms,
+    Property.bathrooms, Property.area_m2, Property.address, Property.city,
+    Property.postal_code, Property.latitude, Property.longitude,
+    Property.data_source_id, Property.created_at,
+)
+_LIST_KEYS = tuple(c.key for c in _LIST_COLUMNS)
+
+
+def _listing_dict(row: Row) -> dict:
+    item = dict(zip(_LIST_KEYS, row))
+    item["price"] = float(item["price"]) if item["price"] else None
+    return item
+
+
+@lru_cache(maxsize=1 << len(_LIST_FILTERS))
+def _list_statements(mask: int) -> tuple[Select, Select, Select]:
+    """Build (count, page, counted page) statements for one combination of active filters.
+
+    The counted page carries the filtered total as a trailing ``total`` window
+    column, so a page and its count come from one query.
+    """
+    where = [predicate for i, (_, predicate) in enumerate(_LIST_FILTERS) if mask & (1 << i)]
+
+    def page(*extra: Any) -> Select:
+        return (
+            select(*_LIST_COLUMNS, *extra)
+            .where(*where)
+            .order_by(Property.id.desc())
+            .offset(bindparam("offset"))
+            .limit(bindparam("limit"))
+        )
+
+    count_stmt = select(func.count(Property.id)).where(*where)
+    return count_stmt, page(), page(func.count().over().label("total"))
+
+
+def _query_listing(params: dict[str, Any], page: int, per_page: int, include_total: bool) -> dict:
+    """Run list_properties' queries for bound filter ``params`` (uncached)."""
+    mask = sum(1 << i for i, (name, _) in enumerate(_LIST_FILTERS) if name in params)
+    count_stmt, page_stmt, counted_stmt = _list_statements(mask)
+
+    # A cursor replaces the offset, and a total would only count what's left
+    keyset = "after_id" in params
+    offset = 0 if keyset else (page - 1) * per_page
+    if keyset or not include_total:
+        rows = db.session.execute(
+            page_stmt, {**params, "offset": offset, "limit": per_page + 1},
+        ).all()
+        has_next = len(rows) > per_page
+        return {
+            "items": [_listing_dict(r) for r in rows[:per_page]],
+            "total": None,
+            "page": None if keyset else page,
+            "per_page": per_page,
+            "pages": None,
+            "has_next": has_next,
+            "next_cursor": rows[per_page - 1].id if has_next else None,
+        }
+
+    page_params = {**params, "offset": offset, "limit": per_page}
+    count_key = tuple(sorted(params.items()))
+    total = _count_cache.get(count_key)
+    if total is not None:
+        rows = db.session.execute(page_stmt, page_params).all()
+    else:
+        rows = db.session.execute(counted_stmt, page_params).all()
+        # A page past the end has no row to carry the window total
+        total = rows[0].total if rows else db.session.execute(count_stmt, params).scalar()
+        _count_cache.set(count_key, total)
+
+    return {
+        "items": [_listing_dict(r) for r in rows],
+        "total": total,
+        "page": page,
+        "per_page": per_page,
+        "pages": (total + per_page - 1) // per_page if total else 0,
+        "has_next": offset + len(rows) < total,
+        "next_cursor": rows[-1].id if rows and offset + len(rows) < total else None,
+    }
+
+
+def _listings_changed() -> None:
+    """Drop cached listing pages, totals and agent answers after a write."""
+    _page_cache.clear()
+    _count_cache.clear()
+    data_changed()
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return r"\N"
+    if isinstance(value, (dict, list)):
+        return to_json(value)
+    return value
+
+
+def _copy_insert(rows: list[dict]) -> int:
+    """COPY uniform rows into a staging table, then move them over skipping duplicates.
+
+    COPY can't resolve conflicts itself, so the rows land in a temp table
+    (dropped on commit) and one INSERT ... SELECT ... ON CONFLICT DO NOTHING
+    moves them into ``properties``. PostgreSQL/psycopg2 only.
+
+    Returns:
+        Number of rows inserted.
+    """
+    keys = list(rows[0])  # column names, already validated by uniform_rows()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(row[k]) for k in keys])
+    buffer.seek(0)
+
+    columns = ", ".join(keys)
+    conn = db.session.connection()
+    conn.exec_driver_sql(
+        f"CREATE TEMP TABLE {_STAGING_TABLE} ON COMMIT DROP AS "
+        f"SELECT {columns} FROM {Property.__tablename__} WITH NO DATA"
+    )
+    with conn.connection.dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer,
+        )
+
+    staged = table(_STAGING_TABLE, *(column(k) for k in keys))
+    stmt = (
+        dialect_insert(Property)
+        .from_select(keys, select(staged))
+        .on_conflict_do_nothing(index_elements=[Property.external_id])
+        .returning(Property.id)
+    )
+    return len(conn.execute(stmt).all())
 
 
 class PropertyService:
@@ -17,36 +185,54 @@ class PropertyService:
         prop = Property(**data)
         db.session.add(prop)
         db.session.commit()
+        _listings_changed()
         return prop
 
     @staticmethod
-    def bulk_create(records: list[dict[str, Any]]) -> tuple[int, int]:
-        """Bulk-create properties from a list of dicts.
+    def bulk_create(
+        records: Iterable[dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> tuple[int, int]:
+        """Bulk-create properties from an iterable of dicts, committing per chunk.
 
-        Skips duplicates based on external_id if present.
+        Each chunk is one multi-row INSERT (on PostgreSQL/psycopg2, a COPY
+        into a staging table followed by one INSERT ... SELECT). Duplicates
+        on external_id are skipped by the database (ON CONFLICT DO NOTHING),
+        so no pre-SELECT is needed. ``records`` may be a generator; at most
+        ``chunk_size`` of them are held at a time.
 
         Returns:
             Tuple of (created_count, skipped_count).
+
+        Raises:
+            BulkImportError: ``records`` raised ValueError partway through;
+                it carries the counts committed before that.
         """
+        stmt = (
+            dialect_insert(Property)
+            .on_conflict_do_nothing(index_elements=[Property.external_id])
+            .returning(Property.id)
+        )
+        dialect = db.session.get_bind().dialect
+        use_copy = dialect.name == "postgresql" and dialect.driver == "psycopg2"
         created = 0
         skipped = 0
 
-        for record in records:
-            # Deduplication by external_id
-            ext_id = record.get("external_id")
-            if ext_id:
-                existing = db.session.execute(
-                    select(Property).where(Property.external_id == ext_id)
-                ).scalar_one_or_none()
-                if existing:
-                    skipped += 1
-                    continue
-
-            prop = Property(**record)
-            db.session.add(prop)
-            created += 1
-
-        db.session.commit()
+        try:
+            for chunk in batched(records, chunk_size):
+                rows = uniform_rows(Property.__table__, chunk)
+                if use_copy:
+                    inserted = _copy_insert(rows)
+                else:
+                    inserted = len(db.session.execute(stmt, rows).all())
+                db.session.commit()
+                created += inserted
+                skipped += len(chunk) - inserted
+        except ValueError as e:
+            raise BulkImportError(str(e), created, skipped) from e
+        finally:
+            if created:
+                _listings_changed()
         return created, skipped
 
     @staticmethod
@@ -63,45 +249,77 @@ class PropertyService:
         max_bedrooms: int | None = None,
         min_area: float | None = None,
         max_area: float | None = None,
+        after_id: int | None = None,
         page: int = 1,
         per_page: int = 20,
+        include_total: bool = True,
     ) -> dict:
-        """List properties with optional filters and pagination."""
-        stmt = select(Property)
-
-        if city:
-            stmt = stmt.where(Property.city.ilike(f"%{city}%"))
-        if operation:
-            stmt = stmt.where(Property.operation == operation)
-        if min_price is not None:
-            stmt = stmt.where(Property.price >= min_price)
-        if max_price is not None:
-            stmt = stmt.where(Property.price <= max_price)
-        if min_bedrooms is not None:
-            stmt = stmt.where(Property.bedrooms >= min_bedrooms)
-        if max_bedrooms is not None:
-            stmt = stmt.where(Property.bedrooms <= max_bedrooms)
-        if min_area is not None:
-            stmt = stmt.where(Property.area_m2 >= min_area)
-        if max_area is not None:
-            stmt = stmt.where(Property.area_m2 <= max_area)
-
-        # Count total
-        from sqlalchemy import func
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = db.session.execute(count_stmt).scalar()
-
-        # Paginate
-        stmt = stmt.order_by(Property.id.desc()).offset((page - 1) * per_page).limit(per_page)
-        items = list(db.session.execute(stmt).scalars())
+        """List properties with optional filters and pagination.
 
-        return {
-            "items": [p.to_dict() for p in items],
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-            "pages": (total + per_page - 1) // per_page if total else 0,
+        With ``include_total=False`` the COUNT query is skipped entirely;
+        ``total``/``pages`` are None and ``has_next`` comes from fetching one
+        extra row.
+
+        ``next_cursor`` is the id to pass as ``after_id`` for the following
+        page. Cursor (keyset) pages cost the same at any depth, unlike
+        ``page``'s OFFSET; they ignore ``page`` and carry no total.
+
+        Pages are cached briefly per filter set and dropped on any property
+        write; the returned dict is shared and must not be mutated.
+        """
+        candidates = {
+            "city": f"%{city}%" if city else None,
+            "operation": operation or None,
+            "min_price": min_price,
+            "max_price": max_price,
+            "min_bedrooms": min_bedrooms,
+            "max_bedrooms": max_bedrooms,
+            "min_area": min_area,
+            "max_area": max_area,
+            "after_id": after_id,
         }
+        params = {k: v for k, v in candidates.items() if v is not None}
+        key = (tuple(sorted(params.items())), page, per_page, include_total)
+        result = _page_cache.get(key)
+        if result is None:
+            result = _query_listing(params, page, per_page, include_total)
+            _page_cache.set(key, result)
+        return result
+
+    @staticmethod
+    def sample_comparables(
+        city: str,
+        operation: str,
+        area_m2: float | None = None,
+        area_range: tuple[float, float] | None = None,
+        bedroom_range: tuple[int, int] | None = None,
+        limit: int = 50,
+    ) -> list[Property]:
+        """Return up to ``limit`` priced, sized properties comparable to a target.
+
+        Only listings with a price and a positive area are considered. When
+        ``area_m2`` is given the closest matches by area come first. No count
+        or offset is computed — callers only ever need the top N.
+        """
+        stmt = select(Property).where(
+            # Case-insensitive equality on both sides, so ix_properties_comparables applies
+            func.lower(Property.city) == func.lower(city),
+            Property.operation == operation,
+            Property.price.isnot(None),
+            Property.price > 0,
+            Property.area_m2 > 0,
+        )
+        if area_range is not None:
+            stmt = stmt.where(Property.area_m2.between(*area_range))
+        if bedroom_range is not None:
+            stmt = stmt.where(Property.bedrooms.between(*bedroom_range))
+
+        if area_m2:
+            stmt = stmt.order_by(func.abs(Property.area_m2 - area_m2), Property.id.desc())
+        else:
+            stmt = stmt.order_by(Property.id.desc())
+
+        return list(db.session.execute(stmt.limit(limit)).scalars())
 
     @staticmethod
     def update(property_id: int, data: dict[str, Any]) -> Property | None:
@@ -112,6 +330,7 @@ class PropertyService:
             if hasattr(prop, key):
                 setattr(prop, key, value)
         db.session.commit()
+        _listings_changed()
         return prop
 
     @staticmethod
@@ -121,4 +340,5 @@ class PropertyService:
             return False
         db.session.delete(prop)
         db.session.commit()
+        _listings_changed()
         return True
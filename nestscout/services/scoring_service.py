@@ -10,9 +10,11 @@ Implements the scoring algorithm from DesignDoc §7:
       P.score = (total / weight_sum) × 100
 """
 
-from datetime import datetime, timezone
+import itertools
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import ColumnElement, exists, func, select, true
+from sqlalchemy.orm import raiseload
 
 from nestscout.extensions import db
 from nestscout.models.property import Property
@@ -20,16 +22,187 @@ from nestscout.models.search_profile import SearchProfile
 from nestscout.models.scoring import ScoringRule, PropertyScore
 from nestscout.models.poi import POI
 from nestscout.models.associations import PropertyPOIDistance
-from nestscout.utils.geo import haversine_distance
+from nestscout.models.base import geography_point
+from nestscout.services._arrays import POIArray, PropertyArray
+from nestscout.utils.cache import TTLCache
+from nestscout.utils.db import BULK_CHUNK_SIZE, batched, dialect_insert, postgis_enabled
+from nestscout.utils.geo import counts_within_radius, nearest_distances
+
+# Ranked lists per (profile, score version, limit, offset). compute_scores gives
+# the profile a new version, so a fresh computation is never served stale; the
+# TTL bounds staleness from property edits.
+_ranked_cache = TTLCache(maxsize=256, ttl=60)
+_score_versions: dict[int, int] = {}
+_next_version = itertools.count(1)
+
+# Properties loaded and scored per pass of compute_scores
+_SCORING_CHUNK_SIZE = 20_000
+
+
+def _precomputed_nearest(category_ids: set[int]) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """Per category, (property ids, nearest distance) from property_poi_distances."""
+    rows = db.session.execute(
+        select(
+            POI.category_id, PropertyPOIDistance.property_id,
+            func.min(PropertyPOIDistance.distance_m),
+        )
+        .join(POI, PropertyPOIDistance.poi_id == POI.id)
+        .where(POI.category_id.in_(category_ids))
+        .group_by(POI.category_id, PropertyPOIDistance.property_id)
+    ).all()
+    categories, prop_ids, distances = (
+        np.array(col) for col in (zip(*rows) if rows else ((), (), ()))
+    )
+    return {
+        category_id: (
+            prop_ids[categories == category_id].astype(np.int64),
+            distances[categories == category_id].astype(float),
+        )
+        for category_id in category_ids
+    }
+
+
+def _nearest_postgis(
+    prop_ids: np.ndarray, category_id: int, max_dist: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(property ids, nearest distance) for a category's POIs within ``max_dist``, in PostGIS.
+
+    Each property's nearest POI is a KNN (``<->``) lookup on the ``ix_pois_geog``
+    GiST index; properties with nothing in range are left out.
+    """
+    location = geography_point(POI.latitude, POI.longitude)
+    origin = geography_point(Property.latitude, Property.longitude)
+    nearest = (
+        select(func.ST_Distance(location, origin).label("distance_m"))
+        .where(POI.category_id == category_id, func.ST_DWithin(location, origin, max_dist))
+        .order_by(location.op("<->")(origin))
+        .limit(1)
+        .lateral()
+    )
+    rows = []
+    for chunk in batched(prop_ids.tolist(), BULK_CHUNK_SIZE):
+        rows += db.session.execute(
+            select(Property.id, nearest.c.distance_m)
+            .join(nearest, true())
+            .where(Property.id.in_(chunk))
+        ).all()
+    ids, distances = zip(*rows) if rows else ((), ())
+    return np.array(ids, dtype=np.int64), np.array(distances, dtype=float)
+
+
+class _POICache:
+    """POI coordinates and precomputed distances, loaded once per scoring run."""
+
+    def __init__(self) -> None:
+        self._poi_coords: dict[int, tuple[np.ndarray, np.ndarray] | None] = {}
+        self._precomputed: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def preload(self, rules: list[ScoringRule]) -> None:
+        """Load POI coordinates and precomputed distances for every category the rules use.
+
+        One query for all POIs and one for all precomputed distances, instead
+        of one of each per rule.
+        """
+        proximity = {
+            rule.poi_category_id for rule in rules
+            if rule.rule_type == "poi_proximity" and rule.poi_category_id
+        }
+        categories = proximity | {
+            rule.poi_category_id for rule in rules
+            if rule.rule_type == "poi_density" and rule.poi_category_id
+        }
+        for rule in rules:
+            if rule.rule_type == "walkability":
+                categories.update(
+                    c for c in (rule.parameters or {}).get("categories", []) if isinstance(c, int)
+                )
+
+        if categories:
+            pois_by_category = POIArray.by_category(categories)
+            for category_id in categories:
+                pois = pois_by_category.get(category_id)
+                self._poi_coords[category_id] = (
+                    None if pois is None else (pois.lat[pois.located], pois.lon[pois.located])
+                )
+        if proximity:
+            self._precomputed.update(_precomputed_nearest(proximity))
+
+    def precomputed(self, category_id: int) -> tuple[np.ndarray, np.ndarray]:
+        """(property ids, nearest distance) from property_poi_distances for a category."""
+        if category_id not in self._precomputed:
+            self._precomputed.update(_precomputed_nearest({category_id}))
+        return self._precomputed[category_id]
+
+    def poi_coords(self, category_id: int) -> tuple[np.ndarray, np.ndarray] | None:
+        """Coordinates of the category's located POIs; None if it has no POIs at all."""
+        if category_id not in self._poi_coords:
+            pois = POIArray.from_db(POI.category_id == category_id)
+            if len(pois):
+                located = pois.located
+                self._poi_coords[category_id] = (pois.lat[located], pois.lon[located])
+            else:
+                self._poi_coords[category_id] = None
+        return self._poi_coords[category_id]
+
+
+class _PropertyBatch:
+    """One chunk of the properties being scored, as arrays, with the run's POI cache."""
+
+    def __init__(self, props: PropertyArray, pois: _POICache):
+        self.props = props
+        self.located = props.located
+        self.pois = pois
+        self.poi_coords = pois.poi_coords
+        self.precomputed = pois.precomputed
+
+    def __len__(self) -> int:
+        return len(self.props)
+
+    def take(self, indices: np.ndarray) -> "_PropertyBatch":
+        """A batch of the rows selected by ``indices``, sharing this one's POI cache."""
+        return _PropertyBatch(self.props.take(indices), self.pois)
+
+    def nearest(
+        self, mask: np.ndarray, category_id: int, max_distance_m: float,
+    ) -> np.ndarray | None:
+        """Distance to the nearest POI of a category (inf where none is within ``max_distance_m``).
+
+        None if the category has no POIs at all.
+        """
+        coords = self.poi_coords(category_id)
+        if coords is None:
+            return None
+        nearest = np.full(len(self), np.inf)
+        nearest[mask] = nearest_distances(
+            self.props.lat[mask], self.props.lon[mask], *coords, max_distance_m,
+        )
+        return nearest
 
 
 class ScoringService:
     """Personalised property scoring engine."""
 
     @staticmethod
-    def compute_scores(profile_id: int) -> int:
+    def compute_scores(
+        profile_id: int, stale_only: bool = False, include_breakdown: bool = True,
+    ) -> int:
         """Compute scores for all properties against a given profile.
 
+        Properties are loaded in id order, ``_SCORING_CHUNK_SIZE`` at a time,
+        so memory stays bounded however many there are. Every rule is
+        evaluated for a whole chunk at once on NumPy arrays, and its scores are
+        written with INSERT ... ON CONFLICT DO UPDATE before the next chunk is
+        loaded. Everything is committed once at the end.
+
+        Args:
+            stale_only: Incremental refresh — only score properties with no
+                score yet, or one computed before the property or the
+                profile's rules last changed. POI changes are not tracked;
+                run a full computation after POI imports.
+            include_breakdown: Store the per-rule breakdown with each score.
+                Without it ``breakdown`` is NULL, which skips building a
+                dict per property and rule.
+
         Returns:
             Number of properties scored.
         """
@@ -37,50 +210,92 @@ class ScoringService:
         if not profile or not profile.scoring_rules:
             return 0
 
-        properties = list(db.session.execute(select(Property)).scalars())
-        count = 0
-
-        for prop in properties:
-            score, breakdown = ScoringService._score_property(prop, profile.scoring_rules)
-
-            # Upsert the score
-            existing = db.session.execute(
-                select(PropertyScore).where(
-                    PropertyScore.property_id == prop.id,
-                    PropertyScore.profile_id == profile_id,
-                )
-            ).scalar_one_or_none()
-
-            if existing:
-                existing.total_score = score
-                existing.breakdown = breakdown
-                existing.computed_at = datetime.now(timezone.utc)
-            else:
-                ps = PropertyScore(
-                    property_id=prop.id,
-                    profile_id=profile_id,
-                    total_score=score,
-                    breakdown=breakdown,
-                )
-                db.session.add(ps)
-
-            count += 1
+        rules = profile.scoring_rules
+        where = (~ScoringService._fresh_score(profile_id),) if stale_only else ()
+        attributes = {
+            (rule.parameters or {}).get("attribute")
+            for rule in rules if rule.rule_type == "property_attr"
+        } - {None}
+
+        stmt = dialect_insert(PropertyScore)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PropertyScore.property_id, PropertyScore.profile_id],
+            set_={
+                "total_score": stmt.excluded.total_score,
+                "breakdown": stmt.excluded.breakdown,
+                "computed_at": func.now(),
+            },
+        )
+        pois = _POICache()
+        scored = 0
+        last_id = 0
+        # Keyset chunks: each is its own query, so no cursor stays open across writes
+        while len(props := PropertyArray.from_db(
+            *where, Property.id > last_id, attributes=attributes, limit=_SCORING_CHUNK_SIZE,
+        )):
+            if not scored:
+                pois.preload([rule for rule in rules if rule.weight])
+            batch = _PropertyBatch(props, pois)
+            scores, breakdowns = ScoringService._score_properties(batch, rules, include_breakdown)
+            rows = (
+                {"property_id": prop_id, "profile_id": profile_id,
+                 "total_score": score, "breakdown": breakdown}
+                for prop_id, score, breakdown in zip(props.id.tolist(), scores, breakdowns)
+            )
+            for chunk in batched(rows, BULK_CHUNK_SIZE):
+                db.session.execute(stmt, chunk)
+            scored += len(props)
+            last_id = int(props.id[-1])
 
+        if not scored:
+            return 0
         db.session.commit()
-        return count
+        _score_versions[profile_id] = next(_next_version)
+        return scored
+
+    @staticmethod
+    def _fresh_score(profile_id: int) -> ColumnElement[bool]:
+        """EXISTS clause: the property's score for the profile postdates both it and the rules."""
+        rules_changed = (
+            select(func.max(ScoringRule.updated_at))
+            .where(ScoringRule.profile_id == profile_id)
+            .scalar_subquery()
+        )
+        return exists().where(
+            PropertyScore.property_id == Property.id,
+            PropertyScore.profile_id == profile_id,
+            PropertyScore.computed_at > Property.updated_at,
+            PropertyScore.computed_at > rules_changed,
+        )
 
     @staticmethod
-    def get_ranked_properties(profile_id: int) -> list[dict]:
+    def get_ranked_properties(profile_id: int, limit: int | None = None, offset: int = 0) -> list[dict]:
         """Get properties ranked by their score for a given profile.
 
+        Args:
+            limit: Return at most this many (the best-scored after ``offset``).
+            offset: Skip this many top-ranked properties first.
+
+        Results are cached briefly and replaced as soon as the profile's
+        scores are recomputed; the returned list is shared and must not be
+        mutated.
+
         Returns:
             List of property dicts with score info, sorted descending.
         """
+        key = (profile_id, _score_versions.get(profile_id, 0), limit, offset)
+        cached = _ranked_cache.get(key)
+        if cached is not None:
+            return cached
+
         stmt = (
             select(PropertyScore, Property)
             .join(Property, PropertyScore.property_id == Property.id)
+            .options(raiseload("*"))
             .where(PropertyScore.profile_id == profile_id)
-            .order_by(PropertyScore.total_score.desc())
+            .order_by(PropertyScore.total_score.desc(), PropertyScore.property_id)
+            .offset(offset)
+            .limit(limit)
         )
 
         results = []
@@ -89,170 +304,256 @@ class ScoringService:
             d["score"] = score.to_dict()
             results.append(d)
 
+        _ranked_cache.set(key, results)
         return results
 
     @staticmethod
-    def _score_property(prop: Property, rules: list[ScoringRule]) -> tuple[float, dict]:
-        """Score a single property against scoring rules.
+    def compute_top_k(profile_id: int, k: int) -> list[dict]:
+        """Score the profile's ``k`` best properties live, without storing any scores.
+
+        Rules are evaluated in descending weight order. Every raw value lies
+        in 0–1, so after each rule a property's final total is at most its
+        total so far plus the weight of the rules still to come. Properties
+        whose bound falls below the current k-th best total are dropped, and
+        the remaining rules are evaluated for the survivors only.
 
         Returns:
-            (total_score 0-100, breakdown dict)
+            Property dicts with score info, best first — the same shape as
+            ``get_ranked_properties``, without breakdowns.
         """
-        total = 0.0
-        weight_sum = 0.0
-        breakdown = {}
+        profile = db.session.get(SearchProfile, profile_id)
+        if not profile or k <= 0:
+            return []
 
-        for rule in rules:
-            raw_value = ScoringService._evaluate_rule(rule, prop)
-            total += raw_value * rule.weight
-            weight_sum += rule.weight
-            breakdown[f"rule_{rule.id}_{rule.rule_type}"] = {
-                "raw_value": round(raw_value, 3),
-                "weight": rule.weight,
-                "weighted": round(raw_value * rule.weight, 3),
-            }
-
-        final_score = (total / weight_sum * 100) if weight_sum > 0 else 0.0
-        return round(final_score, 2), breakdown
+        rules = sorted(
+            (rule for rule in profile.scoring_rules if rule.weight),
+            key=lambda rule: rule.weight, reverse=True,
+        )
+        weights = np.array([rule.weight for rule in rules], dtype=np.float64)
+        attributes = {
+            (rule.parameters or {}).get("attribute")
+            for rule in rules if rule.rule_type == "property_attr"
+        } - {None}
+
+        weight_sum = weights.sum()
+        scale = 100 / weight_sum if weight_sum > 0 else 1.0
+
+        pois = _POICache()
+        pois.preload(rules)
+        best_ids = np.empty(0, dtype=np.int64)
+        best_totals = np.empty(0)
+        last_id = 0
+        while len(props := PropertyArray.from_db(
+            Property.id > last_id, attributes=attributes, limit=_SCORING_CHUNK_SIZE,
+        )):
+            rows, totals = ScoringService._top_k_totals(
+                _PropertyBatch(props, pois), rules, weights, k, best_totals, scale,
+            )
+            ids = np.concatenate([best_ids, props.id[rows]])
+            totals = np.concatenate([best_totals, totals])
+            # Same order as the stored ranking: rounded score, then id
+            order = np.lexsort((ids, -np.round(totals * scale, 2)))[:k]
+            best_ids, best_totals = ids[order], totals[order]
+            last_id = int(props.id[-1])
+
+        finals = np.round(best_totals * scale, 2).tolist()
+        found = {
+            prop.id: prop for prop in db.session.scalars(
+                select(Property).options(raiseload("*")).where(Property.id.in_(best_ids.tolist()))
+            )
+        }
+        results = []
+        for prop_id, score in zip(best_ids.tolist(), finals):
+            d = found[prop_id].to_dict()
+            d["score"] = {"property_id": prop_id, "profile_id": profile_id, "total_score": score}
+            results.append(d)
+        return results
+
+    @staticmethod
+    def _top_k_totals(
+        batch: _PropertyBatch, rules: list[ScoringRule], weights: np.ndarray, k: int,
+        best: np.ndarray, scale: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Weighted totals for the batch rows that can still make the top ``k``.
+
+        ``rules`` must be sorted by descending weight; ``best`` holds the top
+        totals found in earlier batches, and ``scale`` turns a total into a
+        0–100 score. Returns (row indices, totals).
+        """
+        rows = np.arange(len(batch))
+        totals = np.zeros(len(batch))
+        # Weight still to come after each rule; negative weights void the bound
+        remaining = weights[::-1].cumsum()[::-1] - weights
+        prune = bool((weights > 0).all())
+        # Scores are ranked rounded to 2 decimals, so anything within 0.01 of
+        # the k-th best may still tie with it and win on id
+        slack = 0.01 / scale
+        for rule, weight, rest in zip(rules, weights.tolist(), remaining.tolist()):
+            if not len(rows):
+                break
+            totals[rows] += ScoringService._evaluate_rule(rule, batch) * weight
+            candidates = np.concatenate([best, totals[rows]])
+            if not prune or rest == 0 or len(candidates) < k:
+                continue
+            kth = np.partition(candidates, -k)[-k]
+            keep = totals[rows] + rest + slack >= kth
+            if not keep.all():
+                rows = rows[keep]
+                batch = batch.take(keep)
+        return rows, totals[rows]
+
+    @staticmethod
+    def _score_properties(
+        batch: _PropertyBatch, rules: list[ScoringRule], include_breakdown: bool = True,
+    ) -> tuple[list[float], list[dict | None]]:
+        """Score every property in the batch against scoring rules.
+
+        Returns:
+            (total scores 0-100, breakdown dicts — all None without
+            ``include_breakdown``), in batch order.
+        """
+        # Zero-weight rules can't move a score — they are neither evaluated nor reported
+        rules = [rule for rule in rules if rule.weight]
+        if not rules:
+            n = len(batch)
+            return [0.0] * n, [{} for _ in range(n)] if include_breakdown else [None] * n
+
+        # (properties × rules) raw values; the weighted total is one mat-vec product
+        raw = np.column_stack([ScoringService._evaluate_rule(rule, batch) for rule in rules])
+        weights = np.array([rule.weight for rule in rules], dtype=np.float64)
+        total = raw @ weights
+        weight_sum = weights.sum()
+        final = total / weight_sum * 100 if weight_sum > 0 else total
+        if not include_breakdown:
+            return np.round(final, 2).tolist(), [None] * len(batch)
+
+        keys = [f"rule_{rule.id}_{rule.rule_type}" for rule in rules]
+        raw_values = np.round(raw, 3).tolist()
+        weighted_values = np.round(raw * weights, 3).tolist()
+        breakdowns = [
+            {key: {"raw_value": r, "weight": rule.weight, "weighted": w}
+             for key, rule, r, w in zip(keys, rules, raw_row, weighted_row)}
+            for raw_row, weighted_row in zip(raw_values, weighted_values)
+        ]
+        return np.round(final, 2).tolist(), breakdowns
 
     @staticmethod
-    def _evaluate_rule(rule: ScoringRule, prop: Property) -> float:
-        """Evaluate a single scoring rule against a property.
+    def _evaluate_rule(rule: ScoringRule, batch: _PropertyBatch) -> np.ndarray:
+        """Evaluate a single scoring rule against every property in the batch.
 
         Returns:
-            A value between 0.0 and 1.0.
+            Array of values between 0.0 and 1.0.
         """
         if rule.rule_type == "poi_proximity":
-            return ScoringService._eval_poi_proximity(rule, prop)
+            return ScoringService._eval_poi_proximity(rule, batch)
         elif rule.rule_type == "poi_density":
-            return ScoringService._eval_poi_density(rule, prop)
+            return ScoringService._eval_poi_density(rule, batch)
         elif rule.rule_type == "property_attr":
-            return ScoringService._eval_property_attr(rule, prop)
+            return ScoringService._eval_property_attr(rule, batch)
         elif rule.rule_type == "walkability":
-            return ScoringService._eval_walkability(rule, prop)
+            return ScoringService._eval_walkability(rule, batch)
         else:
-            return 0.0  # Unknown rule types score 0
+            return np.zeros(len(batch))  # Unknown rule types score 0
 
     @staticmethod
-    def _eval_poi_proximity(rule: ScoringRule, prop: Property) -> float:
+    def _eval_poi_proximity(rule: ScoringRule, batch: _PropertyBatch) -> np.ndarray:
         """Score = 1 - (nearest_distance / max_distance). 0 if none found."""
-        if not prop.latitude or not prop.longitude or not rule.poi_category_id:
-            return 0.0
+        scores = np.zeros(len(batch))
+        if not rule.poi_category_id or not batch.located.any():
+            return scores
 
         max_dist = rule.max_distance_m or 1000.0
-
-        # Check pre-computed distances first
-        stmt = (
-            select(PropertyPOIDistance)
-            .join(POI, PropertyPOIDistance.poi_id == POI.id)
-            .where(
-                PropertyPOIDistance.property_id == prop.id,
-                POI.category_id == rule.poi_category_id,
+        nearest = np.full(len(batch), np.inf)
+
+        # Pre-computed distances first
+        prop_ids, distances = batch.precomputed(rule.poi_category_id)
+        has_precomputed = np.zeros(len(batch), dtype=bool)
+        if len(prop_ids):
+            idx = np.searchsorted(batch.props.id, prop_ids)
+            found = (idx < len(batch)) & (batch.props.id[np.minimum(idx, len(batch) - 1)] == prop_ids)
+            nearest[idx[found]] = distances[found]
+            has_precomputed[idx[found]] = True
+
+        # Fallback: compute the rest on the fly — an indexed KNN lookup under
+        # PostGIS, haversine over the category's POIs otherwise
+        fallback = batch.located & ~has_precomputed
+        if fallback.any() and postgis_enabled():
+            prop_ids, distances = _nearest_postgis(
+                batch.props.id[fallback], rule.poi_category_id, max_dist,
             )
-            .order_by(PropertyPOIDistance.distance_m)
-            .limit(1)
-        )
-        nearest = db.session.execute(stmt).scalar_one_or_none()
-
-        if nearest:
-            if nearest.distance_m > max_dist:
-                return 0.0
-            return max(0.0, 1.0 - (nearest.distance_m / max_dist))
-
-        # Fallback: compute on the fly with haversine
-        pois = list(db.session.execute(
-            select(POI).where(POI.category_id == rule.poi_category_id)
-        ).scalars())
+            nearest[np.searchsorted(batch.props.id, prop_ids)] = distances
+        elif fallback.any():
+            computed = batch.nearest(fallback, rule.poi_category_id, max_dist)
+            if computed is not None:
+                nearest[fallback] = computed[fallback]
 
-        if not pois:
-            return 0.0
-
-        min_dist = min(
-            haversine_distance(prop.latitude, prop.longitude, p.latitude, p.longitude)
-            for p in pois if p.latitude and p.longitude
-        )
-
-        if min_dist > max_dist:
-            return 0.0
-        return max(0.0, 1.0 - (min_dist / max_dist))
+        scores[batch.located] = np.clip(1.0 - nearest[batch.located] / max_dist, 0.0, None)
+        return scores
 
     @staticmethod
-    def _eval_poi_density(rule: ScoringRule, prop: Property) -> float:
+    def _eval_poi_density(rule: ScoringRule, batch: _PropertyBatch) -> np.ndarray:
         """Score = min(count / target_count, 1.0)."""
-        if not prop.latitude or not prop.longitude or not rule.poi_category_id:
-            return 0.0
+        scores = np.zeros(len(batch))
+        if not rule.poi_category_id or not batch.located.any():
+            return scores
 
         params = rule.parameters or {}
         radius = rule.max_distance_m or 1000.0
         target_count = params.get("target_count", 5)
 
-        pois = list(db.session.execute(
-            select(POI).where(POI.category_id == rule.poi_category_id)
-        ).scalars())
+        coords = batch.poi_coords(rule.poi_category_id)
+        if coords is None or not len(coords[0]):
+            return scores
 
-        count = sum(
-            1 for p in pois
-            if p.latitude and p.longitude
-            and haversine_distance(prop.latitude, prop.longitude, p.latitude, p.longitude) <= radius
+        located = batch.located
+        counts = counts_within_radius(
+            batch.props.lat[located], batch.props.lon[located], *coords, radius,
         )
-
-        return min(count / target_count, 1.0)
+        scores[located] = np.minimum(counts / target_count, 1.0)
+        return scores
 
     @staticmethod
-    def _eval_property_attr(rule: ScoringRule, prop: Property) -> float:
+    def _eval_property_attr(rule: ScoringRule, batch: _PropertyBatch) -> np.ndarray:
         """Score based on how close a property attribute is to the user's ideal."""
+        scores = np.zeros(len(batch))
         params = rule.parameters or {}
         attr_name = params.get("attribute")
         ideal = params.get("ideal")
         tolerance = params.get("tolerance", 0)
 
-        if not attr_name or ideal is None:
-            return 0.0
-
-        actual = getattr(prop, attr_name, None)
-        if actual is None:
-            return 0.0
+        actual = batch.props.attrs.get(attr_name)
+        if actual is None or ideal is None:
+            return scores
 
         try:
-            actual = float(actual)
             ideal = float(ideal)
             tolerance = float(tolerance)
         except (ValueError, TypeError):
-            return 0.0
+            return scores
 
+        known = ~np.isnan(actual)
         if tolerance == 0:
-            return 1.0 if actual == ideal else 0.0
-
-        diff = abs(actual - ideal)
-        return max(0.0, 1.0 - (diff / tolerance))
+            scores[known] = actual[known] == ideal
+        else:
+            scores[known] = np.clip(1.0 - np.abs(actual[known] - ideal) / tolerance, 0.0, None)
+        return scores
 
     @staticmethod
-    def _eval_walkability(rule: ScoringRule, prop: Property) -> float:
+    def _eval_walkability(rule: ScoringRule, batch: _PropertyBatch) -> np.ndarray:
         """Composite walkability score across multiple POI categories."""
-        if not prop.latitude or not prop.longitude:
-            return 0.0
-
+        scores = np.zeros(len(batch))
         params = rule.parameters or {}
         categories = params.get("categories", [])
         max_dist = rule.max_distance_m or 1000.0
 
-        if not categories:
-            return 0.0
+        if not categories or not batch.located.any():
+            return scores
 
-        scores = []
         for cat_id in categories:
-            pois = list(db.session.execute(
-                select(POI).where(POI.category_id == cat_id)
-            ).scalars())
-
-            if not pois:
-                scores.append(0.0)
-                continue
-
-            min_dist = min(
-                haversine_distance(prop.latitude, prop.longitude, p.latitude, p.longitude)
-                for p in pois if p.latitude and p.longitude
-            )
-            scores.append(max(0.0, 1.0 - (min_dist / max_dist)))
+            nearest = batch.nearest(batch.located, cat_id, max_dist)
+            if nearest is not None:
+                scores += np.clip(1.0 - nearest / max_dist, 0.0, None)
 
-        return sum(scores) / len(scores) if scores else 0.0
+        scores /= len(categories)
+        scores[~batch.located] = 0.0
+        return scores
@@ -0,0 +1,77 @@
+"""In-process caching helpers — TTL caches, query-key normalisation, write invalidation."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used is evicted first.
+        ttl: Entry lifetime in seconds, or None for entries that never expire.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry if full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Caches of answers derived from listing/POI data — registered by their owners
+# (e.g. the agents, which services can't import) and cleared on every write
+_data_caches: list[TTLCache] = []
+
+
+def data_cache(maxsize: int = 1024, ttl: float | None = 300.0) -> TTLCache:
+    """A TTLCache that :func:`data_changed` clears."""
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    _data_caches.append(cache)
+    return cache
+
+
+def data_changed() -> None:
+    """Clear every :func:`data_cache` — call after properties or POIs are written."""
+    for cache in _data_caches:
+        cache.clear()
+
+
+def query_key(query: str) -> str:
+    """Hash a natural-language query after case and whitespace normalisation."""
+    normalised = " ".join(query.lower().split())
+    return hashlib.blake2b(normalised.encode("utf-8"), digest_size=16).hexdigest()
@@ -1,10 +1,15 @@
-"""CSV/Excel parser for bulk import of properties and POIs."""
+"""CSV/Excel parser for bulk import of properties and POIs.
 
+Rows are streamed one at a time so an import never holds the whole file in memory.
+"""
+
+import codecs
+import csv
+from collections.abc import Callable, Iterator
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
-
 
 # Default column mappings — keys are our internal field names, values are common CSV column names
 PROPERTY_COLUMN_ALIASES: dict[str, list[str]] = {
@@ -34,98 +39,193 @@ POI_COLUMN_ALIASES: dict[str, list[str]] = {
 }
 
 
-def _resolve_columns(df: pd.DataFrame, aliases: dict[str, list[str]]) -> dict[str, str]:
-    """Map CSV columns to internal field names using aliases.
+def _to_int(value: Any) -> int:
+    return int(float(value))
+
+
+# CSV cells arrive as text; numeric fields are coerced, everything else is kept as str
+_FIELD_TYPES: dict[str, Callable[[Any], Any]] = {
+    "price": float,
+    "bedrooms": _to_int,
+    "bathrooms": _to_int,
+    "area_m2": float,
+    "latitude": float,
+    "longitude": float,
+    "rating": float,
+}
+
+# Latin-1 decodes any byte sequence, so it is the fallback for non-UTF-8 files
+_FALLBACK_ENCODING = "latin-1"
+
+# CSVs above this size are tokenised with PyArrow (when installed) in large blocks
+_ARROW_MIN_BYTES = 10 * 1024 * 1024
+_ARROW_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+def _alias_index(aliases: dict[str, list[str]]) -> dict[str, tuple[str, int]]:
+    """Invert an alias map to ``{alias_lower: (field, priority)}`` (lower priority wins)."""
+    index: dict[str, tuple[str, int]] = {}
+    for field, possible_names in aliases.items():
+        for rank, alias in enumerate(possible_names):
+            index.setdefault(alias.lower(), (field, rank))
+    return index
+
+
+_PROPERTY_ALIAS_INDEX = _alias_index(PROPERTY_COLUMN_ALIASES)
+_POI_ALIAS_INDEX = _alias_index(POI_COLUMN_ALIASES)
+
+
+def _resolve_columns(columns: list[str], index: dict[str, tuple[str, int]]) -> dict[str, str]:
+    """Map CSV columns to internal field names in one pass over the columns.
+
+    When several columns alias the same field, the alias listed first wins.
 
     Returns:
         Dict mapping internal_field -> actual_csv_column_name.
     """
-    df_cols_lower = {c.lower().strip(): c for c in df.columns}
-    mapping = {}
+    best: dict[str, tuple[int, str]] = {}
+    for column in columns:
+        if column is None:
+            continue
+        match = index.get(str(column).lower().strip())
+        if match is not None:
+            field, rank = match
+            if field not in best or rank <= best[field][0]:
+                best[field] = (rank, column)
+    return {field: column for field, (_, column) in best.items()}
+
+
+def _detect_encoding(filepath: Path) -> str:
+    """Return "utf-8" if the whole file is valid UTF-8, else the Latin-1 fallback.
+
+    The file is read once, as bytes, through an incremental decoder that
+    stops at the first invalid sequence.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(filepath, "rb") as fh:
+            while chunk := fh.read(1 << 20):
+                decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return _FALLBACK_ENCODING
+    return "utf-8"
+
+
+def _iter_csv_arrow(filepath: Path, encoding: str) -> Iterator[dict[str, Any]]:
+    """Stream a CSV through PyArrow's block reader, one record batch at a time.
+
+    Every column is read as text so values are coerced the same way as on the
+    csv.DictReader path (and a column's type can't flip between blocks).
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
 
-    for field, possible_names in aliases.items():
-        for alias in possible_names:
-            if alias.lower() in df_cols_lower:
-                mapping[field] = df_cols_lower[alias.lower()]
-                break
+    with open(filepath, encoding=encoding, newline="") as fh:
+        header = next(csv.reader(fh), [])
 
-    return mapping
+    reader = pacsv.open_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(block_size=_ARROW_BLOCK_SIZE, encoding=encoding),
+        convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header}),
+    )
+    for batch in reader:
+        yield from batch.to_pylist()
 
 
-def parse_file(filepath: str | Path) -> pd.DataFrame:
-    """Read a CSV or Excel file into a DataFrame.
+def iter_rows(filepath: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream a CSV or Excel file as ``{column: value}`` dicts.
 
-    Supports: .csv, .xlsx, .xls
+    Supports: .csv, .xlsx, .xls (``.xls`` has no streaming reader and is read whole)
     """
     filepath = Path(filepath)
+    suffix = filepath.suffix.lower()
 
-    if filepath.suffix.lower() in (".xlsx", ".xls"):
-        return pd.read_excel(filepath)
-    elif filepath.suffix.lower() == ".csv":
-        # Try common encodings
-        for encoding in ("utf-8", "latin-1", "cp1252"):
+    if suffix == ".csv":
+        encoding = _detect_encoding(filepath)
+        if filepath.stat().st_size > _ARROW_MIN_BYTES:
             try:
-                return pd.read_csv(filepath, encoding=encoding)
-            except UnicodeDecodeError:
-                continue
-        raise ValueError(f"Could not decode CSV file: {filepath}")
+                yield from _iter_csv_arrow(filepath, encoding)
+                return
+            except ImportError:
+                pass
+        with open(filepath, encoding=encoding, newline="") as fh:
+            yield from csv.DictReader(fh)
+    elif suffix == ".xlsx":
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, ())
+            for values in rows:
+                yield dict(zip(header, values))
+        finally:
+            workbook.close()
+    elif suffix == ".xls":
+        import pandas as pd
+
+        yield from pd.read_excel(filepath).to_dict("records")
     else:
         raise ValueError(f"Unsupported file format: {filepath.suffix}")
 
 
-def parse_properties(filepath: str | Path) -> list[dict[str, Any]]:
-    """Parse a CSV/Excel file into a list of property dicts.
-
-    Automatically maps common column name variations to internal fields.
-
-    Returns:
-        List of dicts ready for PropertyService.bulk_create().
-    """
-    df = parse_file(filepath)
-    col_map = _resolve_columns(df, PROPERTY_COLUMN_ALIASES)
+def _iter_records(
+    filepath: str | Path,
+    index: dict[str, tuple[str, int]],
+    keep: Callable[[dict[str, Any]], bool],
+) -> Iterator[dict[str, Any]]:
+    """Stream mapped, type-coerced records; rows failing ``keep`` are dropped."""
+    rows = iter_rows(filepath)
+    first = next(rows, None)
+    if first is None:
+        return
 
+    col_map = _resolve_columns(list(first), index)
     if not col_map:
+        fields = list(dict.fromkeys(field for field, _ in index.values()))
         raise ValueError(
-            f"Could not map any columns. Found: {list(df.columns)}. "
-            f"Expected at least one of: {list(PROPERTY_COLUMN_ALIASES.keys())}"
+            f"Could not map any columns. Found: {list(first)}. "
+            f"Expected at least one of: {fields}"
         )
 
-    records = []
-    for _, row in df.iterrows():
+    for raw in chain((first,), rows):
         record = {}
         for field, csv_col in col_map.items():
-            val = row.get(csv_col)
-            if pd.notna(val):
-                record[field] = val
-        if record.get("title") or record.get("address"):
-            records.append(record)
+            val = raw.get(csv_col)
+            if isinstance(val, str):
+                val = val.strip()
+            if val is None or val == "" or val != val:  # val != val catches NaN
+                continue
+            try:
+                record[field] = _FIELD_TYPES.get(field, str)(val)
+            except (TypeError, ValueError):
+                continue
+        if keep(record):
+            yield record
 
-    return records
 
+def parse_properties(filepath: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream a CSV/Excel file as property dicts.
 
-def parse_pois(filepath: str | Path) -> list[dict[str, Any]]:
-    """Parse a CSV/Excel file into a list of POI/business dicts.
+    Automatically maps common column name variations to internal fields.
+    Raises ValueError (on first iteration) if no column can be mapped.
 
-    Returns:
-        List of dicts ready for POIService.bulk_create().
+    Yields:
+        Dicts ready for PropertyService.bulk_create().
     """
-    df = parse_file(filepath)
-    col_map = _resolve_columns(df, POI_COLUMN_ALIASES)
+    return _iter_records(
+        filepath, _PROPERTY_ALIAS_INDEX,
+        keep=lambda r: bool(r.get("title") or r.get("address")),
+    )
 
-    if not col_map:
-        raise ValueError(
-            f"Could not map any columns. Found: {list(df.columns)}. "
-            f"Expected at least one of: {list(POI_COLUMN_ALIASES.keys())}"
-        )
 
-    records = []
-    for _, row in df.iterrows():
-        record = {}
-        for field, csv_col in col_map.items():
-            val = row.get(csv_col)
-            if pd.notna(val):
-                record[field] = val
-        if record.get("name"):
-            records.append(record)
+def parse_pois(filepath: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream a CSV/Excel file as POI/business dicts.
 
-    return records
+    Raises ValueError (on first iteration) if no column can be mapped.
+
+    Yields:
+        Dicts ready for POIService.bulk_create().
+    """
+    return _iter_records(filepath, _POI_ALIAS_INDEX, keep=lambda r: bool(r.get("name")))
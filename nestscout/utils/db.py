@@ -0,0 +1,95 @@
+"""Database helpers shared outside the request cycle."""
+
+import functools
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, ParamSpec, TypeVar
+
+from flask import current_app
+from sqlalchemy import Insert, Table, text
+
+from nestscout.extensions import db
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+# Rows per INSERT/commit in bulk imports
+BULK_CHUNK_SIZE = 5000
+
+# PostGIS availability per database URL, probed once per process
+_postgis: dict[str, bool] = {}
+
+
+class BulkImportError(ValueError):
+    """A streamed bulk import failed partway through.
+
+    Chunks are committed as they go, so ``created``/``skipped`` count the rows
+    already committed before the failure — those stay in the database.
+    """
+
+    def __init__(self, message: str, created: int, skipped: int):
+        super().__init__(message)
+        self.created = created
+        self.skipped = skipped
+
+
+def own_session(fn: Callable[P, R]) -> Callable[P, R]:
+    """Run ``fn`` inside a fresh app context, and therefore its own DB session.
+
+    Flask-SQLAlchemy scopes sessions per app context. Agent tools run
+    concurrently on executor threads that share the caller's app context,
+    so without this they would share one (non-thread-safe) Session. The
+    session is removed — and its connection returned to the pool — as soon
+    as ``fn`` returns.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with current_app.app_context():
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield successive lists of up to ``size`` items (chunked bulk writes)."""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def dialect_insert(model: Any) -> Insert:
+    """INSERT for ``model`` from the bound dialect, so ON CONFLICT clauses are available.
+
+    PostgreSQL and SQLite are the supported backends.
+    """
+    if db.session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
+
+
+def postgis_enabled() -> bool:
+    """Whether the bound database is PostgreSQL with the PostGIS extension installed."""
+    bind = db.session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    key = str(bind.url)
+    if key not in _postgis:
+        _postgis[key] = db.session.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")
+        ).first() is not None
+    return _postgis[key]
+
+
+def uniform_rows(table: Table, rows: list[dict]) -> list[dict]:
+    """Give every row the same keys, as an executemany INSERT requires.
+
+    Keys missing from a row take the column's scalar Python default, else NULL.
+    """
+    fill = {}
+    for key in set().union(*rows):
+        default = table.c[key].default
+        fill[key] = default.arg if default is not None and default.is_scalar else None
+    return [{**fill, **row} for row in rows]
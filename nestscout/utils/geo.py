@@ -1,6 +1,18 @@
 """Geo utilities — haversine distance for SQLite dev mode."""
 
 import math
+from collections.abc import Iterator
+
+import numpy as np
+
+_EARTH_RADIUS_M = 6_371_000
+# Degree length on the haversine sphere (not WGS84's 111 320 m), so a bounding
+# box is never tighter than the haversine radius it stands in for
+_METRES_PER_DEGREE = _EARTH_RADIUS_M * math.pi / 180
+# Rows per block when the NumPy fallback materialises a distance matrix
+_PAIRS_BLOCK = 1024
+# Fewest targets worth the Numba kernel's thread start-up in haversine_distances
+_KERNEL_MIN_POINTS = 4096
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -16,7 +28,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in metres.
     """
-    R = 6_371_000  # Earth radius in metres
+    R = _EARTH_RADIUS_M
 
     phi1 = math.radians(lat1)
     phi2 = math.radians(lat2)
@@ -32,6 +44,248 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def haversine_distances(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorised haversine — distances (in metres) from one point to many.
+
+    Args:
+        lat, lon: Coordinates of the origin (decimal degrees).
+        lats, lons: Arrays of target coordinates (decimal degrees).
+
+    Uses a parallel Numba kernel for large 1-D inputs when Numba is installed.
+
+    Returns:
+        Array of distances in metres, same shape as ``lats``.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if lats.ndim == 1 and lats.size >= _KERNEL_MIN_POINTS:
+        try:
+            from nestscout.utils.geo_kernels import haversine_distances as kernel
+        except ImportError:
+            pass
+        else:
+            return kernel(float(lat), float(lon), lats, lons)
+
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(lons) - math.radians(lon)
+
+    a = np.sin(delta_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    return _EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_matrix(
+    lats1: np.ndarray, lons1: np.ndarray, lats2: np.ndarray, lons2: np.ndarray,
+) -> np.ndarray:
+    """Vectorised haversine — pairwise distances (in metres) between two point sets.
+
+    Returns:
+        ``(len(lats1), len(lats2))`` array of distances in metres.
+    """
+    phi1 = np.radians(lats1)[:, None]
+    phi2 = np.radians(lats2)[None, :]
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(lons2)[None, :] - np.radians(lons1)[:, None]
+
+    a = np.sin(delta_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    return _EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def pairs_within_radius(
+    lats1: np.ndarray, lons1: np.ndarray, lats2: np.ndarray, lons2: np.ndarray, radius_m: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find every (point in set 1, point in set 2) pair at most ``radius_m`` apart.
+
+    Uses a parallel Numba kernel when Numba is installed, otherwise blocked
+    NumPy distance matrices (never more than ``_PAIRS_BLOCK`` rows at once,
+    each against only the points inside its bounding box). Pairs come back
+    in no particular order.
+
+    Returns:
+        ``(indices into set 1, indices into set 2, distances in metres)``.
+    """
+    lats1, lons1, lats2, lons2 = (
+        np.asarray(a, dtype=np.float64) for a in (lats1, lons1, lats2, lons2)
+    )
+
+    try:
+        from nestscout.utils.geo_kernels import pairs_within_radius as kernel
+    except ImportError:
+        pass
+    else:
+        return kernel(lats1, lons1, lats2, lons2, float(radius_m))
+
+    rows, cols, dist = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)], [np.empty(0)]
+    for idx1, idx2 in _candidates_in_bbox(lats1, lons1, lats2, lons2, radius_m):
+        block = haversine_matrix(lats1[idx1], lons1[idx1], lats2[idx2], lons2[idx2])
+        i, j = np.nonzero(block <= radius_m)
+        rows.append(idx1[i])
+        cols.append(idx2[j])
+        dist.append(block[i, j])
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(dist)
+
+
+def _candidates_in_bbox(
+    lats1: np.ndarray, lons1: np.ndarray, lats2: np.ndarray, lons2: np.ndarray, radius_m: float,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield (set-1 indices, set-2 indices) blocks that can hold pairs within ``radius_m``.
+
+    Set 1 is taken in latitude order, ``_PAIRS_BLOCK`` points at a time; each
+    block gets only the set-2 points inside its bounding box (a latitude band
+    found by binary search, then a longitude mask), so haversine runs on
+    candidates only. Blocks with no candidates are skipped.
+    """
+    order1 = np.argsort(lats1, kind="stable")
+    if not math.isfinite(radius_m):
+        everything = np.arange(len(lats2))
+        for start in range(0, len(lats1), _PAIRS_BLOCK):
+            yield order1[start:start + _PAIRS_BLOCK], everything
+        return
+
+    dlat = radius_m / _METRES_PER_DEGREE
+    order2 = np.argsort(lats2, kind="stable")
+    sorted_lats2 = lats2[order2]
+    for start in range(0, len(lats1), _PAIRS_BLOCK):
+        idx1 = order1[start:start + _PAIRS_BLOCK]
+        lo = np.searchsorted(sorted_lats2, lats1[idx1[0]] - dlat, side="left")
+        hi = np.searchsorted(sorted_lats2, lats1[idx1[-1]] + dlat, side="right")
+        idx2 = order2[lo:hi]
+        # Widest longitude span needed anywhere in the block: at its most polar latitude
+        polar = min(max(abs(lats1[idx1[0]]), abs(lats1[idx1[-1]])) + dlat, 90.0)
+        dlon = radius_m / (_METRES_PER_DEGREE * max(math.cos(math.radians(polar)), 1e-6))
+        west, east = lons1[idx1].min() - dlon, lons1[idx1].max() + dlon
+        if west >= -180 and east <= 180:  # a box across the antimeridian keeps the band
+            idx2 = idx2[(lons2[idx2] >= west) & (lons2[idx2] <= east)]
+        if len(idx2):
+            yield idx1, idx2
+
+
+def _unit_vectors(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Points as ``(n, 3)`` unit vectors.
+
+    Dot products and chord lengths between them are monotonic in great-circle
+    distance, so radius tests need no per-pair trigonometry.
+    """
+    phi, lam = np.radians(lats), np.radians(lons)
+    return np.column_stack((np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)))
+
+
+def _chord(distance_m: float) -> float:
+    """Unit-sphere chord length for a great-circle distance (monotonic, so radii carry over)."""
+    if not math.isfinite(distance_m):
+        return math.inf
+    return 2 * math.sin(min(distance_m / (2 * _EARTH_RADIUS_M), math.pi / 2))
+
+
+def _arc(chord: np.ndarray) -> np.ndarray:
+    """Great-circle distance (in metres) for unit-sphere chord lengths."""
+    return 2 * _EARTH_RADIUS_M * np.arcsin(np.minimum(chord / 2, 1.0))
+
+
+def nearest_distances(
+    lats1: np.ndarray, lons1: np.ndarray, lats2: np.ndarray, lons2: np.ndarray,
+    max_distance_m: float = math.inf,
+) -> np.ndarray:
+    """Distance (in metres) from each point in set 1 to its nearest point in set 2.
+
+    Uses a KD-tree over set 2 when SciPy is installed (O((P + N) log N)),
+    else a parallel Numba kernel, else blocked NumPy dot-product matrices over
+    bounding-box candidates.
+
+    Returns:
+        Array of ``len(lats1)`` distances; ``inf`` where set 2 has no point
+        within ``max_distance_m``.
+    """
+    lats1, lons1, lats2, lons2 = (
+        np.asarray(a, dtype=np.float64) for a in (lats1, lons1, lats2, lons2)
+    )
+    out = np.full(len(lats1), np.inf)
+    if not len(lats2):
+        return out
+
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        pass
+    else:
+        # Nearest by chord is nearest by arc; the bound is nudged so a point
+        # exactly at max_distance_m isn't lost to rounding (trimmed below)
+        chord, _ = cKDTree(_unit_vectors(lats2, lons2)).query(
+            _unit_vectors(lats1, lons1), k=1,
+            distance_upper_bound=_chord(max_distance_m) * (1 + 1e-9), workers=-1,
+        )
+        found = np.isfinite(chord)
+        out[found] = _arc(chord[found])
+        out[out > max_distance_m] = np.inf
+        return out
+
+    try:
+        from nestscout.utils.geo_kernels import nearest_distances as kernel
+    except ImportError:
+        # The nearest point has the largest dot product (one matrix product per
+        # block); only that pair's distance is then computed
+        u1, u2 = _unit_vectors(lats1, lons1), _unit_vectors(lats2, lons2)
+        for idx1, idx2 in _candidates_in_bbox(lats1, lons1, lats2, lons2, max_distance_m):
+            nearest = idx2[np.argmax(u1[idx1] @ u2[idx2].T, axis=1)]
+            out[idx1] = _arc(np.linalg.norm(u1[idx1] - u2[nearest], axis=1))
+    else:
+        out = kernel(lats1, lons1, lats2, lons2)
+
+    out[out > max_distance_m] = np.inf
+    return out
+
+
+def counts_within_radius(
+    lats1: np.ndarray, lons1: np.ndarray, lats2: np.ndarray, lons2: np.ndarray, radius_m: float,
+) -> np.ndarray:
+    """Number of set-2 points at most ``radius_m`` from each point in set 1.
+
+    Uses a KD-tree over set 2 when SciPy is installed, else a parallel Numba
+    kernel, else blocked NumPy dot-product matrices over bounding-box candidates.
+    """
+    lats1, lons1, lats2, lons2 = (
+        np.asarray(a, dtype=np.float64) for a in (lats1, lons1, lats2, lons2)
+    )
+    out = np.zeros(len(lats1), dtype=np.int64)
+    if not len(lats2):
+        return out
+
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        pass
+    else:
+        counts = cKDTree(_unit_vectors(lats2, lons2)).query_ball_point(
+            _unit_vectors(lats1, lons1), r=_chord(radius_m), return_length=True, workers=-1,
+        )
+        return counts.astype(np.int64)
+
+    try:
+        from nestscout.utils.geo_kernels import counts_within_radius as kernel
+    except ImportError:
+        pass
+    else:
+        return kernel(lats1, lons1, lats2, lons2, float(radius_m))
+
+    # Within the radius exactly when the dot product is at least cos(radius / R)
+    threshold = math.cos(min(radius_m / _EARTH_RADIUS_M, math.pi))
+    u1, u2 = _unit_vectors(lats1, lons1), _unit_vectors(lats2, lons2)
+    for idx1, idx2 in _candidates_in_bbox(lats1, lons1, lats2, lons2, radius_m):
+        out[idx1] = (u1[idx1] @ u2[idx2].T >= threshold).sum(axis=1)
+    return out
+
+
+def bounding_box(lat: float, lon: float, radius_m: float) -> tuple[float, float, float, float]:
+    """Return a (min_lat, max_lat, min_lon, max_lon) box enclosing a radius.
+
+    Cheap to evaluate in SQL, so it can prune rows before the exact haversine check.
+    """
+    dlat = radius_m / _METRES_PER_DEGREE
+    dlon = radius_m / (_METRES_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
+
 def estimate_walk_time(distance_m: float, speed_kmh: float = 5.0) -> float:
     """Estimate walking time in minutes given distance in metres.
 
@@ -44,3 +298,16 @@ def estimate_walk_time(distance_m: float, speed_kmh: float = 5.0) -> float:
     """
     speed_mpm = (speed_kmh * 1000) / 60  # metres per minute
     return distance_m / speed_mpm
+
+
+def warm_up_kernels() -> None:
+    """JIT-compile the optional Numba kernels now rather than on the first request.
+
+    A no-op without Numba; with it, compiled code is reused from Numba's
+    on-disk cache after the first run.
+    """
+    try:
+        from nestscout.utils.geo_kernels import warm_up
+    except ImportError:
+        return
+    warm_up()
@@ -0,0 +1,105 @@
+"""Numba-compiled geo kernels — optional, used by nestscout.utils.geo when installed.
+
+Importing this module raises ImportError without Numba; callers fall back to NumPy.
+"""
+
+import math
+
+import numba
+import numpy as np
+
+from nestscout.utils.geo import _EARTH_RADIUS_M
+
+# Fast-math without nnan/ninf: the kernels rely on inf (nearest-distance seeds)
+# and must not let LLVM assume NaN away
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@numba.njit(inline="always", fastmath=_FASTMATH, cache=True)
+def _haversine(phi1, lam1, cos_phi1, phi2, lam2, cos_phi2):
+    a = math.sin((phi2 - phi1) / 2) ** 2 + cos_phi1 * cos_phi2 * math.sin((lam2 - lam1) / 2) ** 2
+    a = min(a, 1.0)  # rounding can push antipodal points just past 1
+    return _EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def pairs_within_radius(lat1, lon1, lat2, lon2, radius_m):
+    """Parallel version of :func:`nestscout.utils.geo.pairs_within_radius`."""
+    phi1, lam1 = np.radians(lat1), np.radians(lon1)
+    phi2, lam2 = np.radians(lat2), np.radians(lon2)
+    cos1, cos2 = np.cos(phi1), np.cos(phi2)
+    n, m = len(lat1), len(lat2)
+
+    # Pass 1 counts matches per row so pass 2 can fill each row's slice independently
+    counts = np.zeros(n, dtype=np.int64)
+    for i in numba.prange(n):
+        for j in range(m):
+            if _haversine(phi1[i], lam1[i], cos1[i], phi2[j], lam2[j], cos2[j]) <= radius_m:
+                counts[i] += 1
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    rows = np.empty(offsets[n], dtype=np.int64)
+    cols = np.empty(offsets[n], dtype=np.int64)
+    dist = np.empty(offsets[n], dtype=np.float64)
+
+    for i in numba.prange(n):
+        k = offsets[i]
+        for j in range(m):
+            d = _haversine(phi1[i], lam1[i], cos1[i], phi2[j], lam2[j], cos2[j])
+            if d <= radius_m:
+                rows[k] = i
+                cols[k] = j
+                dist[k] = d
+                k += 1
+    return rows, cols, dist
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def haversine_distances(lat, lon, lats, lons):
+    """Parallel version of :func:`nestscout.utils.geo.haversine_distances` (1-D targets)."""
+    phi1, lam1 = math.radians(lat), math.radians(lon)
+    cos1 = math.cos(phi1)
+    out = np.empty(len(lats), dtype=np.float64)
+    for i in numba.prange(len(lats)):
+        phi2 = math.radians(lats[i])
+        out[i] = _haversine(phi1, lam1, cos1, phi2, math.radians(lons[i]), math.cos(phi2))
+    return out
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def nearest_distances(lat1, lon1, lat2, lon2):
+    """Parallel version of :func:`nestscout.utils.geo.nearest_distances` (non-empty set 2)."""
+    phi1, lam1 = np.radians(lat1), np.radians(lon1)
+    phi2, lam2 = np.radians(lat2), np.radians(lon2)
+    cos1, cos2 = np.cos(phi1), np.cos(phi2)
+    out = np.empty(len(lat1), dtype=np.float64)
+    for i in numba.prange(len(lat1)):
+        best = np.inf
+        for j in range(len(lat2)):
+            best = min(best, _haversine(phi1[i], lam1[i], cos1[i], phi2[j], lam2[j], cos2[j]))
+        out[i] = best
+    return out
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def counts_within_radius(lat1, lon1, lat2, lon2, radius_m):
+    """Parallel version of :func:`nestscout.utils.geo.counts_within_radius`."""
+    phi1, lam1 = np.radians(lat1), np.radians(lon1)
+    phi2, lam2 = np.radians(lat2), np.radians(lon2)
+    cos1, cos2 = np.cos(phi1), np.cos(phi2)
+    out = np.zeros(len(lat1), dtype=np.int64)
+    for i in numba.prange(len(lat1)):
+        for j in range(len(lat2)):
+            if _haversine(phi1[i], lam1[i], cos1[i], phi2[j], lam2[j], cos2[j]) <= radius_m:
+                out[i] += 1
+    return out
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) every kernel ahead of first use."""
+    points = np.zeros(1, dtype=np.float64)
+    haversine_distances(0.0, 0.0, points, points)
+    pairs_within_radius(points, points, points, points, 1.0)
+    nearest_distances(points, points, points, points)
+    counts_within_radius(points, points, points, points, 1.0)
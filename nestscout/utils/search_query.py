@@ -0,0 +1,97 @@
+"""Rule-based parsing of simple natural-language property searches.
+
+Queries like "3 bed flats for rent in Madrid under 1,200" map straight onto
+``PropertyService.list_properties`` filters without an LLM round-trip. Anything
+the rules can't fully account for is left to the AI agent.
+"""
+
+import re
+from typing import Any
+
+_NUMBER = r"(\d+(?:[.,]\d+)*)\s*(k|m|mil|thousand|million)?\b"
+_AREA_UNIT = r"\s*(?:m2|m²|sqm|sq\.?\s*m|square\s+met(?:er|re)s?)"
+_BEDROOMS = r"\s*(\+)?\s*(?:bed(?:room)?s?|br|hab(?:itacion(?:es)?)?)\b"
+
+_AT_MOST = r"(?:under|below|less\s+than|at\s+most|max(?:imum)?|up\s+to|<=?)"
+_AT_LEAST = r"(?:over|above|more\s+than|at\s+least|min(?:imum)?|from|>=?)"
+
+_PATTERNS: list[tuple[str, re.Pattern]] = [
+    ("area_between", re.compile(rf"between\s+{_NUMBER}\s+and\s+{_NUMBER}{_AREA_UNIT}", re.I)),
+    ("area_max", re.compile(rf"{_AT_MOST}\s+{_NUMBER}{_AREA_UNIT}", re.I)),
+    ("area_min", re.compile(rf"(?:{_AT_LEAST}\s+)?{_NUMBER}{_AREA_UNIT}", re.I)),
+    ("bedrooms_min", re.compile(rf"{_AT_LEAST}\s+(\d+){_BEDROOMS}", re.I)),
+    ("bedrooms_max", re.compile(rf"{_AT_MOST}\s+(\d+){_BEDROOMS}", re.I)),
+    ("bedrooms", re.compile(rf"\b(\d+){_BEDROOMS}", re.I)),
+    ("price_between", re.compile(rf"between\s+[€$£]?\s*{_NUMBER}\s*(?:€|eur|euros?)?\s+and\s+[€$£]?\s*{_NUMBER}", re.I)),
+    ("price_max", re.compile(rf"{_AT_MOST}\s+[€$£]?\s*{_NUMBER}", re.I)),
+    ("price_min", re.compile(rf"{_AT_LEAST}\s+[€$£]?\s*{_NUMBER}", re.I)),
+    ("rent", re.compile(r"\b(?:for\s+rent|to\s+rent|rent(?:al|als|ing)?|to\s+let|alquiler)\b", re.I)),
+    ("sale", re.compile(r"\b(?:for\s+sale|to\s+buy|buy(?:ing)?|sale|venta)\b", re.I)),
+    # Case-sensitive: a capitalised place name after "in"
+    ("city", re.compile(r"\b(?:in|en)\s+([A-ZÀ-Ý][\w'-]*(?:\s+[A-ZÀ-Ý][\w'-]*)*)")),
+]
+
+_MULTIPLIERS = {"k": 1e3, "mil": 1e3, "thousand": 1e3, "m": 1e6, "million": 1e6}
+
+# Words that carry no filter of their own — anything else left over means the
+# query says something the rules didn't capture
+_FILLER = {
+    "a", "an", "the", "and", "with", "for", "me", "i", "want", "need", "looking",
+    "find", "search", "show", "list", "get", "any", "all", "some", "please",
+    "property", "properties", "listing", "listings", "home", "homes", "house",
+    "houses", "flat", "flats", "apartment", "apartments", "piso", "pisos", "eur",
+    "euro", "euros", "price", "priced", "costing", "of", "that", "which", "is", "are",
+}
+
+
+def _amount(number: str, suffix: str | None) -> float:
+    """Parse "250,000", "250.000", "1.2" or "400" (with an optional k/m suffix)."""
+    if re.fullmatch(r"\d{1,3}(?:[.,]\d{3})+", number):
+        value = float(re.sub(r"[.,]", "", number))  # thousands separators
+    else:
+        value = float(number.replace(",", "."))
+    return value * _MULTIPLIERS.get((suffix or "").lower(), 1)
+
+
+def parse_search_query(query: str) -> dict[str, Any] | None:
+    """Extract ``list_properties`` filters from a simple search query.
+
+    Returns None when nothing was recognised, or when words or numbers remain
+    that the rules don't understand (e.g. "quiet", "near a school", a bare
+    "300000") — those queries need the AI agent.
+    """
+    filters: dict[str, Any] = {}
+    rest = query
+
+    for name, pattern in _PATTERNS:
+        match = pattern.search(rest)
+        if match is None:
+            continue
+        g = match.groups()
+        if name == "area_between":
+            filters["min_area"], filters["max_area"] = _amount(*g[0:2]), _amount(*g[2:4])
+        elif name in ("area_max", "area_min"):
+            filters.setdefault(f"{name[-3:]}_area", _amount(*g))
+        elif name == "bedrooms_min":
+            filters["min_bedrooms"] = int(g[0])
+        elif name == "bedrooms_max":
+            filters["max_bedrooms"] = int(g[0])
+        elif name == "bedrooms":
+            filters.setdefault("min_bedrooms", int(g[0]))
+            if not g[1]:  # "3+ beds" has no upper bound
+                filters.setdefault("max_bedrooms", int(g[0]))
+        elif name == "price_between":
+            filters["min_price"], filters["max_price"] = _amount(*g[0:2]), _amount(*g[2:4])
+        elif name in ("price_max", "price_min"):
+            filters.setdefault(f"{name[-3:]}_price", _amount(*g))
+        elif name in ("rent", "sale"):
+            filters.setdefault("operation", name)
+        elif name == "city":
+            filters["city"] = g[0]
+        rest = rest[:match.start()] + " " + rest[match.end():]
+
+    # Numbers count too: one no rule consumed (e.g. a bare price) is a filter we'd drop
+    leftover = {w for w in re.findall(r"\w+", rest.lower()) if w not in _FILLER}
+    if not filters or leftover:
+        return None
+    return filters
@@ -0,0 +1,30 @@
+"""Compact JSON serialisation backed by orjson."""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def to_json(obj: Any) -> str:
+    """Serialise ``obj`` to compact JSON text.
+
+    NumPy scalars/arrays and datetimes are handled natively; anything else
+    orjson cannot encode (e.g. ``Decimal``) falls back to ``str``.
+    """
+    return orjson.dumps(obj, default=str, option=_OPTIONS).decode("utf-8")
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider using orjson for ``jsonify`` and ``request.get_json``.
+
+    Datetimes come out as ISO 8601, so ``to_dict`` methods can hand them over as-is.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return to_json(obj)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
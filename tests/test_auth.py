@@ -0,0 +1,44 @@
+"""Password hashing and login."""
+
+import bcrypt
+import pytest
+
+from nestscout.models.user import User
+from nestscout.services.auth_service import AuthService
+
+
+def test_register_stores_argon2id_hash(db):
+    user = AuthService.register("ana", "ana@example.com", "s3cret-pass")
+
+    assert user.password_hash.startswith("$argon2id$")
+    assert AuthService.login("ana@example.com", "s3cret-pass")["user"]["id"] == user.id
+
+
+def test_login_rehashes_legacy_bcrypt_to_argon2id(db):
+    legacy = bcrypt.hashpw(b"old-pass", bcrypt.gensalt(rounds=4)).decode()
+    user = User(username="bob", email="bob@example.com", password_hash=legacy)
+    db.session.add(user)
+    db.session.commit()
+
+    AuthService.login("bob@example.com", "old-pass")
+
+    db.session.refresh(user)
+    assert user.password_hash.startswith("$argon2id$")
+    # The new hash still accepts the same password
+    assert AuthService.login("bob@example.com", "old-pass")["user"]["username"] == "bob"
+
+
+def test_failed_bcrypt_login_keeps_the_legacy_hash(db):
+    legacy = bcrypt.hashpw(b"old-pass", bcrypt.gensalt(rounds=4)).decode()
+    db.session.add(User(username="cy", email="cy@example.com", password_hash=legacy))
+    db.session.commit()
+
+    with pytest.raises(ValueError, match="Invalid email or password"):
+        AuthService.login("cy@example.com", "wrong")
+
+    assert db.session.query(User.password_hash).filter_by(username="cy").scalar() == legacy
+
+
+def test_unknown_email_is_rejected_like_a_wrong_password(db):
+    with pytest.raises(ValueError, match="Invalid email or password"):
+        AuthService.login("nobody@example.com", "whatever")
@@ -0,0 +1,59 @@
+"""Streaming CSV import parser."""
+
+import pytest
+
+from nestscout.utils import csv_parser
+from nestscout.utils.csv_parser import parse_pois, parse_properties
+
+_PROPERTIES_CSV = (
+    "Listing_Title,Precio,Beds,SQM,Ciudad,Lat,Lng,Notes\n"
+    "Ático en Chamberí,450000,3.0,95.5,Madrid,40.43,-3.70,x\n"
+    " Piso reformado ,abc,,80,Madrid,,,\n"
+    ",,,,,,,\n"
+)
+
+
+def _write(tmp_path, text: str, encoding: str = "utf-8"):
+    path = tmp_path / "listings.csv"
+    path.write_bytes(text.encode(encoding))
+    return path
+
+
+def test_parse_properties_maps_aliases_and_coerces_types(tmp_path):
+    records = list(parse_properties(_write(tmp_path, _PROPERTIES_CSV)))
+
+    assert records == [
+        {"title": "Ático en Chamberí", "price": 450000.0, "bedrooms": 3, "area_m2": 95.5,
+         "city": "Madrid", "latitude": 40.43, "longitude": -3.7},
+        # Unparseable and empty cells are dropped; the row without a title is skipped
+        {"title": "Piso reformado", "area_m2": 80.0, "city": "Madrid"},
+    ]
+
+
+def test_parse_properties_falls_back_to_latin1(tmp_path):
+    path = _write(tmp_path, _PROPERTIES_CSV, encoding="latin-1")
+
+    assert [r["title"] for r in parse_properties(path)] == ["Ático en Chamberí", "Piso reformado"]
+
+
+def test_parse_properties_arrow_path_matches_csv_reader(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    path = _write(tmp_path, _PROPERTIES_CSV)
+    expected = list(parse_properties(path))
+
+    monkeypatch.setattr(csv_parser, "_ARROW_MIN_BYTES", 0)
+
+    assert list(parse_properties(path)) == expected
+
+
+def test_parse_pois_prefers_the_first_listed_alias(tmp_path):
+    path = _write(tmp_path, "type,Category,name\nshop,school,Colegio Sol\n")
+
+    assert list(parse_pois(path)) == [{"category": "school", "name": "Colegio Sol"}]
+
+
+def test_unmappable_columns_raise_on_first_iteration(tmp_path):
+    records = parse_properties(_write(tmp_path, "foo,bar\n1,2\n"))
+
+    with pytest.raises(ValueError, match="Could not map any columns"):
+        next(records)
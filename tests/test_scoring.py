@@ -0,0 +1,197 @@
+"""Vectorised scoring checked against a scalar, one-property-at-a-time baseline."""
+
+import math
+import random
+
+import pytest
+from flask_jwt_extended import create_access_token
+
+from nestscout.models.poi import POI, POICategory
+from nestscout.models.property import Property
+from nestscout.models.scoring import PropertyScore, ScoringRule
+from nestscout.models.search_profile import SearchProfile
+from nestscout.models.user import User
+from nestscout.services import scoring_service
+from nestscout.services.scoring_service import ScoringService
+from nestscout.utils.geo import haversine_distance
+
+
+def _located(item) -> bool:
+    return bool(item.latitude) and bool(item.longitude)
+
+
+def _nearest(prop, pois) -> float:
+    return min(
+        (haversine_distance(prop.latitude, prop.longitude, p.latitude, p.longitude) for p in pois),
+        default=math.inf,
+    )
+
+
+def _scalar_raw(rule, prop, pois_by_category) -> float:
+    """DesignDoc §7 evaluate(S, P) for a single property."""
+    params = rule.parameters or {}
+    max_dist = rule.max_distance_m or 1000.0
+    if rule.rule_type == "poi_proximity":
+        if not _located(prop):
+            return 0.0
+        nearest = _nearest(prop, pois_by_category.get(rule.poi_category_id, []))
+        return max(0.0, 1 - nearest / max_dist)
+    if rule.rule_type == "poi_density":
+        if not _located(prop):
+            return 0.0
+        count = sum(
+            haversine_distance(prop.latitude, prop.longitude, p.latitude, p.longitude) <= max_dist
+            for p in pois_by_category.get(rule.poi_category_id, [])
+        )
+        return min(count / params.get("target_count", 5), 1.0)
+    if rule.rule_type == "property_attr":
+        actual = getattr(prop, params["attribute"])
+        if actual is None:
+            return 0.0
+        tolerance = params.get("tolerance", 0)
+        if tolerance == 0:
+            return float(actual == params["ideal"])
+        return max(0.0, 1 - abs(actual - params["ideal"]) / tolerance)
+    if rule.rule_type == "walkability":
+        if not _located(prop):
+            return 0.0
+        categories = params["categories"]
+        return sum(
+            max(0.0, 1 - _nearest(prop, pois_by_category.get(c, [])) / max_dist)
+            for c in categories
+        ) / len(categories)
+    return 0.0
+
+
+def _scalar_scores(profile, properties, pois) -> dict[int, float]:
+    pois_by_category: dict[int, list] = {}
+    for poi in pois:
+        if _located(poi):
+            pois_by_category.setdefault(poi.category_id, []).append(poi)
+
+    rules = [rule for rule in profile.scoring_rules if rule.weight]
+    weight_sum = sum(rule.weight for rule in rules)
+    scores = {}
+    for prop in properties:
+        total = sum(_scalar_raw(rule, prop, pois_by_category) * rule.weight for rule in rules)
+        scores[prop.id] = round(total / weight_sum * 100, 2)
+    return scores
+
+
+@pytest.fixture
+def scored_profile(db):
+    """A profile with one rule of every type over random properties and POIs near Madrid."""
+    rng = random.Random(7)
+    user = User(username="scorer", email="scorer@example.com", password_hash="x")
+    schools, parks, empty = (POICategory(name=n) for n in ("school", "park", "museum"))
+    db.session.add_all([user, schools, parks, empty])
+    db.session.flush()
+
+    def point():
+        return 40.40 + rng.random() * 0.03, -3.70 + rng.random() * 0.03
+
+    pois = [
+        POI(name=f"poi{i}", category_id=(schools, parks)[i % 2].id, latitude=lat, longitude=lon)
+        for i, (lat, lon) in enumerate(point() for _ in range(16))
+    ]
+    properties = [
+        Property(title=f"p{i}", latitude=lat, longitude=lon, bedrooms=rng.randint(1, 5))
+        for i, (lat, lon) in enumerate(point() for _ in range(60))
+    ]
+    properties += [
+        Property(title="unlocated", bedrooms=3),
+        Property(title="no bedrooms", latitude=40.41, longitude=-3.69),
+    ]
+    db.session.add_all(pois + properties)
+
+    profile = SearchProfile(name="family", user_id=user.id)
+    db.session.add(profile)
+    db.session.flush()
+    db.session.add_all([
+        ScoringRule(profile_id=profile.id, rule_type="poi_proximity",
+                    poi_category_id=schools.id, max_distance_m=800, weight=3.0),
+        ScoringRule(profile_id=profile.id, rule_type="poi_density", poi_category_id=parks.id,
+                    max_distance_m=1200, weight=1.5, parameters={"target_count": 3}),
+        ScoringRule(profile_id=profile.id, rule_type="property_attr", weight=2.0,
+                    parameters={"attribute": "bedrooms", "ideal": 3, "tolerance": 2}),
+        ScoringRule(profile_id=profile.id, rule_type="walkability", max_distance_m=1500,
+                    weight=1.0, parameters={"categories": [schools.id, parks.id, empty.id]}),
+        ScoringRule(profile_id=profile.id, rule_type="property_attr", weight=0.0,
+                    parameters={"attribute": "bedrooms", "ideal": 1}),
+    ])
+    db.session.commit()
+    return profile, properties, pois
+
+
+def test_compute_scores_matches_scalar_baseline(db, scored_profile):
+    profile, properties, pois = scored_profile
+    expected = _scalar_scores(profile, properties, pois)
+
+    assert ScoringService.compute_scores(profile.id) == len(properties)
+
+    stored = {
+        score.property_id: score for score in
+        db.session.query(PropertyScore).filter_by(profile_id=profile.id)
+    }
+    assert stored.keys() == expected.keys()
+    for prop_id, score in expected.items():
+        assert stored[prop_id].total_score == pytest.approx(score, abs=0.011)
+    # Zero-weight rules are neither evaluated nor reported
+    assert all(len(score.breakdown) == 4 for score in stored.values())
+
+
+def test_compute_scores_in_chunks_matches_single_pass(db, scored_profile, monkeypatch):
+    profile, properties, _ = scored_profile
+    ScoringService.compute_scores(profile.id)
+    single = dict(db.session.query(PropertyScore.property_id, PropertyScore.total_score))
+
+    monkeypatch.setattr(scoring_service, "_SCORING_CHUNK_SIZE", 7)
+    ScoringService.compute_scores(profile.id, include_breakdown=False)
+    chunked = dict(db.session.query(PropertyScore.property_id, PropertyScore.total_score))
+
+    assert chunked == single
+    assert all(score.breakdown is None for score in db.session.query(PropertyScore))
+
+
+@pytest.mark.parametrize("k", [1, 5, 20, 100])
+@pytest.mark.parametrize("chunk_size", [7, 20_000])
+def test_compute_top_k_matches_scalar_ranking(db, scored_profile, monkeypatch, k, chunk_size):
+    profile, properties, pois = scored_profile
+    monkeypatch.setattr(scoring_service, "_SCORING_CHUNK_SIZE", chunk_size)
+    expected = sorted(
+        _scalar_scores(profile, properties, pois).items(), key=lambda item: (-item[1], item[0]),
+    )[:k]
+
+    top = ScoringService.compute_top_k(profile.id, k)
+
+    assert [p["id"] for p in top] == [prop_id for prop_id, _ in expected]
+    for p, (_, score) in zip(top, expected):
+        assert p["score"]["total_score"] == pytest.approx(score, abs=0.011)
+    assert db.session.query(PropertyScore).count() == 0  # nothing stored
+
+
+def test_compute_top_k_matches_stored_ranking(db, scored_profile):
+    profile, _, _ = scored_profile
+    ScoringService.compute_scores(profile.id)
+    ranked = ScoringService.get_ranked_properties(profile.id, limit=10)
+
+    top = ScoringService.compute_top_k(profile.id, 10)
+
+    assert [(p["id"], p["score"]["total_score"]) for p in top] == [
+        (p["id"], p["score"]["total_score"]) for p in ranked
+    ]
+
+
+def test_scores_endpoint_pages_the_ranking(app, client, db, scored_profile):
+    profile, properties, _ = scored_profile
+    ScoringService.compute_scores(profile.id)
+    ranked = [p["id"] for p in ScoringService.get_ranked_properties(profile.id)]
+    headers = {"Authorization": f"Bearer {create_access_token(identity=str(profile.user_id))}"}
+
+    first = client.get(f"/api/scores/{profile.id}?per_page=25", headers=headers).get_json()
+    last = client.get(f"/api/scores/{profile.id}?page=3&per_page=25", headers=headers).get_json()
+
+    assert [p["id"] for p in first["items"]] == ranked[:25]
+    assert first["has_next"] is True
+    assert [p["id"] for p in last["items"]] == ranked[50:]
+    assert last["has_next"] is False and len(ranked) == len(properties)
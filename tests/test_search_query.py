@@ -0,0 +1,38 @@
+"""Rule-based natural-language search parsing."""
+
+import pytest
+
+from nestscout.utils.search_query import parse_search_query
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("3 bed flats for rent in Madrid under 1,200",
+     {"min_bedrooms": 3, "max_bedrooms": 3, "max_price": 1200.0, "operation": "rent",
+      "city": "Madrid"}),
+    ("2+ beds for sale in Valencia between 100k and 250k",
+     {"min_bedrooms": 2, "min_price": 100_000.0, "max_price": 250_000.0, "operation": "sale",
+      "city": "Valencia"}),
+    ("apartments over 80 m2 in Sevilla", {"min_area": 80.0, "city": "Sevilla"}),
+    ("houses between 60 and 90 sqm", {"min_area": 60.0, "max_area": 90.0}),
+    ("at least 2 bedrooms under €250.000",
+     {"min_bedrooms": 2, "max_price": 250_000.0}),
+    ("pisos alquiler en San Sebastian", {"operation": "rent", "city": "San Sebastian"}),
+    ("show me flats to buy under 1.2m", {"operation": "sale", "max_price": 1_200_000.0}),
+])
+def test_recognised_queries_map_to_filters(query, expected):
+    assert parse_search_query(query) == expected
+
+
+@pytest.mark.parametrize("query", [
+    # Numbers no rule consumed would otherwise be dropped silently
+    "1 bed flat in Madrid for 800",
+    "flats in Madrid 300000",
+    # Words the rules don't understand
+    "quiet flat near a school in Madrid",
+    "3 bed flat with a terrace",
+    # Nothing recognised at all
+    "hola",
+    "",
+])
+def test_unparsed_queries_fall_through_to_the_agent(query):
+    assert parse_search_query(query) is None